@@ -1,10 +1,13 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from loguru import logger
 
+from .infrastructure.file_cache import mtime_cached
+
 
 def _project_root() -> Path:
     # app/config_loader.py -> project_root
@@ -37,6 +40,8 @@ def load_digest_schedule() -> DigestSchedule:
     """
     Load daily digest schedule from config/digest_schedule.json.
 
+    解析结果按文件修改时间缓存，每次返回副本。
+
     支持两种配置方式：
     1）老版：
     {
@@ -51,6 +56,11 @@ def load_digest_schedule() -> DigestSchedule:
       "count": 5
     }
     """
+    return replace(_load_digest_schedule_file())
+
+
+@mtime_cached(lambda: _digest_schedule_path())
+def _load_digest_schedule_file() -> DigestSchedule:
     path = _digest_schedule_path()
     default = DigestSchedule()
 
@@ -122,17 +132,26 @@ def load_crawler_keywords() -> List[str]:
         return []
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, list):
-            raise ValueError("crawler keywords file must be a JSON array")
-
+        data = load_raw_crawler_keywords()
         return [str(item).strip() for item in data if str(item).strip()]
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to load crawler keywords: {exc}.")
         return []
 
 
+@mtime_cached(lambda: _crawler_keywords_path())
+def load_raw_crawler_keywords() -> tuple:
+    """
+    读取 config/crawler_keywords.json 中的原始关键词数组（不做清洗）。
+
+    解析结果按文件修改时间缓存，返回不可变的元组；文件不存在、解析失败或不是数组时抛出异常（不缓存）。
+    """
+    data = orjson.loads(_crawler_keywords_path().read_bytes())
+    if not isinstance(data, list):
+        raise ValueError("crawler keywords file must be a JSON array")
+    return tuple(data)
+
+
 def save_crawler_keywords(keywords: List[str]) -> bool:
     path = _crawler_keywords_path()
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -141,6 +160,7 @@ def save_crawler_keywords(keywords: List[str]) -> bool:
     try:
         with path.open("w", encoding="utf-8") as f:
             json.dump(clean_keywords, f, ensure_ascii=False, indent=2)
+        load_raw_crawler_keywords.cache_clear()
         logger.info(f"Saved {len(clean_keywords)} crawler keywords.")
         return True
     except Exception as exc:  # noqa: BLE001
@@ -230,6 +250,7 @@ def save_digest_schedule(schedule: Dict[str, Any]) -> bool:
     try:
         with path.open("w", encoding="utf-8") as f:
             json.dump(sanitized, f, ensure_ascii=False, indent=2)
+        _load_digest_schedule_file.cache_clear()
         logger.info("Digest schedule saved.")
         return True
     except Exception as exc:  # noqa: BLE001
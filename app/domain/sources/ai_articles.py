@@ -1,12 +1,14 @@
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from random import sample
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
+import orjson
 from loguru import logger
 
+from ...infrastructure.file_cache import mtime_cached
+
 # 导入URL规范化函数
 from .article_crawler import normalize_weixin_url
 
@@ -49,8 +51,7 @@ def load_ai_articles_pool() -> List[AiArticle]:
         return []
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            raw_items = json.load(f)
+        raw_items = orjson.loads(path.read_bytes())
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to load AI articles config: {exc}")
         return []
@@ -60,8 +61,7 @@ def load_ai_articles_pool() -> List[AiArticle]:
         logger.warning(f"Config file contains {type(raw_items).__name__}, expected list. Resetting to empty list.")
         # 修复配置文件
         try:
-            with path.open("w", encoding="utf-8") as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
+            path.write_bytes(orjson.dumps([], option=orjson.OPT_INDENT_2))
         except Exception:  # noqa: BLE001
             pass
         return []
@@ -95,35 +95,13 @@ def todays_theme(now: Optional[datetime] = None) -> str:
     return "AI 编程效率精选"
 
 
-def save_article_to_config(article: dict) -> bool:
+def _append_article(existing_articles: List[dict], article: dict) -> Optional[dict]:
     """
-    将文章保存到配置文件
+    将文章追加到列表末尾，URL 已存在时不追加
     
-    Args:
-        article: 包含 title, url, source, summary 的字典
-        
     Returns:
-        bool: 是否保存成功
+        Optional[dict]: 追加的文章，已存在时返回 None
     """
-    path = _articles_path()
-    
-    # 确保目录存在
-    path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # 加载现有文章
-    existing_articles = []
-    if path.exists():
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                existing_articles = json.load(f)
-            # 确保是列表格式
-            if not isinstance(existing_articles, list):
-                logger.warning(f"Config file contains {type(existing_articles).__name__}, expected list. Resetting to empty list.")
-                existing_articles = []
-        except Exception as exc:  # noqa: BLE001
-            logger.error(f"Failed to load existing articles: {exc}")
-            existing_articles = []
-    
     # 检查是否已存在相同URL的文章
     article_url = article.get("url", "").strip()
     
@@ -142,7 +120,7 @@ def save_article_to_config(article: dict) -> bool:
                 existing_url = normalize_weixin_url(existing_url)
             if existing_url == article_url:
                 logger.warning(f"文章已存在，URL: {article_url}")
-                return False
+                return None
     
     # 添加新文章
     new_article = {
@@ -157,11 +135,60 @@ def save_article_to_config(article: dict) -> bool:
         new_article["tool_tags"] = article["tool_tags"]
     
     existing_articles.append(new_article)
+    return new_article
+
+
+def _remove_article(existing_articles: List[dict], url_to_delete: str) -> bool:
+    """从列表中原地删除指定URL的文章，返回是否有文章被删除"""
+    original_count = len(existing_articles)
+    existing_articles[:] = [
+        item for item in existing_articles
+        if item.get("url", "").strip() != url_to_delete
+    ]
+    
+    if len(existing_articles) == original_count:
+        logger.warning(f"未找到要删除的文章，URL: {url_to_delete}")
+        return False
+    return True
+
+
+def save_article_to_config(article: dict) -> bool:
+    """
+    将文章保存到配置文件
+    
+    Args:
+        article: 包含 title, url, source, summary 的字典
+        
+    Returns:
+        bool: 是否保存成功
+    """
+    path = _articles_path()
+    
+    # 确保目录存在
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # 加载现有文章
+    existing_articles = []
+    if path.exists():
+        try:
+            existing_articles = orjson.loads(path.read_bytes())
+            # 确保是列表格式
+            if not isinstance(existing_articles, list):
+                logger.warning(f"Config file contains {type(existing_articles).__name__}, expected list. Resetting to empty list.")
+                existing_articles = []
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Failed to load existing articles: {exc}")
+            existing_articles = []
+    
+    new_article = _append_article(existing_articles, article)
+    if new_article is None:
+        return False
     
     # 保存到文件
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(existing_articles, f, ensure_ascii=False, indent=2)
+        path.write_bytes(orjson.dumps(existing_articles, option=orjson.OPT_INDENT_2))
+        _load_all_articles_file.cache_clear()
+        _existing_article_urls.cache_clear()
         logger.info(f"成功保存文章到配置: {new_article['title'][:50]}...")
         return True
     except Exception as exc:  # noqa: BLE001
@@ -187,8 +214,7 @@ def delete_article_from_config(url: str) -> bool:
     
     # 加载现有文章
     try:
-        with path.open("r", encoding="utf-8") as f:
-            existing_articles = json.load(f)
+        existing_articles = orjson.loads(path.read_bytes())
         # 确保是列表格式
         if not isinstance(existing_articles, list):
             logger.warning(f"Config file contains {type(existing_articles).__name__}, expected list. Resetting to empty list.")
@@ -199,20 +225,14 @@ def delete_article_from_config(url: str) -> bool:
     
     # 查找并删除
     url_to_delete = url.strip()
-    original_count = len(existing_articles)
-    existing_articles = [
-        item for item in existing_articles
-        if item.get("url", "").strip() != url_to_delete
-    ]
-    
-    if len(existing_articles) == original_count:
-        logger.warning(f"未找到要删除的文章，URL: {url_to_delete}")
+    if not _remove_article(existing_articles, url_to_delete):
         return False
     
     # 保存到文件
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(existing_articles, f, ensure_ascii=False, indent=2)
+        path.write_bytes(orjson.dumps(existing_articles, option=orjson.OPT_INDENT_2))
+        _load_all_articles_file.cache_clear()
+        _existing_article_urls.cache_clear()
         logger.info(f"成功删除文章，URL: {url_to_delete}")
         return True
     except Exception as exc:  # noqa: BLE001
@@ -220,27 +240,117 @@ def delete_article_from_config(url: str) -> bool:
         return False
 
 
+def apply_article_changes(changes: List[Tuple[str, Any]]) -> List[bool]:
+    """
+    按顺序批量增删文章，整批只读写一次配置文件
+    
+    Args:
+        changes: 操作列表，("add", 文章字典) 或 ("delete", URL)
+        
+    Returns:
+        List[bool]: 每个操作是否成功，与 changes 一一对应
+    """
+    path = _articles_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # 加载现有文章；文件损坏时整批失败，不覆盖原文件
+    existing_articles = []
+    original_bytes = None
+    if path.exists():
+        try:
+            original_bytes = path.read_bytes()
+            existing_articles = orjson.loads(original_bytes)
+            if not isinstance(existing_articles, list):
+                logger.warning(f"Config file contains {type(existing_articles).__name__}, expected list. Resetting to empty list.")
+                existing_articles = []
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Failed to load existing articles: {exc}")
+            return [False] * len(changes)
+    
+    results = []
+    for action, value in changes:
+        if action == "add":
+            results.append(_append_article(existing_articles, value) is not None)
+        elif action == "delete":
+            results.append(_remove_article(existing_articles, value.strip()))
+        else:
+            logger.error(f"Unknown article change: {action!r}")
+            results.append(False)
+    
+    if not any(results):
+        return results
+    
+    # 整批增删后内容与原文件相同（如同一URL先加后删）时不再写文件
+    new_bytes = orjson.dumps(existing_articles, option=orjson.OPT_INDENT_2)
+    if new_bytes == original_bytes:
+        logger.debug("文章池内容未变化，跳过写入")
+        return results
+    
+    # 保存到文件
+    try:
+        path.write_bytes(new_bytes)
+        _load_all_articles_file.cache_clear()
+        _existing_article_urls.cache_clear()
+        logger.info(f"批量更新文章池: {sum(results)}/{len(changes)} 个操作成功")
+        return results
+    except Exception as exc:  # noqa: BLE001
+        logger.error(f"Failed to apply article changes: {exc}")
+        return [False] * len(changes)
+
+
 def get_all_articles() -> List[dict]:
     """
     获取配置文件中所有文章
     
+    解析结果按文件修改时间缓存，每次返回逐条复制的列表，调用方修改不会影响缓存。
+    
     Returns:
         List[dict]: 所有文章的列表
     """
+    return [dict(a) if isinstance(a, dict) else a for a in _load_all_articles_file()]
+
+
+def article_url_exists(url: str) -> bool:
+    """
+    判断文章池中是否已有该URL的文章（微信链接按规范化后的URL比较）。
+
+    URL 集合按文件修改时间缓存，供添加文章前跳过对已存在文章的爬取。
+    """
+    url = url.strip()
+    if "mp.weixin.qq.com" in url:
+        url = normalize_weixin_url(url)
+    return url in _existing_article_urls()
+
+
+@mtime_cached(lambda: _articles_path())
+def _existing_article_urls() -> frozenset:
+    urls = set()
+    add_url = urls.add
+    for item in _load_all_articles_file():
+        if not isinstance(item, dict):
+            continue
+        url = item.get("url", "").strip()
+        if "mp.weixin.qq.com" in url:
+            url = normalize_weixin_url(url)
+        if url:
+            add_url(url)
+    return frozenset(urls)
+
+
+@mtime_cached(lambda: _articles_path())
+def _load_all_articles_file() -> List[dict]:
     path = _articles_path()
     
     if not path.exists():
         return []
     
     try:
-        with path.open("r", encoding="utf-8") as f:
-            articles = json.load(f)
+        articles = orjson.loads(path.read_bytes())
         if not isinstance(articles, list):
             logger.warning(f"Config file contains {type(articles).__name__}, expected list. Resetting to empty list.")
             # 修复配置文件
             try:
-                with path.open("w", encoding="utf-8") as f:
-                    json.dump([], f, ensure_ascii=False, indent=2)
+                path.write_bytes(orjson.dumps([], option=orjson.OPT_INDENT_2))
             except Exception:  # noqa: BLE001
                 pass
             return []
@@ -257,8 +367,9 @@ def overwrite_articles(articles: List[dict]) -> bool:
     path = _articles_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        path.write_bytes(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
+        _load_all_articles_file.cache_clear()
+        _existing_article_urls.cache_clear()
         logger.info(f"Overwrote article pool with {len(articles)} articles.")
         return True
     except Exception as exc:  # noqa: BLE001
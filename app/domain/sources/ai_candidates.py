@@ -1,12 +1,14 @@
 """
 管理待审核的文章候选池（`data/articles/ai_candidates.json`）
 """
-import json
+import os
 import random
-from dataclasses import dataclass, asdict
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import orjson
 from loguru import logger
 
 # 导入URL规范化函数
@@ -15,7 +17,11 @@ from .article_crawler import normalize_weixin_url
 
 @dataclass
 class CandidateArticle:
-    """待审核文章的数据结构"""
+    """
+    待审核文章的数据结构
+
+    字段须保持为标量（str 等）：序列化时直接浅拷贝 __dict__，不走 asdict 的递归复制。
+    """
     title: str
     url: str
     source: str
@@ -29,26 +35,54 @@ def _candidate_data_path() -> Path:
     return Path(__file__).resolve().parents[2] / "data" / "articles" / "ai_candidates.json"
 
 
-def load_candidate_pool() -> List[CandidateArticle]:
-    """加载所有待审核的文章"""
+def load_candidate_items() -> List[dict]:
+    """
+    加载候选池的原始字典列表，不构造 CandidateArticle。
+
+    只需按URL查找的接口可以先在字典上定位，确认存在后再用 candidates_from_items 构造完整候选池。
+    """
     path = _candidate_data_path()
     if not path.exists():
         return []
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            raw_items = json.load(f)
-        
-        if not isinstance(raw_items, list):
-            logger.warning(f"Candidate config is not a list, found {type(raw_items)}. Resetting.")
-            return []
+        raw_items = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to load or parse candidate articles: {e}")
+        return []
+
+    if not isinstance(raw_items, list):
+        logger.warning(f"Candidate config is not a list, found {type(raw_items)}. Resetting.")
+        return []
+    return raw_items
 
+
+def candidates_from_items(raw_items: List[dict]) -> List[CandidateArticle]:
+    """将 load_candidate_items 返回的字典列表转换为候选文章；字段不匹配时返回空列表"""
+    try:
         return [CandidateArticle(**item) for item in raw_items]
-    except (json.JSONDecodeError, TypeError) as e:
+    except TypeError as e:
         logger.error(f"Failed to load or parse candidate articles: {e}")
         return []
 
 
+def load_candidate_pool() -> List[CandidateArticle]:
+    """加载所有待审核的文章"""
+    return candidates_from_items(load_candidate_items())
+
+
+def candidate_pool_has_items() -> bool:
+    """
+    只按文件大小判断候选池是否可能有文章，不读取解析文件。
+
+    空候选池保存为 "[]"；判断为非空而实际为空时，调用方最多多写一次空列表。
+    """
+    try:
+        return _candidate_data_path().stat().st_size > len(b"[]")
+    except FileNotFoundError:
+        return False
+
+
 def save_candidate_pool(candidates: List[CandidateArticle]) -> bool:
     """将候选文章列表完整写入配置文件（覆盖）"""
     path = _candidate_data_path()
@@ -76,11 +110,18 @@ def save_candidate_pool(candidates: List[CandidateArticle]) -> bool:
             normalized_candidates.append(candidate)
         
         # 转换为字典列表
-        candidates_dict = [asdict(c) for c in normalized_candidates]
+        candidates_dict = [c.__dict__.copy() for c in normalized_candidates]
         logger.debug(f"转换后的候选文章数据: {candidates_dict[:2] if len(candidates_dict) > 0 else '[]'}")  # 只记录前2条
         
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(candidates_dict, f, ensure_ascii=False, indent=2)
+        # 先写临时文件再原子替换，写入中途失败不会留下半截的候选池
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(candidates_dict, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
         
         # 验证文件是否成功写入
         if path.exists():
@@ -95,23 +136,28 @@ def save_candidate_pool(candidates: List[CandidateArticle]) -> bool:
         return False
 
 
-def add_candidates_to_pool(new_candidates: List[CandidateArticle], existing_urls: set) -> int:
+def merge_candidates(
+    current_candidates: List[CandidateArticle],
+    new_candidates: List[CandidateArticle],
+    existing_urls: set,
+) -> Tuple[int, List[CandidateArticle]]:
     """
-    将一批新抓取的文章添加到候选池，同时进行去重。
+    将一批新抓取的文章去重后追加到给定的候选列表，不读写文件。
+
+    调用方拿到合并后的列表后自行调用一次 save_candidate_pool，
+    便于和清空候选池等操作合并成一次写入。
 
     Args:
+        current_candidates: 当前候选池内容（会被原地追加）。
         new_candidates: 新抓取的候选文章列表。
-        existing_urls: 已存在于正式文章池和候选池中的所有 URL，用于去重。
+        existing_urls: 已存在于正式文章池和候选池中的所有 URL，用于去重（会被原地更新）。
 
     Returns:
-        成功添加的新文章数量。
+        (成功添加的新文章数量, 合并后的候选列表)
     """
-    if not new_candidates:
-        return 0
-
-    current_candidates = load_candidate_pool()
-    
     added_count = 0
+    append_candidate = current_candidates.append
+    add_url = existing_urls.add
     for candidate in new_candidates:
         # 规范化URL用于去重比较
         normalized_url = candidate.url
@@ -129,10 +175,29 @@ def add_candidates_to_pool(new_candidates: List[CandidateArticle], existing_urls
         
         # 使用规范化后的URL进行去重检查
         if normalized_url not in existing_urls:
-            current_candidates.append(candidate)
-            existing_urls.add(normalized_url)  # 使用规范化后的URL避免重复添加
+            append_candidate(candidate)
+            add_url(normalized_url)  # 使用规范化后的URL避免重复添加
             added_count += 1
     
+    return added_count, current_candidates
+
+
+def add_candidates_to_pool(new_candidates: List[CandidateArticle], existing_urls: set) -> int:
+    """
+    将一批新抓取的文章添加到候选池，同时进行去重。
+
+    Args:
+        new_candidates: 新抓取的候选文章列表。
+        existing_urls: 已存在于正式文章池和候选池中的所有 URL，用于去重。
+
+    Returns:
+        成功添加的新文章数量。
+    """
+    if not new_candidates:
+        return 0
+
+    added_count, current_candidates = merge_candidates(load_candidate_pool(), new_candidates, existing_urls)
+    
     if added_count > 0:
         save_candidate_pool(current_candidates)
         logger.info(f"Added {added_count} new candidates to the pool.")
@@ -183,7 +248,7 @@ def promote_candidates_to_articles(per_keyword: int = 2) -> int:
         logger.info("No candidates selected for promotion.")
         return 0
 
-    overwrite_articles([asdict(item) for item in selected])
+    overwrite_articles([item.__dict__.copy() for item in selected])
     save_candidate_pool(remaining)
     logger.info(
         f"Promoted {len(selected)} articles from candidates "
@@ -2,7 +2,8 @@
 
 from .logging import setup_logging
 from .file_lock import FileLock
+from .file_cache import mtime_cached
 from .scheduler import SchedulerManager
 
-__all__ = ["setup_logging", "FileLock", "SchedulerManager"]
+__all__ = ["setup_logging", "FileLock", "mtime_cached", "SchedulerManager"]
 
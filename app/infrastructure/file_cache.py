@@ -0,0 +1,55 @@
+"""文件缓存模块，按文件修改时间缓存配置文件的解析结果"""
+
+import functools
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+
+def mtime_cached(path_func: Callable[[], Path], ttl: float = 30.0):
+    """
+    缓存无参数加载函数的返回值，避免每次调用都重新读取并解析文件
+
+    - 文件的修改时间或大小变化时立即重新加载
+    - 超过 ttl 秒也会重新加载，兜底同一时间戳内被其他进程改写的情况
+    - 文件不存在时不缓存
+    - 被装饰的函数提供 cache_clear()，写入文件后可主动失效
+
+    Args:
+        path_func: 返回被读取文件路径的函数，每次调用时求值
+        ttl: 缓存有效期（秒）
+    """
+    def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        lock = threading.Lock()
+        # ((路径, 修改时间, 大小), 写入时间, 结果)
+        entry: Optional[Tuple[Tuple[str, int, int], float, Any]] = None
+
+        @functools.wraps(func)
+        def wrapper() -> Any:
+            nonlocal entry
+            path = path_func()
+            try:
+                stat = path.stat()
+            except OSError:
+                return func()
+            signature = (str(path), stat.st_mtime_ns, stat.st_size)
+
+            with lock:
+                if entry is not None and entry[0] == signature and time.monotonic() - entry[1] < ttl:
+                    return entry[2]
+
+            value = func()
+            with lock:
+                entry = (signature, time.monotonic(), value)
+            return value
+
+        def cache_clear() -> None:
+            nonlocal entry
+            with lock:
+                entry = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
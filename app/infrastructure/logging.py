@@ -1,5 +1,6 @@
 """日志配置模块"""
 
+import sys
 from pathlib import Path
 from loguru import logger
 
@@ -13,6 +14,10 @@ def setup_logging():
     logs_dir = project_root / "logs"
     logs_dir.mkdir(exist_ok=True)
     
+    # 替换 loguru 默认的同步 stderr 输出，改为经队列由后台线程写出，避免在事件循环中阻塞
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG", backtrace=False, diagnose=False, enqueue=True)
+    
     # 配置主日志文件（所有日志）
     # 按日期轮转，保留30天，压缩旧日志
     logger.add(
@@ -29,7 +29,7 @@ except Exception as e:  # noqa: BLE001
     print(f"Warning: Failed to load .env file: {e}. Continuing with environment variables...")
 
 from apscheduler.triggers.cron import CronTrigger
-from fastapi import FastAPI
+from fastapi import FastAPI, Header
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
@@ -37,7 +37,7 @@ from loguru import logger
 from .config_loader import load_digest_schedule
 from .infrastructure import setup_logging, SchedulerManager
 from .infrastructure.db import init_db
-from .presentation import get_index_html
+from .presentation import BodySizeLimitMiddleware, NegotiatedGZipMiddleware, get_index_response
 from .services import DigestService, BackupService
 
 # 全局调度器管理器
@@ -175,6 +175,13 @@ async def lifespan(app: FastAPI):
     if scheduler_manager is not None:
         scheduler_manager.shutdown(wait=True)
         scheduler_manager = None
+    
+    # 关闭 AI 助手共享的 HTTP 客户端
+    from .presentation.routes import ai_assistant
+    await ai_assistant.close_http_client()
+    
+    # 等待队列中的日志写完
+    await logger.complete()
 
 
 def create_app() -> FastAPI:
@@ -188,6 +195,23 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
 
+    # 压缩 JSON 接口和静态脚本的响应；首页与管理面板已预压缩（带 Content-Encoding），中间件会原样透传
+    app.add_middleware(NegotiatedGZipMiddleware, minimum_size=500)
+
+    # 单个文章URL的增删接口请求体很小，超限的请求在解析 JSON 前直接返回 413
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        max_bytes=8192,
+        paths=("/digest/add-article", "/digest/delete-article"),
+    )
+
+    # 批量增删接口最多 50 个URL、每个不超过 4096 字符，上限按满额列表加上 JSON 开销留出余量
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        max_bytes=256 * 1024,
+        paths=("/digest/add-articles", "/digest/delete-articles"),
+    )
+
     # 挂载静态资源目录，用于提供公众号二维码等图片
     static_dir = Path(__file__).resolve().parent / "presentation" / "static"
     if static_dir.exists():
@@ -212,11 +236,11 @@ def create_app() -> FastAPI:
     async def root(
         category: str = None,
         tool_id_or_identifier: str = None,
-        weekly_id: str = None
+        weekly_id: str = None,
+        accept_encoding: Optional[str] = Header(default=None),
     ):
         """AICoding基地 首页（支持所有前端路由）"""
-        html = get_index_html()
-        return HTMLResponse(content=html)
+        return get_index_response(accept_encoding)
 
     @app.get("/health")
     async def health_check():
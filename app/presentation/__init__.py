@@ -1,6 +1,8 @@
 """表示层：HTML模板和前端相关"""
 
-from .templates import get_index_html
+from .encoding import accepts_gzip
+from .templates import get_index_html, get_index_response
+from .middleware import BodySizeLimitMiddleware, NegotiatedGZipMiddleware
 
-__all__ = ["get_index_html"]
+__all__ = ["accepts_gzip", "get_index_html", "get_index_response", "BodySizeLimitMiddleware", "NegotiatedGZipMiddleware"]
 
@@ -0,0 +1,31 @@
+"""HTTP 内容编码协商"""
+
+from typing import Optional
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    按 Accept-Encoding 判断客户端是否接受 gzip
+
+    解析 q 值：gzip;q=0 表示明确拒绝；没有列出 gzip 时按通配符 * 的 q 值判断。
+    """
+    if not accept_encoding:
+        return False
+    wildcard = False
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if coding not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "gzip":
+            return q > 0
+        wildcard = q > 0
+    return wildcard
@@ -0,0 +1,79 @@
+"""ASGI 中间件：在进入路由前拦截过大的请求体；按 q 值协商 gzip 压缩"""
+
+from typing import Iterable
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .encoding import accepts_gzip
+
+_TOO_LARGE_DETAIL = "请求体过大"
+
+
+class BodySizeLimitMiddleware:
+    """
+    限制指定路径的请求体大小，超限返回 413
+
+    - 优先检查 Content-Length，超限时不读取请求体、不解析 JSON
+    - 未声明 Content-Length（分块传输）时按已接收字节数累计，超限即抛出 413
+    - 只作用于 paths 中列出的路径，其他接口不受影响
+
+    Args:
+        app: 下游 ASGI 应用
+        max_bytes: 允许的最大请求体字节数
+        paths: 需要限制的请求路径
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int = 8192, paths: Iterable[str] = ()) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    too_large = int(value) > self.max_bytes
+                except ValueError:
+                    too_large = True
+                if too_large:
+                    response = JSONResponse({"detail": _TOO_LARGE_DETAIL}, status_code=413)
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # 在路由读取请求体时抛出，由 FastAPI 的异常处理转换为 413 响应
+                    raise HTTPException(status_code=413, detail=_TOO_LARGE_DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+class NegotiatedGZipMiddleware(GZipMiddleware):
+    """
+    按 Accept-Encoding 的 q 值决定是否压缩的 GZipMiddleware
+
+    GZipMiddleware 只判断请求头中是否出现 "gzip"，客户端发送 gzip;q=0 明确拒绝时仍会压缩；
+    这里先用 accepts_gzip 判断，拒绝 gzip 的请求原样透传。
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not accepts_gzip(Headers(scope=scope).get("accept-encoding")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -1,13 +1,18 @@
 """AI助手路由 - 提供AI相关助手功能"""
+import asyncio
+import hashlib
 import re
 import html as html_lib
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 from loguru import logger
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 
 from ...infrastructure.notifiers.wechat_mp import WeChatMPClient
 
@@ -57,6 +62,169 @@ class WeChatArticleToMarkdownResponse(BaseModel):
     author: Optional[str] = None
 
 
+# 微信公众号 HTML 内联样式（参考 vscode-markdown-to-wechat）
+_TAG_STYLES = {
+    # 表格（更美观的表格样式）
+    'table': 'border-collapse: collapse; width: 100%; margin: 15px 0; font-size: 14px;',
+    'th': 'border: 1px solid #ddd; padding: 10px; background-color: #f8f9fa; text-align: left; font-weight: bold;',
+    'td': 'border: 1px solid #ddd; padding: 10px;',
+    # 段落（更好的行间距和字体）
+    'p': 'line-height: 1.8; margin: 12px 0; color: #333; font-size: 15px; text-align: justify;',
+    # 标题（不同级别的标题）
+    'h1': 'font-weight: bold; margin: 25px 0 15px 0; color: #2c3e50; font-size: 24px; border-bottom: 2px solid #eee; padding-bottom: 10px;',
+    'h2': 'font-weight: bold; margin: 22px 0 12px 0; color: #34495e; font-size: 20px; border-bottom: 1px solid #eee; padding-bottom: 8px;',
+    'h3': 'font-weight: bold; margin: 20px 0 10px 0; color: #34495e; font-size: 18px;',
+    'h4': 'font-weight: bold; margin: 18px 0 10px 0; color: #34495e; font-size: 14px;',
+    'h5': 'font-weight: bold; margin: 18px 0 10px 0; color: #34495e; font-size: 13px;',
+    'h6': 'font-weight: bold; margin: 18px 0 10px 0; color: #34495e; font-size: 12px;',
+    # 列表（更好的缩进和间距）
+    'ul': 'padding-left: 25px; margin: 12px 0; list-style-type: disc;',
+    'ol': 'padding-left: 25px; margin: 12px 0;',
+    'li': 'margin: 6px 0; line-height: 1.8; color: #333;',
+    # 引用块（更美观的引用样式）
+    'blockquote': 'border-left: 4px solid #576b95; padding-left: 15px; margin: 15px 0; color: #666; font-style: italic; background-color: #f8f9fa; padding: 10px 15px;',
+    # 强调文本
+    'strong': 'font-weight: bold; color: #2c3e50;',
+    'em': 'font-style: italic; color: #555;',
+    # 水平线
+    'hr': 'border: none; border-top: 1px solid #eee; margin: 20px 0;',
+}
+
+# 外部图片（微信公众号不支持外部图片，但保留 img 标签供用户替换，只添加样式）
+_IMG_STYLE = 'max-width: 100%; height: auto; display: block; margin: 10px auto;'
+# 链接（微信公众号链接样式）
+_LINK_STYLE = 'color: #576b95; text-decoration: none; border-bottom: 1px solid #576b95;'
+
+# 原始 HTML 块不经过元素树，其中的裸标签、外部图片和链接在暂存区里按同样的样式补上
+_RAW_BARE_TAG_RE = re.compile(r'<(' + '|'.join(_TAG_STYLES) + r')>')
+_RAW_IMG_RE = re.compile(r'<img(?![^>]*\bstyle=)([^>]*\bsrc=["\']https?://[^>]*?)(\s*/?)>')
+_RAW_LINK_RE = re.compile(r'<a(?![^>]*\bstyle=)([^>]*\bhref=["\'][^"\']+["\'][^>]*)>')
+
+
+def _style_raw_html(block: str) -> str:
+    block = _RAW_BARE_TAG_RE.sub(lambda m: f'<{m.group(1)} style="{_TAG_STYLES[m.group(1)]}">', block)
+    block = _RAW_IMG_RE.sub(lambda m: f'<img{m.group(1)} style="{_IMG_STYLE}"{m.group(2)}>', block)
+    return _RAW_LINK_RE.sub(lambda m: f'<a{m.group(1)} style="{_LINK_STYLE}">', block)
+
+
+# 围栏代码块以原始 HTML 形式插入，不经过元素树，仍在输出的 HTML 上添加样式
+_CODE_BLOCK_RE = re.compile(r'<pre><code([^>]*)>')
+_CODE_BLOCK_REPL = r'<pre style="background-color: #f5f5f5; padding: 15px; border-radius: 4px; overflow-x: auto; font-family: \'Consolas\', \'Monaco\', \'Courier New\', monospace; font-size: 14px; line-height: 1.6; margin: 15px 0;"><code\1 style="color: #333; background: transparent;">'
+
+# 除 &nbsp; 以外的命名实体和数字实体
+_ENTITY_RE = re.compile(r'&(?!nbsp;)(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+);')
+
+# 需要移除的字符：BOM、零宽空格、零宽非断字符、零宽断字符，以及控制字符（保留制表符、换行、回车）
+_STRIP_CHARS_TABLE = dict.fromkeys(
+    [ord(c) for c in '\ufeff\u200b\u200c\u200d'] + [i for i in range(32) if i not in (9, 10, 13)]
+)
+
+_TAG_GAP_RE = re.compile(r'(?<=>)\s+(?=<)')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+
+def _unescape_entity(match: re.Match) -> str:
+    return html_lib.unescape(match.group(0))
+
+
+# 纯文本快速路径：短文本且不含任何 Markdown/HTML 语法字符时，结果只会是一个段落，无需走完整转换
+_PLAIN_TEXT_MAX_LENGTH = 256
+_MARKDOWN_SYNTAX_CHARS = frozenset('<>&#*_[]`|\\')
+_PARAGRAPH_TEMPLATE = f'<p style="{_TAG_STYLES["p"]}">{{}}</p>'
+
+
+def _is_plain_text(text: str) -> bool:
+    """判断文本是否为单段纯文本（不含换行、控制字符、零宽字符、首尾空白、列表/缩进起始符和语法字符）"""
+    return (
+        0 < len(text) < _PLAIN_TEXT_MAX_LENGTH
+        and text.isprintable()
+        and text[0] not in ' -+0123456789'
+        and not text[-1].isspace()
+        and not _MARKDOWN_SYNTAX_CHARS.intersection(text)
+    )
+
+
+# Markdown 转换器配置：wechat 用于生成公众号 HTML（参考 vscode-markdown-to-wechat），standard 用于预览
+_MARKDOWN_CONFIGS = {
+    'wechat': {
+        'extensions': [
+            'codehilite',      # 代码高亮
+            'fenced_code',     # 围栏代码块
+            'tables',          # 表格支持
+            'nl2br',          # 换行转 <br>
+            'toc',            # 目录（可选）
+        ],
+        'extension_configs': {
+            'codehilite': {
+                'css_class': 'highlight',
+                'use_pygments': False,  # 不使用 Pygments，避免依赖
+            }
+        },
+    },
+    'standard': {
+        'extensions': ['fenced_code', 'tables', 'nl2br'],
+    },
+}
+
+def _build_wechat_style_extension():
+    """
+    创建在 Markdown 元素树上直接添加内联样式的扩展
+    
+    在 markdown 解析出的元素树上按标签设置 style，省去对输出 HTML 的多次正则替换，
+    带属性的标签（如 toc 生成的 <h1 id="...">、对齐的表格单元格）也能正确加上样式。
+    """
+    from markdown.extensions import Extension
+    from markdown.treeprocessors import Treeprocessor
+    from markdown.util import HTML_PLACEHOLDER_RE
+    
+    class WeChatStyleTreeprocessor(Treeprocessor):
+        def run(self, root):
+            for el in root.iter():
+                tag = el.tag
+                if tag == 'p' and len(el) == 0 and HTML_PLACEHOLDER_RE.fullmatch(el.text or ''):
+                    # 原始 HTML 块（如围栏代码块）的占位段落，markdown 会按 <p>占位符</p> 原样替换，不能加样式
+                    continue
+                if tag == 'img':
+                    style = _IMG_STYLE if el.get('src', '').startswith(('http://', 'https://')) else None
+                elif tag == 'a':
+                    style = _LINK_STYLE if el.get('href') else None
+                else:
+                    style = _TAG_STYLES.get(tag)
+                if style:
+                    existing = el.get('style')
+                    el.set('style', f'{style} {existing}' if existing else style)
+            # 原始 HTML 块（<div>、<table> 等）以字符串暂存，最后才替换回占位符，元素树中看不到
+            stash = self.md.htmlStash.rawHtmlBlocks
+            for i, block in enumerate(stash):
+                if isinstance(block, str):
+                    stash[i] = _style_raw_html(block)
+    
+    class WeChatStyleExtension(Extension):
+        def extendMarkdown(self, md):
+            # 在行内处理（优先级 20）之后运行，此时链接、图片、强调等元素都已生成
+            md.treeprocessors.register(WeChatStyleTreeprocessor(md), 'wechat_style', 4)
+    
+    return WeChatStyleExtension()
+
+
+# markdown.Markdown 实例不是线程安全的，每个线程各自缓存一份
+_markdown_local = threading.local()
+
+
+def _get_markdown(kind: str):
+    """获取当前线程复用的 Markdown 转换器，首次使用时创建，之后只重置状态"""
+    md = getattr(_markdown_local, kind, None)
+    if md is None:
+        import markdown
+        config = dict(_MARKDOWN_CONFIGS[kind])
+        extensions = list(config.pop('extensions'))
+        if kind == 'wechat':
+            extensions.append(_build_wechat_style_extension())
+        md = markdown.Markdown(extensions=extensions, **config)
+        setattr(_markdown_local, kind, md)
+    return md.reset()
+
+
 def markdown_to_wechat_html(markdown_text: str) -> str:
     """
     将 Markdown 转换为适合微信公众号的 HTML 格式
@@ -70,6 +238,9 @@ def markdown_to_wechat_html(markdown_text: str) -> str:
     4. 样式需要内联
     5. 需要良好的排版和样式支持
     """
+    if _is_plain_text(markdown_text):
+        return _PARAGRAPH_TEMPLATE.format(markdown_text)
+    
     # 先尝试导入 markdown
     try:
         import markdown
@@ -81,168 +252,21 @@ def markdown_to_wechat_html(markdown_text: str) -> str:
         )
     
     try:
-        # 配置 Markdown 转换器（参考 vscode-markdown-to-wechat）
-        md = markdown.Markdown(
-            extensions=[
-                'codehilite',      # 代码高亮
-                'fenced_code',     # 围栏代码块
-                'tables',          # 表格支持
-                'nl2br',          # 换行转 <br>
-                'toc',            # 目录（可选）
-            ],
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'use_pygments': False,  # 不使用 Pygments，避免依赖
-                }
-            }
-        )
-        
-        # 转换为 HTML
-        html = md.convert(markdown_text)
-        
-        # 确保 HTML 是 UTF-8 编码，并清理特殊字符
-        # 移除 BOM 标记和零宽字符
-        html = html.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-        
-        # 清理和优化 HTML，使其适合微信公众号
-        # 参考 vscode-markdown-to-wechat 的样式处理
-        
-        # 1. 处理图片（微信公众号不支持外部图片，但保留 img 标签供用户替换）
-        # 不删除图片，而是添加提示样式
-        html = re.sub(
-            r'<img([^>]+)src=["\'](https?://[^"\']+)["\']([^>]*)>',
-            r'<img\1src="\2"\3 style="max-width: 100%; height: auto; display: block; margin: 10px auto;">',
-            html
-        )
+        # 1. 转换为 HTML，表格、段落、标题、列表、引用、强调文本、水平线、图片、链接的内联样式
+        # 在转换过程中由 WeChatStyleTreeprocessor 直接加到元素上（参考 vscode-markdown-to-wechat 的样式）
+        html = _get_markdown('wechat').convert(markdown_text)
         
         # 2. 为代码块添加样式（参考 vscode-markdown-to-wechat）
-        html = re.sub(
-            r'<pre><code([^>]*)>',
-            r'<pre style="background-color: #f5f5f5; padding: 15px; border-radius: 4px; overflow-x: auto; font-family: \'Consolas\', \'Monaco\', \'Courier New\', monospace; font-size: 14px; line-height: 1.6; margin: 15px 0;"><code\1 style="color: #333; background: transparent;">',
-            html
-        )
-        html = re.sub(
-            r'</code></pre>',
-            r'</code></pre>',
-            html
-        )
-        
-        # 3. 为表格添加样式（更美观的表格样式）
-        html = re.sub(
-            r'<table>',
-            r'<table style="border-collapse: collapse; width: 100%; margin: 15px 0; font-size: 14px;">',
-            html
-        )
-        html = re.sub(
-            r'<th>',
-            r'<th style="border: 1px solid #ddd; padding: 10px; background-color: #f8f9fa; text-align: left; font-weight: bold;">',
-            html
-        )
-        html = re.sub(
-            r'<td>',
-            r'<td style="border: 1px solid #ddd; padding: 10px;">',
-            html
-        )
-        
-        # 4. 为段落添加样式（更好的行间距和字体）
-        html = re.sub(
-            r'<p>',
-            r'<p style="line-height: 1.8; margin: 12px 0; color: #333; font-size: 15px; text-align: justify;">',
-            html
-        )
-        
-        # 5. 为标题添加样式（不同级别的标题）
-        html = re.sub(
-            r'<h1>',
-            r'<h1 style="font-weight: bold; margin: 25px 0 15px 0; color: #2c3e50; font-size: 24px; border-bottom: 2px solid #eee; padding-bottom: 10px;">',
-            html
-        )
-        html = re.sub(
-            r'<h2>',
-            r'<h2 style="font-weight: bold; margin: 22px 0 12px 0; color: #34495e; font-size: 20px; border-bottom: 1px solid #eee; padding-bottom: 8px;">',
-            html
-        )
-        html = re.sub(
-            r'<h3>',
-            r'<h3 style="font-weight: bold; margin: 20px 0 10px 0; color: #34495e; font-size: 18px;">',
-            html
-        )
-        for i in range(4, 7):
-            html = re.sub(
-                f'<h{i}>',
-                f'<h{i} style="font-weight: bold; margin: 18px 0 10px 0; color: #34495e; font-size: {18-i}px;">',
-                html
-            )
-        
-        # 6. 为列表添加样式（更好的缩进和间距）
-        html = re.sub(
-            r'<ul>',
-            r'<ul style="padding-left: 25px; margin: 12px 0; list-style-type: disc;">',
-            html
-        )
-        html = re.sub(
-            r'<ol>',
-            r'<ol style="padding-left: 25px; margin: 12px 0;">',
-            html
-        )
-        html = re.sub(
-            r'<li>',
-            r'<li style="margin: 6px 0; line-height: 1.8; color: #333;">',
-            html
-        )
-        
-        # 7. 为链接添加样式（微信公众号链接样式）
-        html = re.sub(
-            r'<a([^>]+)href=["\']([^"\']+)["\']([^>]*)>',
-            r'<a\1href="\2"\3 style="color: #576b95; text-decoration: none; border-bottom: 1px solid #576b95;">',
-            html
-        )
-        
-        # 8. 为引用块添加样式（更美观的引用样式）
-        html = re.sub(
-            r'<blockquote>',
-            r'<blockquote style="border-left: 4px solid #576b95; padding-left: 15px; margin: 15px 0; color: #666; font-style: italic; background-color: #f8f9fa; padding: 10px 15px;">',
-            html
-        )
-        
-        # 9. 为强调文本添加样式
-        html = re.sub(
-            r'<strong>',
-            r'<strong style="font-weight: bold; color: #2c3e50;">',
-            html
-        )
-        html = re.sub(
-            r'<em>',
-            r'<em style="font-style: italic; color: #555;">',
-            html
-        )
+        html = _CODE_BLOCK_RE.sub(_CODE_BLOCK_REPL, html)
         
-        # 10. 为水平线添加样式
-        html = re.sub(
-            r'<hr>',
-            r'<hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">',
-            html
-        )
-        
-        # 10. 清理 HTML 实体编码，确保中文字符正确显示
+        # 3. 清理 HTML 实体编码，确保中文字符正确显示
         # 将常见的 HTML 实体转换为实际字符（但保留必要的实体如 &nbsp;）
-        try:
-            # 先解码 HTML 实体（如 &amp; &lt; &gt; 等），但保留 &nbsp;
-            # 因为 &nbsp; 在 HTML 中有特殊意义
-            html = html.replace('&nbsp;', '__NBSP__')  # 临时替换
-            html = html_lib.unescape(html)  # 解码其他实体
-            html = html.replace('__NBSP__', '&nbsp;')  # 恢复
-        except Exception:
-            pass
+        # 只解码 &nbsp; 以外的实体（如 &amp; &lt; &gt; 等），因为 &nbsp; 在 HTML 中有特殊意义
+        html = _ENTITY_RE.sub(_unescape_entity, html)
         
-        # 11. 确保所有文本节点都是 UTF-8 编码
-        # 移除可能导致编码问题的字符（BOM、零宽字符等）
-        html = html.replace('\ufeff', '')  # BOM
-        html = html.replace('\u200b', '')  # 零宽空格
-        html = html.replace('\u200c', '')  # 零宽非断字符
-        html = html.replace('\u200d', '')  # 零宽断字符
-        html = html.replace('\ufeff', '')  # 再次确保移除 BOM
+        # 4. 确保所有文本节点都是 UTF-8 编码
+        # 一次性移除可能导致编码问题的字符（BOM、零宽字符）和控制字符（除了常见的换行、制表符等）
+        html = html.translate(_STRIP_CHARS_TABLE)
         
         # 确保是有效的 UTF-8 编码
         try:
@@ -250,14 +274,10 @@ def markdown_to_wechat_html(markdown_text: str) -> str:
         except Exception:
             pass
         
-        # 12. 清理多余的空白字符（但保留必要的空格和换行）
+        # 5. 清理多余的空白字符（但保留必要的空格和换行）
         # 不要在 HTML 标签之间清理，只清理文本内容中的多余空白
-        html = re.sub(r'(?<=>)\s+(?=<)', '', html)  # 标签之间的空白
-        html = re.sub(r'\n\s*\n\s*\n+', '\n', html)  # 多个换行合并
-        
-        # 13. 确保 HTML 格式正确，移除可能导致问题的字符
-        # 移除控制字符（除了常见的换行、制表符等）
-        html = ''.join(char for char in html if ord(char) >= 32 or char in '\n\r\t')
+        html = _TAG_GAP_RE.sub('', html)  # 标签之间的空白
+        html = _BLANK_LINES_RE.sub('\n', html)  # 多个换行合并
         
         return html
         
@@ -266,22 +286,28 @@ def markdown_to_wechat_html(markdown_text: str) -> str:
         raise HTTPException(status_code=500, detail=f"Markdown 转换失败: {str(e)}")
 
 
+def _render_markdown(markdown_text: str) -> tuple[str, str]:
+    """生成 (标准 HTML, 微信公众号 HTML)"""
+    # 转换为微信公众号格式的 HTML
+    wechat_html = markdown_to_wechat_html(markdown_text)
+    
+    # 也生成标准 HTML（用于预览）
+    try:
+        standard_html = _get_markdown('standard').convert(markdown_text)
+    except Exception:
+        standard_html = wechat_html
+    
+    return standard_html, wechat_html
+
+
 @router.post("/wechat-publisher/markdown/convert", response_model=MarkdownConvertResponse)
 async def convert_markdown(request: MarkdownConvertRequest):
     """
     将 Markdown 转换为微信公众号格式的 HTML
     """
     try:
-        # 转换为微信公众号格式的 HTML
-        wechat_html = markdown_to_wechat_html(request.markdown)
-        
-        # 也生成标准 HTML（用于预览）
-        try:
-            import markdown
-            md = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
-            standard_html = md.convert(request.markdown)
-        except Exception:
-            standard_html = wechat_html
+        # Markdown 转换是 CPU 密集操作，放到线程中执行，避免阻塞事件循环
+        standard_html, wechat_html = await asyncio.to_thread(_render_markdown, request.markdown)
         
         return MarkdownConvertResponse(
             html=standard_html,
@@ -294,6 +320,35 @@ async def convert_markdown(request: MarkdownConvertRequest):
         raise HTTPException(status_code=500, detail=f"转换失败: {str(e)}")
 
 
+# 微信公众号客户端在进程内共享，复用其缓存的 access_token
+_wechat_client: Optional[WeChatMPClient] = None
+
+
+def _get_wechat_client() -> WeChatMPClient:
+    """获取共享的微信公众号客户端，首次使用时创建"""
+    global _wechat_client
+    if _wechat_client is None:
+        _wechat_client = WeChatMPClient()
+    return _wechat_client
+
+
+# 草稿列表缓存：(offset, count) -> (写入时间, 结果)；并发的相同请求由锁合并为一次上游调用
+_DRAFTS_CACHE_TTL = 30.0  # 秒
+_drafts_cache: dict[tuple[int, int], tuple[float, dict]] = {}
+_drafts_lock = asyncio.Lock()
+
+
+def _drafts_cache_get(key: tuple[int, int]) -> Optional[dict]:
+    entry = _drafts_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > _DRAFTS_CACHE_TTL:
+        del _drafts_cache[key]
+        return None
+    return value
+
+
 @router.post("/wechat-publisher/publish", response_model=PublishArticleResponse)
 async def publish_article(request: PublishArticleRequest):
     """
@@ -312,12 +367,12 @@ async def publish_article(request: PublishArticleRequest):
         if request.digest and len(request.digest) > 54:
             raise HTTPException(status_code=400, detail="摘要不能超过54个字符")
         
-        # 验证内容长度（微信公众号限制：少于2万字符，小于1M）
+        # 验证内容长度（微信公众号限制：少于2万字符，小于1M），在请求微信接口前直接拒绝
+        # 2万字符按 UTF-8 编码最多约 80KB，字符数合法时必然小于 1M，无需再编码校验字节数
         if len(request.content) >= 20000:
             raise HTTPException(status_code=400, detail="内容不能超过2万字符")
         
-        # 创建微信公众号客户端
-        client = WeChatMPClient()
+        client = _get_wechat_client()
         
         # 准备文章数据
         article = {
@@ -352,6 +407,8 @@ async def publish_article(request: PublishArticleRequest):
         
         if media_id:
             logger.info(f"成功创建草稿，media_id: {media_id}")
+            # 草稿箱已变化，丢弃缓存的草稿列表
+            _drafts_cache.clear()
             return PublishArticleResponse(
                 success=True,
                 message="草稿创建成功，请在微信公众号后台查看并发布",
@@ -372,10 +429,20 @@ async def publish_article(request: PublishArticleRequest):
 async def get_drafts(offset: int = 0, count: int = 20):
     """
     获取微信公众号草稿列表
+    
+    结果按 (offset, count) 缓存 30 秒，避免轮询时频繁请求微信接口。
     """
     try:
-        client = WeChatMPClient()
-        result = await client.get_draft_list(offset=offset, count=count)
+        key = (offset, count)
+        result = _drafts_cache_get(key)
+        if result is None:
+            async with _drafts_lock:
+                # 等锁期间可能已有其他请求写入缓存
+                result = _drafts_cache_get(key)
+                if result is None:
+                    result = await _get_wechat_client().get_draft_list(offset=offset, count=count)
+                    if result:
+                        _drafts_cache[key] = (time.monotonic(), result)
         
         if result:
             return {
@@ -391,6 +458,52 @@ async def get_drafts(offset: int = 0, count: int = 20):
         raise HTTPException(status_code=500, detail=f"获取草稿列表失败: {str(e)}")
 
 
+# 微信公众号文章解析用的 XPath，模块加载时编译一次；class 匹配不区分大小写
+# 每组按优先级依次查找，取第一个命中的元素
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+_TITLE_XPATHS = tuple(etree.XPath(expr) for expr in ('(//h1)[1]', '(//h2)[1]', '(//title)[1]'))
+_AUTHOR_XPATHS = tuple(
+    etree.XPath(expr, namespaces=_XPATH_NS)
+    for expr in (
+        '(//meta[@name="author"])[1]',
+        '(//strong[re:test(@class, "author", "i")])[1]',
+        '(//span[re:test(@class, "author", "i")])[1]',
+    )
+)
+_CONTENT_XPATHS = tuple(
+    etree.XPath(expr, namespaces=_XPATH_NS)
+    for expr in (
+        '(//*[@id="js_content"])[1]',
+        '(//*[re:test(@class, "content", "i")])[1]',
+        '(//article)[1]',
+        '(//div[re:test(@class, "article", "i")])[1]',
+    )
+)
+
+
+# 匹配各种可能的图片格式：![alt](url) 或 ![alt](url "title")
+_MD_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_MD_EXTRA_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _normalize_markdown_image(match: re.Match) -> str:
+    """标准化图片 Markdown 格式"""
+    alt = match.group(1) or '图片'
+    # 移除 URL 中的引号和多余空格
+    url = match.group(2).strip().strip('"').strip("'")
+    # 返回标准格式：![alt](url)
+    return f'![{alt}]({url})'
+
+
+def _find_first(doc, xpaths: tuple):
+    """按优先级依次执行 XPath，返回第一个命中的元素，没有时返回 None"""
+    for xpath in xpaths:
+        found = xpath(doc)
+        if found:
+            return found[0]
+    return None
+
+
 def wechat_html_to_markdown(html_content: str) -> tuple[str, Optional[str], Optional[str]]:
     """
     将微信公众号文章的 HTML 转换为 Markdown 格式
@@ -409,67 +522,58 @@ def wechat_html_to_markdown(html_content: str) -> tuple[str, Optional[str], Opti
     
     try:
         
-        # 使用 BeautifulSoup 解析 HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # 使用 lxml 解析 HTML（lxml 不接受空文档）
+        if not html_content.strip():
+            return '', None, None
+        doc = lxml_html.document_fromstring(html_content)
         
         # 提取标题
         title = None
-        title_elem = soup.find('h1') or soup.find('h2') or soup.find('title')
-        if title_elem:
-            title = title_elem.get_text().strip()
+        title_elem = _find_first(doc, _TITLE_XPATHS)
+        if title_elem is not None:
+            title = title_elem.text_content().strip()
         
         # 提取作者
         author = None
         # 微信公众号文章通常在 meta 标签或特定 class 中
-        author_elem = soup.find('meta', {'name': 'author'}) or \
-                     soup.find('strong', class_=re.compile('.*author.*', re.I)) or \
-                     soup.find('span', class_=re.compile('.*author.*', re.I))
-        if author_elem:
-            author = author_elem.get('content') or author_elem.get_text().strip()
+        author_elem = _find_first(doc, _AUTHOR_XPATHS)
+        if author_elem is not None:
+            author = author_elem.get('content') or author_elem.text_content().strip()
         
         # 提取文章正文（微信公众号文章通常在 #js_content 或类似的选择器中）
-        content_elem = soup.find(id='js_content') or \
-                      soup.find(class_=re.compile('.*content.*', re.I)) or \
-                      soup.find('article') or \
-                      soup.find('div', class_=re.compile('.*article.*', re.I))
-        
-        if content_elem:
-            # 只转换正文部分
-            html_to_convert = str(content_elem)
-        else:
-            # 如果没有找到特定容器，使用整个 HTML
-            html_to_convert = html_content
+        content_elem = _find_first(doc, _CONTENT_XPATHS)
         
         # 在转换前，先处理图片标签
         # 微信公众号的图片可能有以下特点：
         # 1. 懒加载：使用 data-src 而不是 src
         # 2. CDN URL：图片存储在微信 CDN 上（包含 mmbiz、wx_fmt 等标识）
         # 3. 可能缺少 alt 文本
-        for img in soup.find_all('img'):
+        for img in doc.iter('img'):
+            attrib = img.attrib
             # 处理懒加载图片：如果 data-src 存在，使用它作为 src
-            data_src = img.get('data-src') or img.get('data-original')
+            data_src = attrib.get('data-src') or attrib.get('data-original')
             if data_src:
                 # 优先使用 data-src（通常是高清原图）
-                img['src'] = data_src
-            elif not img.get('src'):
+                attrib['src'] = data_src
+            elif not attrib.get('src'):
                 # 如果既没有 src 也没有 data-src，记录警告但继续处理
                 logger.warning("发现没有 src 的图片标签")
                 continue
             
             # 确保有 alt 属性（用于 Markdown 图片的 alt 文本）
-            if not img.get('alt'):
+            if not attrib.get('alt'):
                 # 尝试从其他属性获取描述
-                alt_text = (img.get('title') or 
-                           img.get('data-title') or 
-                           img.get('data-alt') or
-                           '图片')  # 默认 alt 文本
-                img['alt'] = alt_text
+                attrib['alt'] = (attrib.get('title') or
+                                 attrib.get('data-title') or
+                                 attrib.get('data-alt') or
+                                 '图片')  # 默认 alt 文本
         
-        # 更新 HTML 内容（包含处理后的图片）
-        if content_elem:
-            html_to_convert = str(content_elem)
-        else:
-            html_to_convert = str(soup)
+        # 序列化一次（包含处理后的图片）：找到正文容器时只转换正文部分，否则使用整个 HTML
+        html_to_convert = lxml_html.tostring(
+            content_elem if content_elem is not None else doc,
+            encoding='unicode',
+            with_tail=False,
+        )
         
         # 配置 html2text 转换器
         h = html2text.HTML2Text()
@@ -484,26 +588,10 @@ def wechat_html_to_markdown(html_content: str) -> tuple[str, Optional[str], Opti
         
         # 后处理：优化图片 Markdown 格式
         # html2text 可能生成的格式不统一，统一处理
-        # 匹配各种可能的图片格式：![alt](url) 或 ![alt](url "title")
-        def normalize_image(match):
-            """标准化图片 Markdown 格式"""
-            full_match = match.group(0)
-            alt = match.group(1) or '图片'
-            url = match.group(2)
-            # 移除 URL 中的引号和多余空格
-            url = url.strip().strip('"').strip("'")
-            # 返回标准格式：![alt](url)
-            return f'![{alt}]({url})'
-        
-        # 匹配图片 Markdown 格式
-        markdown = re.sub(
-            r'!\[([^\]]*)\]\(([^)]+)\)',
-            normalize_image,
-            markdown
-        )
+        markdown = _MD_IMAGE_RE.sub(_normalize_markdown_image, markdown)
         
         # 清理多余的空白行
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+        markdown = _MD_EXTRA_BLANK_LINES_RE.sub('\n\n', markdown)
         markdown = markdown.strip()
         
         return markdown, title, author
@@ -513,30 +601,86 @@ def wechat_html_to_markdown(html_content: str) -> tuple[str, Optional[str], Opti
         raise HTTPException(status_code=500, detail=f"转换失败: {str(e)}")
 
 
+# 获取文章 HTML 的共享 HTTP 客户端，复用连接池和 TLS 会话；应用关闭时由 lifespan 调用 close_http_client()
+_ARTICLE_FETCH_HEADERS = {
+    # 设置 User-Agent 模拟浏览器访问
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """获取共享 HTTP 客户端，首次使用时创建"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            headers=_ARTICLE_FETCH_HEADERS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """关闭共享 HTTP 客户端"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# 文章转换结果缓存：LRU + 过期时间，键为 ('url', URL) 或 ('html', 内容哈希)
+_CONVERSION_CACHE_SIZE = 256
+_CONVERSION_CACHE_TTL = 600  # 秒
+_conversion_cache: OrderedDict = OrderedDict()
+
+
+def _conversion_cache_get(key: tuple) -> Optional[WeChatArticleToMarkdownResponse]:
+    entry = _conversion_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > _CONVERSION_CACHE_TTL:
+        del _conversion_cache[key]
+        return None
+    _conversion_cache.move_to_end(key)
+    return value
+
+
+def _conversion_cache_set(key: tuple, value: WeChatArticleToMarkdownResponse) -> None:
+    _conversion_cache[key] = (time.monotonic(), value)
+    _conversion_cache.move_to_end(key)
+    while len(_conversion_cache) > _CONVERSION_CACHE_SIZE:
+        _conversion_cache.popitem(last=False)
+
+
 @router.post("/wechat-publisher/article-to-markdown", response_model=WeChatArticleToMarkdownResponse)
-async def wechat_article_to_markdown(request: WeChatArticleToMarkdownRequest):
+async def wechat_article_to_markdown(request: WeChatArticleToMarkdownRequest, nocache: bool = False):
     """
     将微信公众号文章转换为 Markdown 格式
     
-    可以传入文章 URL 或直接传入 HTML 内容
+    可以传入文章 URL 或直接传入 HTML 内容。
+    转换结果按 URL 或 HTML 内容哈希缓存，传入 ?nocache=1 可跳过缓存重新获取。
     """
     try:
         html_content = None
+        cache_key = None
         
         # 如果提供了 URL，先获取 HTML 内容
         if request.url:
             if not request.url.startswith(('http://', 'https://')):
                 raise HTTPException(status_code=400, detail="URL 格式不正确")
             
+            cache_key = ('url', request.url)
+            cached = None if nocache else _conversion_cache_get(cache_key)
+            if cached:
+                return cached
+            
             try:
-                async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                    # 设置 User-Agent 模拟浏览器访问
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    }
-                    response = await client.get(request.url, headers=headers)
-                    response.raise_for_status()
-                    html_content = response.text
+                response = await _get_http_client().get(request.url)
+                response.raise_for_status()
+                html_content = response.text
             except httpx.HTTPError as e:
                 logger.error(f"获取文章内容失败: {e}")
                 raise HTTPException(status_code=400, detail=f"无法获取文章内容: {str(e)}")
@@ -544,20 +688,26 @@ async def wechat_article_to_markdown(request: WeChatArticleToMarkdownRequest):
         # 如果提供了 HTML 内容，直接使用
         elif request.html:
             html_content = request.html
+            cache_key = ('html', hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).hexdigest())
+            cached = None if nocache else _conversion_cache_get(cache_key)
+            if cached:
+                return cached
         else:
             raise HTTPException(status_code=400, detail="请提供 URL 或 HTML 内容")
         
         if not html_content:
             raise HTTPException(status_code=400, detail="无法获取 HTML 内容")
         
-        # 转换为 Markdown
-        markdown, title, author = wechat_html_to_markdown(html_content)
+        # 转换为 Markdown（HTML 解析是 CPU 密集操作，放到线程中执行）
+        markdown, title, author = await asyncio.to_thread(wechat_html_to_markdown, html_content)
         
-        return WeChatArticleToMarkdownResponse(
+        result = WeChatArticleToMarkdownResponse(
             markdown=markdown,
             title=title,
             author=author
         )
+        _conversion_cache_set(cache_key, result)
+        return result
         
     except HTTPException:
         raise
@@ -669,142 +669,147 @@ async def get_resources(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_weekly(weekly_id: str) -> tuple[str, str, dict]:
+    """
+    解析每周资讯 Markdown 文件
+    
+    Returns:
+        (标题, 时间范围, {'ai': [...], 'programming': [...]})，文章按最新在前排序
+    """
+    import re
+    
+    # app/presentation/routes/api.py -> app/presentation/routes -> app/presentation -> app -> 项目根目录
+    weekly_file = Path(__file__).resolve().parent.parent.parent.parent / "data" / "weekly" / f"{weekly_id}.md"
+    
+    if not weekly_file.exists():
+        raise HTTPException(status_code=404, detail="Weekly not found")
+    
+    with open(weekly_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    lines = content.split('\n')
+    
+    # 解析文章信息
+    articles = {
+        'ai': [],  # AI资讯
+        'programming': []  # 编程资讯
+    }
+    current_category = None
+    current_article = {}
+    
+    title_line = ''
+    time_range = ''
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # 解析主标题
+        if line.startswith('# '):
+            title_line = line[2:].strip()
+            continue
+        
+        # 解析时间范围
+        if line.startswith('时间范围：'):
+            time_range = line.replace('时间范围：', '').strip()
+            continue
+        
+        # 解析分类标题
+        if line.startswith('## 🤖 AI资讯'):
+            current_category = 'ai'
+            continue
+        elif line.startswith('## 💻 编程资讯'):
+            current_category = 'programming'
+            continue
+        
+        # 解析文章条目（以数字开头，如 "1. 标题"）
+        if re.match(r'^\d+\.\s+', line):
+            # 保存上一个文章
+            if current_article and current_category:
+                articles[current_category].append(current_article)
+            
+            # 开始新文章
+            title = re.sub(r'^\d+\.\s+', '', line).strip()
+            current_article = {
+                'title': title,
+                'summary': '',
+                'source': '',
+                'url': ''
+            }
+            continue
+        
+        # 解析文章详情
+        if current_article:
+            if line.startswith('来源：'):
+                current_article['source'] = line.replace('来源：', '').strip()
+            elif line.startswith('链接：'):
+                current_article['url'] = line.replace('链接：', '').strip()
+            elif line and not line.startswith('---') and not line.startswith('统计信息') and not line.startswith('本报告'):
+                # 摘要（不是来源、链接、分隔符的行）
+                if not current_article['summary']:
+                    current_article['summary'] = line
+    
+    # 保存最后一个文章
+    if current_article and current_category:
+        articles[current_category].append(current_article)
+    
+    # 反转列表，使最新的内容在最前面
+    articles['ai'].reverse()
+    articles['programming'].reverse()
+    
+    return title_line, time_range, articles
+
+
+def _render_weekly_article(article: dict) -> str:
+    """生成单篇周报文章卡片的HTML（单行，不含换行）"""
+    article_html = f'<div class="glass rounded-lg border border-dark-border p-4 hover:border-neon-cyan transition-all">'
+    if article['url']:
+        article_html += f'<a href="{article["url"]}" target="_blank" class="block">'
+        article_html += f'<h3 class="text-lg font-semibold text-neon-cyan hover:text-neon-purple mb-2 transition-colors">{article["title"]}</h3>'
+        article_html += '</a>'
+    else:
+        article_html += f'<h3 class="text-lg font-semibold text-gray-100 mb-2">{article["title"]}</h3>'
+    
+    if article['summary'] and article['summary'] != '暂无摘要':
+        article_html += f'<p class="text-sm text-gray-400 mb-2">{article["summary"]}</p>'
+    
+    if article['source']:
+        article_html += f'<p class="text-xs text-gray-500">来源：{article["source"]}</p>'
+    
+    article_html += '</div>'
+    return article_html
+
+
+# 周报分区显示顺序：先编程资讯，再AI资讯
+_WEEKLY_SECTIONS = (
+    ('programming', '💻 编程资讯'),
+    ('ai', '🤖 AI资讯'),
+)
+
+
+def _render_weekly_header(title_line: str, time_range: str) -> list[str]:
+    """生成周报标题和时间范围的HTML"""
+    parts = [f'<h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">{title_line}</h1>']
+    if time_range:
+        parts.append(f'<p class="text-base text-gray-400 tech-font mb-6">{time_range}</p>')
+    return parts
+
+
 @router.get("/weekly/{weekly_id}")
 async def get_weekly(weekly_id: str):
     """获取每周资讯内容"""
     try:
-        # app/presentation/routes/api.py -> app/presentation/routes -> app/presentation -> app -> 项目根目录
-        weekly_file = Path(__file__).resolve().parent.parent.parent.parent / "data" / "weekly" / f"{weekly_id}.md"
-        
-        if not weekly_file.exists():
-            raise HTTPException(status_code=404, detail="Weekly not found")
-        
-        with open(weekly_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        import re
-        lines = content.split('\n')
-        
-        # 解析文章信息
-        articles = {
-            'ai': [],  # AI资讯
-            'programming': []  # 编程资讯
-        }
-        current_category = None
-        current_article = {}
-        
-        title_line = ''
-        time_range = ''
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
-            # 解析主标题
-            if line.startswith('# '):
-                title_line = line[2:].strip()
-                continue
-            
-            # 解析时间范围
-            if line.startswith('时间范围：'):
-                time_range = line.replace('时间范围：', '').strip()
-                continue
-            
-            # 解析分类标题
-            if line.startswith('## 🤖 AI资讯'):
-                current_category = 'ai'
-                continue
-            elif line.startswith('## 💻 编程资讯'):
-                current_category = 'programming'
-                continue
-            
-            # 解析文章条目（以数字开头，如 "1. 标题"）
-            if re.match(r'^\d+\.\s+', line):
-                # 保存上一个文章
-                if current_article and current_category:
-                    articles[current_category].append(current_article)
-                
-                # 开始新文章
-                title = re.sub(r'^\d+\.\s+', '', line).strip()
-                current_article = {
-                    'title': title,
-                    'summary': '',
-                    'source': '',
-                    'url': ''
-                }
-                continue
-            
-            # 解析文章详情
-            if current_article:
-                if line.startswith('来源：'):
-                    current_article['source'] = line.replace('来源：', '').strip()
-                elif line.startswith('链接：'):
-                    current_article['url'] = line.replace('链接：', '').strip()
-                elif line and not line.startswith('---') and not line.startswith('统计信息') and not line.startswith('本报告'):
-                    # 摘要（不是来源、链接、分隔符的行）
-                    if not current_article['summary']:
-                        current_article['summary'] = line
-        
-        # 保存最后一个文章
-        if current_article and current_category:
-            articles[current_category].append(current_article)
-        
-        # 反转列表，使最新的内容在最前面
-        articles['ai'].reverse()
-        articles['programming'].reverse()
+        title_line, time_range, articles = _parse_weekly(weekly_id)
         
         # 生成HTML
-        html_parts = []
-        
-        # 标题和时间
-        html_parts.append(f'<h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">{title_line}</h1>')
-        if time_range:
-            html_parts.append(f'<p class="text-base text-gray-400 tech-font mb-6">{time_range}</p>')
-        
-        # 先显示编程资讯
-        if articles['programming']:
-            html_parts.append('<h2 class="text-2xl font-bold text-gray-100 mb-4 mt-8">💻 编程资讯</h2>')
-            html_parts.append('<div class="space-y-4 mb-8">')
-            for article in articles['programming']:
-                article_html = '<div class="glass rounded-lg border border-dark-border p-4 hover:border-neon-cyan transition-all">'
-                if article['url']:
-                    article_html += f'<a href="{article["url"]}" target="_blank" class="block">'
-                    article_html += f'<h3 class="text-lg font-semibold text-neon-cyan hover:text-neon-purple mb-2 transition-colors">{article["title"]}</h3>'
-                    article_html += '</a>'
-                else:
-                    article_html += f'<h3 class="text-lg font-semibold text-gray-100 mb-2">{article["title"]}</h3>'
-                
-                if article['summary'] and article['summary'] != '暂无摘要':
-                    article_html += f'<p class="text-sm text-gray-400 mb-2">{article["summary"]}</p>'
-                
-                if article['source']:
-                    article_html += f'<p class="text-xs text-gray-500">来源：{article["source"]}</p>'
-                
-                article_html += '</div>'
-                html_parts.append(article_html)
-            html_parts.append('</div>')
-        
-        # 再显示AI资讯
-        if articles['ai']:
-            html_parts.append('<h2 class="text-2xl font-bold text-gray-100 mb-4 mt-8">🤖 AI资讯</h2>')
-            html_parts.append('<div class="space-y-4 mb-8">')
-            for article in articles['ai']:
-                article_html = '<div class="glass rounded-lg border border-dark-border p-4 hover:border-neon-cyan transition-all">'
-                if article['url']:
-                    article_html += f'<a href="{article["url"]}" target="_blank" class="block">'
-                    article_html += f'<h3 class="text-lg font-semibold text-neon-cyan hover:text-neon-purple mb-2 transition-colors">{article["title"]}</h3>'
-                    article_html += '</a>'
-                else:
-                    article_html += f'<h3 class="text-lg font-semibold text-gray-100 mb-2">{article["title"]}</h3>'
-                
-                if article['summary'] and article['summary'] != '暂无摘要':
-                    article_html += f'<p class="text-sm text-gray-400 mb-2">{article["summary"]}</p>'
-                
-                if article['source']:
-                    article_html += f'<p class="text-xs text-gray-500">来源：{article["source"]}</p>'
-                
-                article_html += '</div>'
-                html_parts.append(article_html)
-            html_parts.append('</div>')
+        html_parts = _render_weekly_header(title_line, time_range)
+        
+        for key, heading in _WEEKLY_SECTIONS:
+            if articles[key]:
+                html_parts.append(f'<h2 class="text-2xl font-bold text-gray-100 mb-4 mt-8">{heading}</h2>')
+                html_parts.append('<div class="space-y-4 mb-8">')
+                for article in articles[key]:
+                    html_parts.append(_render_weekly_article(article))
+                html_parts.append('</div>')
         
         html_content = '\n'.join(html_parts)
         
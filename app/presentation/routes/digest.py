@@ -1,20 +1,28 @@
-import math
+import asyncio
+import codecs
+import gzip
+import hashlib
+import hmac
 import os
 import re
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import date, datetime
+from functools import partial
+from typing import Annotated, Any, Optional
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 from dataclasses import asdict
-from fastapi import APIRouter, Depends, Header, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from ...config_loader import (
     load_digest_schedule,
     load_crawler_keywords,
+    load_raw_crawler_keywords,
     save_crawler_keywords,
     save_digest_schedule,
     load_wecom_template,
@@ -28,11 +36,11 @@ from ...config_loader import (
 from ...infrastructure.notifiers.wecom import build_wecom_digest_markdown, send_markdown_to_wecom
 from ...infrastructure.notifiers.wechat_mp import WeChatMPClient
 from ...domain.sources.ai_articles import (
+    apply_article_changes,
+    article_url_exists,
     clear_articles,
-    delete_article_from_config,
     get_all_articles,
     pick_daily_ai_articles,
-    save_article_to_config,
     todays_theme,
 )
 from ...domain.sources.article_sources import fetch_from_all_sources
@@ -43,9 +51,14 @@ from ...domain.sources.article_crawler import fetch_article_info
 from ...infrastructure.crawlers.sogou_wechat import search_articles_by_keyword
 from ...infrastructure.crawlers.devmaster import fetch_tools_from_api
 from ...domain.sources.ai_candidates import (
+    CandidateArticle,
     add_candidates_to_pool,
+    candidate_pool_has_items,
+    candidates_from_items,
     clear_candidate_pool,
+    load_candidate_items,
     load_candidate_pool,
+    merge_candidates,
     promote_candidates_to_articles,
     save_candidate_pool,
 )
@@ -54,16 +67,24 @@ from ...domain.sources.tool_candidates import (
     save_candidate_pool as save_tool_candidate_pool,
     CandidateTool,
 )
-from ...services.weekly_digest import update_weekly_digest
+from ...services.data_loader import DataLoader
+from ...services.database_data_service import DatabaseDataService
+from ...services.database_write_service import DatabaseWriteService
+from ...services.digest_service import digest_items
+from ...services.weekly_digest import delete_article_from_weekly, update_weekly_digest
 from ...services.weekly_backup_service import WeeklyBackupService
-import json
+from ..encoding import accepts_gzip
 from pathlib import Path
+from urllib.parse import urlparse
 
-router = APIRouter()
+# JSON 接口默认用 orjson 序列化
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # 管理员授权码从环境变量中读取，避免敏感信息写死在代码里
 ADMIN_CODE = os.getenv("AICODING_ADMIN_CODE")
+# 预先编码，校验时用常量时间比较，避免按字符提前返回泄露授权码
+_ADMIN_CODE_BYTES = ADMIN_CODE.encode("utf-8") if ADMIN_CODE else None
 
 
 def _require_admin(x_admin_code: Optional[str] = Header(default=None)) -> None:
@@ -75,19 +96,44 @@ def _require_admin(x_admin_code: Optional[str] = Header(default=None)) -> None:
     - 如果环境变量未配置，则不启用认证（用于本地开发）
     """
     # 未配置管理员授权码：认为处于开发/测试环境，不做校验
-    if not ADMIN_CODE:
+    if _ADMIN_CODE_BYTES is None:
         return
 
-    if x_admin_code != ADMIN_CODE:
+    if not x_admin_code or not hmac.compare_digest(x_admin_code.encode("utf-8"), _ADMIN_CODE_BYTES):
         raise HTTPException(status_code=403, detail="无权限：缺少或错误的授权码")
 
 
+# 文章URL：由 pydantic 去除首尾空白并校验非空、长度上限，空URL直接返回 422
+ArticleUrl = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=4096)]
+
+
+# 批量增删一次最多处理的URL数量，超出返回 422
+_MAX_BATCH_URLS = 50
+
+
 class AddArticleRequest(BaseModel):
-    url: str
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    url: ArticleUrl
+
+
+class AddArticlesRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    urls: list[ArticleUrl] = Field(max_length=_MAX_BATCH_URLS)
 
 
 class DeleteArticleRequest(BaseModel):
-    url: str
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    url: ArticleUrl
+
+
+class DeleteArticlesRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    urls: list[ArticleUrl] = Field(max_length=_MAX_BATCH_URLS)
+
 
 class ArchiveArticleFromPoolRequest(BaseModel):
     url: str
@@ -122,24 +168,122 @@ def _clear_content_pools() -> None:
     clear_candidate_pool()
 
 
-def _build_digest():
-    now = datetime.now()
-    schedule = load_digest_schedule()
-    articles = pick_daily_ai_articles(k=schedule.count)
-
-    items = [
-        {
-            "title": a.title,
-            "url": a.url,
-            "source": a.source,
-            "summary": a.summary,
-        }
-        for a in articles
-    ]
+# 文章池写入合并：短时间内的多次增删合并成一批，只读写一次 ai_articles.json
+_ARTICLE_WRITE_WINDOW = 0.05  # 秒
+_ARTICLE_WRITE_BATCH_SIZE = 32
+_article_write_queue: list[tuple[list[tuple[str, Any]], asyncio.Future]] = []
+# 所有改写 ai_articles.json 的路由都要持有这把锁
+_article_write_lock = asyncio.Lock()
+
+# 候选池的读改写（抓取、采纳、忽略、归档、清空）共用一把锁，避免并发请求各自保存旧副本、互相覆盖
+# 需要同时持有两把锁时固定先拿文章池锁，再拿候选池锁
+_candidate_pool_lock = asyncio.Lock()
+
+
+def _finish_article_batch(batch: list[tuple[list[tuple[str, Any]], asyncio.Future]], write: asyncio.Future) -> None:
+    """线程写入结束后把结果分发给同批的每个请求，并释放文章池写锁"""
+    try:
+        if write.cancelled():
+            error: Optional[BaseException] = RuntimeError("文章池写入被取消")
+        else:
+            error = write.exception()
+        offset = 0
+        for changes, future in batch:
+            if not future.done():
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(write.result()[offset:offset + len(changes)])
+            offset += len(changes)
+    finally:
+        _article_write_lock.release()
+
+
+async def _queue_article_changes(changes: list[tuple[str, Any]]) -> list[bool]:
+    """
+    提交一组文章池增删（"add" + 文章字典，或 "delete" + URL），返回每个操作是否成功。
+
+    第一个拿到锁的请求等待一个很短的窗口收集其他请求，然后在线程池中批量写入；
+    排在后面的请求拿到锁时若结果已经写好，直接返回。
+    写入完成后由回调分发结果并释放锁，持锁的请求中途被取消时同批的其他请求仍能拿到结果。
+    """
+    future = asyncio.get_running_loop().create_future()
+    entry = (changes, future)
+    _article_write_queue.append(entry)
+    try:
+        await _article_write_lock.acquire()
+    except BaseException:
+        # 等锁时被取消：撤回尚未写入的操作
+        if entry in _article_write_queue:
+            _article_write_queue.remove(entry)
+        raise
+
+    if future.done():
+        _article_write_lock.release()
+        return future.result()
+
+    try:
+        await asyncio.sleep(_ARTICLE_WRITE_WINDOW)
+    except BaseException:
+        if entry in _article_write_queue:
+            _article_write_queue.remove(entry)
+        _article_write_lock.release()
+        raise
+
+    # 至少取一个请求，之后按操作数量凑满一批
+    batch = []
+    count = 0
+    while _article_write_queue and (not batch or count + len(_article_write_queue[0][0]) <= _ARTICLE_WRITE_BATCH_SIZE):
+        queued = _article_write_queue.pop(0)
+        batch.append(queued)
+        count += len(queued[0])
+    write = asyncio.ensure_future(asyncio.to_thread(
+        apply_article_changes, [change for queued_changes, _ in batch for change in queued_changes]
+    ))
+    write.add_done_callback(partial(_finish_article_batch, batch))
+    return await future
+
+
+async def _queue_article_change(action: str, value: Any) -> bool:
+    """提交一次文章池增删，返回是否成功"""
+    return (await _queue_article_changes([(action, value)]))[0]
+
+
+async def _clear_content_pools_locked() -> None:
+    """持有文章池与候选池的写锁，在线程池中清空两个池子"""
+    async with _article_write_lock, _candidate_pool_lock:
+        await asyncio.to_thread(_clear_content_pools)
+
+
+# 当天日期与主题缓存：(YYYY-MM-DD, 日序号, 主题)，跨天时重新生成
+_today_cache: tuple[str, int, str] = ("", 0, "")
+
+
+def _today_date_and_theme() -> tuple[str, str]:
+    """返回当天的日期字符串和主题，跨天时才重新生成"""
+    global _today_cache
+    ordinal = date.today().toordinal()
+    if _today_cache[1] != ordinal:
+        today = date.fromordinal(ordinal)
+        _today_cache = (today.isoformat(), ordinal, todays_theme(datetime(today.year, today.month, today.day)))
+    return _today_cache[0], _today_cache[2]
+
+
+def _build_digest(schedule=None, articles=None):
+    """
+    组装日报内容；调用方已加载配置或已选好文章时可直接传入，避免重复读取和重新抽样。
+    """
+    if schedule is None:
+        schedule = load_digest_schedule()
+    if articles is None:
+        articles = pick_daily_ai_articles(k=schedule.count)
+
+    items = digest_items(articles)
+    date_str, theme = _today_date_and_theme()
 
     digest = {
-        "date": now.strftime("%Y-%m-%d"),
-        "theme": todays_theme(now),
+        "date": date_str,
+        "theme": theme,
         "schedule": {
             "hour": schedule.hour,
             "minute": schedule.minute,
@@ -151,45 +295,88 @@ def _build_digest():
     return digest
 
 
+def _build_digest_and_markdown(schedule, articles) -> tuple[dict, str]:
+    """
+    组装日报内容，并用同一份条目列表生成企业微信 markdown，
+    供推送接口在一次线程池调用中拿到两者。
+    """
+    digest = _build_digest(schedule, articles)
+    content = build_wecom_digest_markdown(
+        date_str=digest["date"],
+        theme=digest["theme"],
+        items=digest["articles"],
+    )
+    return digest, content
+
+
 @router.get("/preview")
 async def preview_digest(admin: None = Depends(_require_admin)):
     """
     返回当前配置下将要推送的日报内容（不真正发送）。
     """
-    digest = _build_digest()
-    return digest
+    # 读取配置和文章池是同步文件 I/O，放到线程池中执行，避免阻塞事件循环
+    digest = await asyncio.to_thread(_build_digest)
+    # 每次预览都从文章池随机抽样，内容几乎每次都不同，不做 ETag 协商
+    # 内容只含基础类型，直接返回响应，跳过 jsonable_encoder 遍历
+    return ORJSONResponse(digest)
+
+
+async def _send_digest_in_background(content: str) -> None:
+    """后台发送日报到企业微信，成功后清理文章池和候选池；失败只记录日志"""
+    try:
+        success = await send_markdown_to_wecom(content)
+        if not success:
+            logger.error("[手动推送] 后台推送失败")
+            return
+        logger.info("[手动推送] 后台推送成功，正在清理文章池和候选池...")
+        await _clear_content_pools_locked()
+        logger.info("[手动推送] 手动推送任务执行成功")
+    except Exception:
+        logger.exception("[手动推送] 后台推送任务执行失败")
 
 
 @router.post("/trigger")
-async def trigger_digest(admin: None = Depends(_require_admin)):
+async def trigger_digest(
+    background_tasks: BackgroundTasks,
+    wait: bool = True,
+    admin: None = Depends(_require_admin),
+):
     """
     手动触发一次企业微信推送，并返回本次发送的内容。
+
+    Args:
+        wait: 为 False 时不等待企业微信接口返回，组装好内容后放到后台发送，
+            立即返回 queued=True；推送结果只记录在日志中
     """
     try:
         logger.info("[手动推送] 开始执行手动推送任务")
-        schedule = load_digest_schedule()
-        articles = pick_daily_ai_articles(k=schedule.count)
+        # 配置与文章池的读写都是同步文件 I/O，放到线程池中执行，避免阻塞事件循环
+        schedule = await asyncio.to_thread(load_digest_schedule)
+        articles = await asyncio.to_thread(pick_daily_ai_articles, k=schedule.count)
         
         # 如果文章池为空，尝试从候选池提升
         if not articles:
             logger.info("[手动推送] 文章池为空，尝试从候选池提升文章...")
-            promoted = promote_candidates_to_articles(per_keyword=2)
+            # 提升会同时改写文章池和候选池
+            async with _article_write_lock, _candidate_pool_lock:
+                promoted = await asyncio.to_thread(promote_candidates_to_articles, per_keyword=2)
             if promoted:
                 logger.info(f"[手动推送] 从候选池提升了 {promoted} 篇文章")
-                articles = pick_daily_ai_articles(k=schedule.count)
+                articles = await asyncio.to_thread(pick_daily_ai_articles, k=schedule.count)
         
         if not articles:
             logger.warning("[手动推送] 文章池为空且无法从候选池提升文章")
             raise HTTPException(status_code=400, detail="文章池为空，请先添加或抓取文章。")
 
-        digest = _build_digest()
-        content = build_wecom_digest_markdown(
-            date_str=digest["date"],
-            theme=digest["theme"],
-            items=digest["articles"],
-        )
+        # 直接使用上面选好的文章组装日报和推送内容，避免再次读取配置并重新抽样
+        digest, content = await asyncio.to_thread(_build_digest_and_markdown, schedule, articles)
         
         logger.info(f"[手动推送] 准备推送 {len(digest['articles'])} 篇文章")
+        if not wait:
+            logger.info("[手动推送] 已转入后台发送到企业微信群")
+            background_tasks.add_task(_send_digest_in_background, content)
+            return ORJSONResponse({"ok": True, "queued": True, **digest}, background=background_tasks)
+
         logger.info("[手动推送] 正在发送到企业微信群...")
         success = await send_markdown_to_wecom(content)
         
@@ -198,9 +385,9 @@ async def trigger_digest(admin: None = Depends(_require_admin)):
             raise HTTPException(status_code=500, detail="推送失败，请检查企业微信配置和网络连接。")
         
         logger.info("[手动推送] 推送成功，正在清理文章池和候选池...")
-        _clear_content_pools()
+        await _clear_content_pools_locked()
         logger.info("[手动推送] 手动推送任务执行成功")
-        return {"ok": True, **digest}
+        return ORJSONResponse({"ok": True, **digest})
     except HTTPException:
         raise
     except Exception as e:
@@ -208,17 +395,9 @@ async def trigger_digest(admin: None = Depends(_require_admin)):
         raise HTTPException(status_code=500, detail=f"推送失败: {str(e)}")
 
 
-@router.get("/articles")
-async def list_all_articles(admin: None = Depends(_require_admin)):
-    """
-    获取配置文件中所有文章列表，并检查归档状态。
-    
-    Returns:
-        dict: 包含所有文章的列表，每个文章包含 is_archived 字段
-    """
-    from ...services.data_loader import DataLoader
-    
-    articles = get_all_articles()
+async def _articles_with_archive_status() -> list[dict]:
+    """获取文章池中所有文章，并为每篇文章加上 is_archived 字段"""
+    articles = await asyncio.to_thread(get_all_articles)
     
     # 检查每篇文章的归档状态
     articles_with_status = []
@@ -230,11 +409,93 @@ async def list_all_articles(admin: None = Depends(_require_admin)):
             "summary": article.summary if hasattr(article, 'summary') else article.get("summary", ""),
         }
         # 检查归档状态
-        from ...services.database_data_service import DatabaseDataService
         article_dict["is_archived"] = await DatabaseDataService.is_article_archived(article_dict.get("url", ""))
         articles_with_status.append(article_dict)
+    return articles_with_status
+
+
+def _etag_json_response(content: dict, if_none_match: Optional[str]) -> Response:
+    """
+    序列化 JSON 并以内容哈希作为 ETag；客户端已有相同版本时返回 304，不再传输内容。
+
+    列表中的 is_archived 来自数据库，不随文章池文件变化，所以 ETag 按响应内容计算而不是按文件修改时间。
+    Cache-Control: no-cache 让浏览器每次都带 If-None-Match 重新验证，收到 304 时直接使用缓存。
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/articles")
+async def list_all_articles(
+    if_none_match: Optional[str] = Header(default=None),
+    admin: None = Depends(_require_admin),
+):
+    """
+    获取配置文件中所有文章列表，并检查归档状态。
     
-    return {"ok": True, "articles": articles_with_status}
+    Returns:
+        dict: 包含所有文章的列表，每个文章包含 is_archived 字段；内容未变化时返回 304
+    """
+    articles_with_status = await _articles_with_archive_status()
+    return _etag_json_response({"ok": True, "articles": articles_with_status}, if_none_match)
+
+
+@router.get("/bootstrap")
+async def panel_bootstrap(admin: None = Depends(_require_admin)):
+    """
+    管理面板首屏数据：一次返回文章池列表（同 /articles）、日报预览（同 /preview）
+    和按关键词分组的候选池（同 /candidates），三部分并发获取，减少请求往返。
+    """
+    preview, articles_with_status, grouped_candidates = await asyncio.gather(
+        asyncio.to_thread(_build_digest),
+        _articles_with_archive_status(),
+        _grouped_candidates(),
+    )
+    return ORJSONResponse({
+        "ok": True,
+        "articles": articles_with_status,
+        "preview": preview,
+        "grouped_candidates": grouped_candidates,
+    })
+
+
+# 按域名限速爬取文章：同一域名串行请求，相邻两次至少间隔 1.5 秒，避免触发反爬
+_FETCH_MIN_INTERVAL = 1.5  # 秒
+_host_locks: dict[str, asyncio.Lock] = {}
+_host_last_fetch: dict[str, float] = {}
+
+
+def _prune_idle_hosts(now: float) -> None:
+    """丢弃锁空闲且距上次爬取已超过限速间隔的域名，避免两个字典随访问过的域名无限增长"""
+    for host, lock in list(_host_locks.items()):
+        if not lock.locked() and now - _host_last_fetch.get(host, float("-inf")) >= _FETCH_MIN_INTERVAL:
+            del _host_locks[host]
+            _host_last_fetch.pop(host, None)
+
+
+async def _fetch_article_info_throttled(url: str, limiter: Optional[asyncio.Semaphore] = None) -> dict:
+    """
+    按域名限速调用 fetch_article_info。
+
+    limiter 为批量爬取时的全局并发上限，在轮到该域名后才占用，避免排队中的同域名请求占满并发名额。
+    """
+    host = urlparse(url).netloc.lower()
+    _prune_idle_hosts(time.monotonic())
+    async with _host_locks.setdefault(host, asyncio.Lock()):
+        wait = _FETCH_MIN_INTERVAL - (time.monotonic() - _host_last_fetch.get(host, float("-inf")))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            if limiter is None:
+                return await fetch_article_info(url)
+            async with limiter:
+                return await fetch_article_info(url)
+        finally:
+            _host_last_fetch[host] = time.monotonic()
 
 
 @router.post("/add-article")
@@ -248,17 +509,23 @@ async def add_article(request: AddArticleRequest, admin: None = Depends(_require
     Returns:
         dict: 包含成功状态和文章信息的响应
     """
-    url = request.url.strip()
-    if not url:
-        raise HTTPException(status_code=400, detail="URL不能为空")
+    url = request.url
+    
+    # 文章池中已有该URL时直接返回，不再发起爬取；爬取后保存时仍会再次去重
+    if await asyncio.to_thread(article_url_exists, url):
+        return {
+            "ok": False,
+            "message": "文章已存在",
+            "article": None,
+        }
     
     try:
         # 爬取文章信息
-        logger.info(f"开始爬取文章信息: {url}")
-        article_info = await fetch_article_info(url)
+        logger.info("开始爬取文章信息: {}", url)
+        article_info = await _fetch_article_info_throttled(url)
         
         # 保存到配置文件
-        success = save_article_to_config(article_info)
+        success = await _queue_article_change("add", article_info)
         if not success:
             # 如果保存失败，可能是文章已存在
             return {
@@ -273,38 +540,117 @@ async def add_article(request: AddArticleRequest, admin: None = Depends(_require
             "article": article_info,
         }
     except Exception as e:
-        logger.error(f"添加文章失败: {e}")
+        logger.error("添加文章失败: {}", e)
         raise HTTPException(status_code=500, detail=f"添加文章失败: {str(e)}")
 
 
+# 批量添加文章时同时爬取的URL数量上限
+_ADD_ARTICLES_CONCURRENCY = 5
+
+
+@router.post("/add-articles")
+async def add_articles(request: AddArticlesRequest, admin: None = Depends(_require_admin)):
+    """
+    批量从URL爬取文章信息并添加到配置文件中。
+    已在文章池中的URL直接报告为已存在，不发起爬取；
+    其余最多同时爬取 5 个URL（同一域名按间隔串行），爬取成功的文章一次写入文章池。
+    
+    Args:
+        request: 包含文章URL列表的请求体
+        
+    Returns:
+        dict: 包含成功状态和每个URL处理结果的响应
+    """
+    # URL 已由请求模型去除首尾空白并校验非空，这里只去除重复URL，保持原有顺序
+    urls = list(dict.fromkeys(request.urls))
+    if not urls:
+        raise HTTPException(status_code=400, detail="URL列表不能为空")
+    
+    # 文章池中已有的URL不再爬取；一次线程调用判断全部URL，爬取后保存时仍会再次去重
+    exists = await asyncio.to_thread(lambda: [article_url_exists(url) for url in urls])
+    to_fetch = [url for url, existed in zip(urls, exists) if not existed]
+    semaphore = asyncio.Semaphore(_ADD_ARTICLES_CONCURRENCY)
+    
+    try:
+        logger.info(f"开始批量爬取文章信息: {len(to_fetch)} 个URL（{len(urls) - len(to_fetch)} 个已存在）")
+        fetched = dict(zip(to_fetch, await asyncio.gather(
+            *(_fetch_article_info_throttled(url, semaphore) for url in to_fetch),
+            return_exceptions=True,
+        )))
+        
+        articles = [info for info in fetched.values() if not isinstance(info, BaseException)]
+        # 与单篇增删走同一个写入队列，避免并发读改写时丢失对方的修改
+        saved = iter(await _queue_article_changes([("add", info) for info in articles]) if articles else [])
+        
+        results = []
+        added_count = 0
+        for url in urls:
+            if url not in fetched:
+                results.append({"url": url, "ok": False, "message": "文章已存在", "article": None})
+                continue
+            info = fetched[url]
+            if isinstance(info, BaseException):
+                logger.error(f"爬取文章失败 {url}: {info}")
+                results.append({"url": url, "ok": False, "message": f"爬取失败: {info}"})
+            elif next(saved):
+                added_count += 1
+                results.append({"url": url, "ok": True, "message": "已添加", "article": info})
+            else:
+                results.append({"url": url, "ok": False, "message": "文章已存在或保存失败", "article": info})
+        
+        return {
+            "ok": added_count > 0,
+            "message": f"已添加 {added_count}/{len(urls)} 篇文章",
+            "results": results,
+        }
+    except Exception as e:
+        logger.error(f"批量添加文章失败: {e}")
+        raise HTTPException(status_code=500, detail=f"批量添加文章失败: {str(e)}")
+
+
 @router.get("/candidates")
-async def list_candidate_articles(admin: None = Depends(_require_admin)):
-    """获取所有待审核的文章列表，并按关键词分组"""
-    candidates = load_candidate_pool()
+async def list_candidate_articles(
+    if_none_match: Optional[str] = Header(default=None),
+    admin: None = Depends(_require_admin),
+):
+    """获取所有待审核的文章列表，并按关键词分组；内容未变化时返回 304"""
+    grouped_candidates = await _grouped_candidates()
+    return _etag_json_response({"ok": True, "grouped_candidates": grouped_candidates}, if_none_match)
+
+
+async def _grouped_candidates() -> dict[str, list[dict]]:
+    """获取候选池中所有文章，按关键词分组，并为每篇文章加上 is_archived 字段"""
+    # 候选池读取是同步文件 I/O，放到线程池中执行，避免阻塞事件循环
+    candidates = await asyncio.to_thread(load_candidate_pool)
     logger.info(f"Endpoint /candidates: Found {len(candidates)} candidates in the pool.")
 
-    # 检查归档状态
-    from ...services.data_loader import DataLoader
-    
-    grouped_candidates = {}
+    grouped_candidates: dict[str, list[dict]] = {}
     for candidate in candidates:
         # crawled_from format is "sogou_wechat:KEYWORD"
-        try:
-            source_parts = candidate.crawled_from.split(":", 1)
-            keyword = source_parts[1] if len(source_parts) > 1 else "未知来源"
-        except AttributeError:
-            keyword = "未知来源"
-
-        if keyword not in grouped_candidates:
-            grouped_candidates[keyword] = []
+        keyword = (candidate.crawled_from or "").partition(":")[2] or "未知来源"
         
+        candidate_dict = candidate.__dict__.copy()
         # 检查是否已归档
-        candidate_dict = asdict(candidate)
-        from ...services.database_data_service import DatabaseDataService
         candidate_dict["is_archived"] = await DatabaseDataService.is_article_archived(candidate.url)
-        grouped_candidates[keyword].append(candidate_dict)
+        grouped_candidates.setdefault(keyword, []).append(candidate_dict)
+
+    return grouped_candidates
+
 
-    return {"ok": True, "grouped_candidates": grouped_candidates}
+def _find_candidate_index(candidates: list[CandidateArticle], url: str) -> Optional[int]:
+    """返回候选池中第一篇 URL 匹配的文章下标，找到即停止扫描；不存在时返回 None"""
+    return next((i for i, c in enumerate(candidates) if c.url == url), None)
+
+
+async def _load_candidates_containing(url: str) -> list[CandidateArticle]:
+    """
+    加载候选池；先在原始字典上查找URL，找不到时直接返回空列表，
+    不再为整个候选池构造 CandidateArticle。
+    """
+    items = await asyncio.to_thread(load_candidate_items)
+    if not any(item.get("url") == url for item in items if isinstance(item, dict)):
+        return []
+    return candidates_from_items(items)
 
 
 @router.post("/accept-candidate")
@@ -327,72 +673,64 @@ async def accept_candidate(request: CandidateActionRequest, admin: None = Depend
     if not url:
         raise HTTPException(status_code=400, detail="URL不能为空")
 
-    candidates = load_candidate_pool()
-    
-    article_to_accept = None
-    remaining_candidates = []
-    is_tool_related = False
-    candidate_to_accept = None
-    
-    for candidate in candidates:
-        if candidate.url == url:
-            candidate_to_accept = candidate
-            # 自动从 crawled_from 中提取工具名称（如果是工具相关资讯）
-            tool_tags = []
-            if candidate.crawled_from and candidate.crawled_from.startswith("tool_keyword:"):
-                is_tool_related = True
-                tool_name = candidate.crawled_from.replace("tool_keyword:", "").strip()
-                if tool_name:
-                    tool_tags.append(tool_name)
-            
-            article_to_accept = {
-                "title": candidate.title,
-                "url": candidate.url,
-                "source": "100kwhy",  # 爬取的资讯统一使用"100kwhy"作为来源
-                "summary": candidate.summary or "",
-                "tool_tags": tool_tags,  # 添加工具标签，用于工具详情页关联
-            }
-        else:
-            remaining_candidates.append(candidate)
-
-    if not article_to_accept:
-        raise HTTPException(status_code=404, detail="在候选池中未找到该文章")
+    # 从读取到保存（工具资讯还包括归档失败时的恢复）期间持有候选池锁
+    async with _candidate_pool_lock:
+        candidates = await _load_candidates_containing(url)
+        index = _find_candidate_index(candidates, url)
+        if index is None:
+            raise HTTPException(status_code=404, detail="在候选池中未找到该文章")
+        candidate_to_accept = candidates.pop(index)
+    
+        # 自动从 crawled_from 中提取工具名称（如果是工具相关资讯）
+        is_tool_related = False
+        tool_tags = []
+        if candidate_to_accept.crawled_from and candidate_to_accept.crawled_from.startswith("tool_keyword:"):
+            is_tool_related = True
+            tool_name = candidate_to_accept.crawled_from.replace("tool_keyword:", "").strip()
+            if tool_name:
+                tool_tags.append(tool_name)
+    
+        article_to_accept = {
+            "title": candidate_to_accept.title,
+            "url": candidate_to_accept.url,
+            "source": "100kwhy",  # 爬取的资讯统一使用"100kwhy"作为来源
+            "summary": candidate_to_accept.summary or "",
+            "tool_tags": tool_tags,  # 添加工具标签，用于工具详情页关联
+        }
 
-    # 1. 从候选池中移除
-    save_candidate_pool(remaining_candidates)
-    
-    # 2. 根据资讯来源类型进行不同处理
-    from ...services.data_loader import DataLoader
-    
-    if is_tool_related:
-        # 工具关键字爬取的资讯：归档到编程资讯（programming.json）
-        # 注意：工具关键字资讯只能手动触发爬取，采纳后只归档到编程资讯，不进入推送列表
-        # category="programming" -> 文件: programming.json -> UI显示: "编程资讯"
-        from ...services.database_write_service import DatabaseWriteService
-        success = await DatabaseWriteService.archive_article_to_category(
-            article_to_accept, 
-            category="programming",  # Category值，对应文件: programming.json
-            tool_tags=article_to_accept.get("tool_tags", [])
-        )
-        if not success:
-            # 如果归档失败，恢复候选池
-            remaining_candidates.append(candidate_to_accept)
-            save_candidate_pool(candidates)
-            raise HTTPException(status_code=500, detail="归档文章失败")
+        # 1. 从候选池中移除
+        await asyncio.to_thread(save_candidate_pool, candidates)
+    
+        # 2. 根据资讯来源类型进行不同处理
+        if is_tool_related:
+            # 工具关键字爬取的资讯：归档到编程资讯（programming.json）
+            # 注意：工具关键字资讯只能手动触发爬取，采纳后只归档到编程资讯，不进入推送列表
+            # category="programming" -> 文件: programming.json -> UI显示: "编程资讯"
+            success = await DatabaseWriteService.archive_article_to_category(
+                article_to_accept, 
+                category="programming",  # Category值，对应文件: programming.json
+                tool_tags=article_to_accept.get("tool_tags", [])
+            )
+            if not success:
+                # 如果归档失败，恢复候选池
+                candidates.insert(index, candidate_to_accept)
+                await asyncio.to_thread(save_candidate_pool, candidates)
+                raise HTTPException(status_code=500, detail="归档文章失败")
         
-        # 注意：update_weekly_digest() 已在 archive_article_to_category() 中自动调用
+            # 注意：update_weekly_digest() 已在 archive_article_to_category() 中自动调用
         
-        return {"ok": True, "message": "文章已成功归档到编程资讯。"}
-    else:
-        # 推送定时爬取的资讯：添加到推送列表（ai_articles.json）
-        # 注意：推送定时爬取的资讯采纳后只进入推送列表，不自动归档
-        # 如需归档到资讯模块，请使用 archive-candidate API
-        success = save_article_to_config(article_to_accept)
-        if not success:
-            # 如果添加失败（比如已存在），也算操作成功，只是不做添加
-            logger.warning(f"Article already exists in main pool, but accepting from candidate: {url}")
-            return {"ok": True, "message": "文章已存在于正式池中，已从候选池移除。"}
-        return {"ok": True, "message": "文章已成功采纳到正式池。"}
+            return {"ok": True, "message": "文章已成功归档到编程资讯。"}
+
+    # 推送定时爬取的资讯：添加到推送列表（ai_articles.json）
+    # 注意：推送定时爬取的资讯采纳后只进入推送列表，不自动归档
+    # 如需归档到资讯模块，请使用 archive-candidate API
+    # 释放候选池锁后再写文章池，与先文章池后候选池的加锁顺序不冲突
+    success = await _queue_article_change("add", article_to_accept)
+    if not success:
+        # 如果添加失败（比如已存在），也算操作成功，只是不做添加
+        logger.warning(f"Article already exists in main pool, but accepting from candidate: {url}")
+        return {"ok": True, "message": "文章已存在于正式池中，已从候选池移除。"}
+    return {"ok": True, "message": "文章已成功采纳到正式池。"}
 
 
 @router.post("/reject-candidate")
@@ -402,15 +740,14 @@ async def reject_candidate(request: CandidateActionRequest, admin: None = Depend
     if not url:
         raise HTTPException(status_code=400, detail="URL不能为空")
 
-    candidates = load_candidate_pool()
-    
-    original_count = len(candidates)
-    remaining_candidates = [c for c in candidates if c.url != url]
-
-    if len(remaining_candidates) == original_count:
-        raise HTTPException(status_code=404, detail="在候选池中未找到该文章")
+    async with _candidate_pool_lock:
+        candidates = await _load_candidates_containing(url)
+        index = _find_candidate_index(candidates, url)
+        if index is None:
+            raise HTTPException(status_code=404, detail="在候选池中未找到该文章")
+        del candidates[index]
 
-    save_candidate_pool(remaining_candidates)
+        await asyncio.to_thread(save_candidate_pool, candidates)
     
     return {"ok": True, "message": "文章已成功从候选池中忽略。"}
 
@@ -445,7 +782,8 @@ async def archive_candidate(request: ArchiveArticleRequest, admin: None = Depend
     if category not in valid_categories:
         raise HTTPException(status_code=400, detail=f"无效的分类，支持的分类：{', '.join(valid_categories)}")
     
-    candidates = load_candidate_pool()
+    async with _candidate_pool_lock:
+        candidates = await asyncio.to_thread(load_candidate_pool)
     
     # 查找要归档的文章（不删除，保留在候选池中）
     article_to_archive = None
@@ -480,8 +818,6 @@ async def archive_candidate(request: ArchiveArticleRequest, admin: None = Depend
         raise HTTPException(status_code=404, detail="在候选池中未找到该文章")
     
     # 使用DataLoader归档文章
-    from ...services.data_loader import DataLoader
-    from ...services.database_write_service import DatabaseWriteService
     success = await DatabaseWriteService.archive_article_to_category(article_to_archive, category, tool_tags)
     
     if not success:
@@ -538,9 +874,6 @@ async def accept_tool_candidate(request: dict, admin: None = Depends(_require_ad
         save_tool_candidate_pool(remaining_candidates)
         
         # 2. 添加到正式工具池
-        from ...services.data_loader import DataLoader
-        from datetime import datetime
-        
         # 生成工具ID（使用时间戳）
         tool_id = int(datetime.now().timestamp() * 1000) % 1000000
         
@@ -560,7 +893,6 @@ async def accept_tool_candidate(request: dict, admin: None = Depends(_require_ad
         }
         
         # 保存到对应的分类文件
-        from ...services.database_write_service import DatabaseWriteService
         success = await DatabaseWriteService.archive_tool_to_category(tool_data, category or tool_to_accept.category)
         
         if not success:
@@ -622,8 +954,6 @@ async def crawl_tools(request: CrawlToolsRequest, admin: None = Depends(_require
         request: 爬取请求，包含分类和最大数量
     """
     try:
-        from ...services.data_loader import DataLoader
-        
         # 获取所有已存在的工具URL（包括正式工具库和候选池）
         # 使用规范化后的URL进行对比，避免因URL格式差异导致的重复
         def normalize_url(url: str) -> str:
@@ -648,7 +978,6 @@ async def crawl_tools(request: CrawlToolsRequest, admin: None = Depends(_require
         existing_urls = set()
         
         # 1. 从正式工具库获取所有URL（直接读取文件，避免分页和去重问题）
-        from pathlib import Path
         tools_dir = Path(__file__).resolve().parent.parent.parent / "data" / "tools"
         tool_count = 0
         for tool_file in tools_dir.glob("*.json"):
@@ -732,7 +1061,6 @@ async def crawl_tools(request: CrawlToolsRequest, admin: None = Depends(_require
         logger.info(f"爬取结果: 共 {len(crawled_tools)} 个工具，其中 {duplicate_count} 个已存在，发现 {len(new_tools)} 个新工具")
         
         # 5. 转换为候选工具并添加到候选池
-        from datetime import datetime
         current_candidates = load_tool_candidate_pool()
         added_count = 0
         skipped_count = 0
@@ -808,12 +1136,12 @@ async def crawl_tool_articles(request: dict, admin: None = Depends(_require_admi
     # 2. 获取所有已存在的 URL 用于去重
     existing_urls = set()
     # 来自正式文章池
-    main_pool_articles = get_all_articles()
+    main_pool_articles = await asyncio.to_thread(get_all_articles)
     for article in main_pool_articles:
         if article.get("url"):
             existing_urls.add(article["url"])
     # 来自现有候选池
-    candidate_pool_articles = load_candidate_pool()
+    candidate_pool_articles = await asyncio.to_thread(load_candidate_pool)
     for article in candidate_pool_articles:
         if article.url:
             existing_urls.add(article.url)
@@ -844,7 +1172,8 @@ async def crawl_tool_articles(request: dict, admin: None = Depends(_require_admi
     if not all_new_candidates:
         return {"ok": True, "message": "抓取完成，但未发现任何新文章。", "added_count": 0}
     
-    added_count = add_candidates_to_pool(all_new_candidates, existing_urls)
+    async with _candidate_pool_lock:
+        added_count = await asyncio.to_thread(add_candidates_to_pool, all_new_candidates, existing_urls)
     
     return {
         "ok": True, 
@@ -861,6 +1190,10 @@ async def list_tool_keywords(admin: None = Depends(_require_admin)):
     return {"ok": True, "keywords": keywords, "count": len(keywords)}
 
 
+# 按关键词抓取时同时运行的搜索任务数量上限（每个任务启动一个无头浏览器）
+_CRAWL_KEYWORDS_CONCURRENCY = 3
+
+
 @router.post("/crawl-articles")
 async def crawl_articles(admin: None = Depends(_require_admin)):
     """
@@ -884,63 +1217,73 @@ async def crawl_articles(admin: None = Depends(_require_admin)):
         raise HTTPException(status_code=404, detail="关键词配置文件 crawler_keywords.json 未找到")
     
     try:
-        with keywords_path.open("r", encoding="utf-8") as f:
-            keywords = json.load(f)
-        if not isinstance(keywords, list) or not keywords:
+        # 按文件修改时间缓存，重复触发抓取时不再重新读取解析
+        keywords = load_raw_crawler_keywords()
+        if not keywords:
             raise HTTPException(status_code=400, detail="关键词配置格式错误或为空")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"读取关键词配置失败: {e}")
 
-    # 2. 获取所有已存在的 URL 用于去重
-    existing_urls = set()
-    # 来自正式文章池
-    main_pool_articles = get_all_articles()
-    for article in main_pool_articles:
-        if article.get("url"):
-            existing_urls.add(article["url"])
-    # 来自现有候选池
-    candidate_pool_articles = load_candidate_pool()
-    for article in candidate_pool_articles:
-        if article.url:
-            existing_urls.add(article.url)
-
-    # 自动获取前清空候选池，避免旧数据混入
-    if candidate_pool_articles:
-        logger.info("Clearing candidate pool before crawling new articles.")
-        clear_candidate_pool()
+    # 2. 获取正式文章池中已存在的 URL 用于去重
+    # 旧候选池会被本次抓取结果整体替换，其中的 URL 不参与去重
+    main_pool_articles = await asyncio.to_thread(get_all_articles)
+    existing_urls = {article["url"] for article in main_pool_articles if article.get("url")}
             
     logger.info(f"Found {len(existing_urls)} existing URLs to skip.")
 
-    schedule = load_digest_schedule()
+    schedule = await asyncio.to_thread(load_digest_schedule)
     max_articles = max(1, schedule.max_articles_per_keyword)
-    max_pages = max(1, math.ceil(max_articles / 10))
-
-    # 3. 遍历关键词并抓取
+    max_pages = max(1, (max_articles + 9) // 10)
+
+    # 3. 并发抓取各关键词，同时运行的浏览器数量受信号量限制
+    semaphore = asyncio.Semaphore(_CRAWL_KEYWORDS_CONCURRENCY)
+
+    async def crawl_keyword(keyword: str) -> list:
+        async with semaphore:
+            try:
+                logger.info(
+                    f"Crawling keyword '{keyword}' for up to {max_articles} articles "
+                    f"({max_pages} page(s))."
+                )
+                found_candidates = await search_articles_by_keyword(keyword, pages=max_pages)
+                return found_candidates[:max_articles]
+            except Exception as e:
+                logger.error(f"Error crawling for keyword '{keyword}': {e}")
+                # 单个关键词失败不中断整个任务
+                return []
+
+    # gather 按关键词顺序返回结果，候选文章顺序与逐个抓取时一致
+    # 先按原始 URL 过滤掉已存在或重复抓到的文章，只有剩下的才进入规范化去重
+    found_count = 0
     all_new_candidates = []
-    for keyword in keywords:
-        try:
-            logger.info(
-                f"Crawling keyword '{keyword}' for up to {max_articles} articles "
-                f"({max_pages} page(s))."
-            )
-            found_candidates = await search_articles_by_keyword(keyword, pages=max_pages)
-            if len(found_candidates) > max_articles:
-                found_candidates = found_candidates[:max_articles]
-            all_new_candidates.extend(found_candidates)
-        except Exception as e:
-            logger.error(f"Error crawling for keyword '{keyword}': {e}")
-            # 单个关键词失败不中断整个任务
-            continue
-            
-    # 4. 添加到候选池并去重
-    if not all_new_candidates:
+    seen_urls = set()
+    add_seen = seen_urls.add
+    append_candidate = all_new_candidates.append
+    for found_candidates in await asyncio.gather(*(crawl_keyword(kw) for kw in keywords)):
+        found_count += len(found_candidates)
+        for candidate in found_candidates:
+            url = candidate.url
+            if url in existing_urls or url in seen_urls:
+                continue
+            add_seen(url)
+            append_candidate(candidate)
+            
+    # 4. 去重后用抓取结果替换候选池（清空旧数据与写入新数据合并为一次写文件）
+    added_count, new_pool = merge_candidates([], all_new_candidates, existing_urls)
+    async with _candidate_pool_lock:
+        # 旧候选池只需知道是否为空，按文件大小判断，不读取解析整个文件
+        had_candidates = await asyncio.to_thread(candidate_pool_has_items)
+        if new_pool or had_candidates:
+            if had_candidates:
+                logger.info("Replacing previous candidate pool with newly crawled articles.")
+            await asyncio.to_thread(save_candidate_pool, new_pool)
+
+    if not found_count:
         return {"ok": True, "message": "抓取完成，但未发现任何新文章。"}
-
-    added_count = add_candidates_to_pool(all_new_candidates, existing_urls)
     
     return {
         "ok": True, 
-        "message": f"抓取完成！共发现 {len(all_new_candidates)} 篇文章，成功添加 {added_count} 篇新文章到候选池。",
+        "message": f"抓取完成！共发现 {found_count} 篇文章，成功添加 {added_count} 篇新文章到候选池。",
         "added_count": added_count
     }
 
@@ -960,11 +1303,7 @@ async def delete_article(request: DeleteArticleRequest, admin: None = Depends(_r
     Returns:
         dict: 包含成功状态和删除详情的响应
     """
-    from ...services.data_loader import DataLoader
-    
-    url = request.url.strip()
-    if not url:
-        raise HTTPException(status_code=400, detail="URL不能为空")
+    url = request.url
     
     try:
         deletion_results = {
@@ -974,17 +1313,15 @@ async def delete_article(request: DeleteArticleRequest, admin: None = Depends(_r
         }
         
         # 1. 从文章池删除
-        success = delete_article_from_config(url)
+        success = await _queue_article_change("delete", url)
         deletion_results["from_pool"] = success
         
         # 2. 从所有归档分类文件中删除
-        from ...services.database_write_service import DatabaseWriteService
         category_results = await DatabaseWriteService.delete_article_from_all_categories(url)
         deletion_results["from_categories"] = category_results
         
         # 3. 从周报中删除
-        from ...services.weekly_digest import delete_article_from_weekly
-        weekly_success = delete_article_from_weekly(url)
+        weekly_success = await asyncio.to_thread(delete_article_from_weekly, url)
         deletion_results["from_weekly"] = weekly_success
         
         # 4. 更新周报（重新生成）
@@ -1026,6 +1363,59 @@ async def delete_article(request: DeleteArticleRequest, admin: None = Depends(_r
         raise HTTPException(status_code=500, detail=f"删除文章失败: {str(e)}")
 
 
+@router.post("/delete-articles")
+async def delete_articles(request: DeleteArticlesRequest, admin: None = Depends(_require_admin)):
+    """
+    批量删除文章，删除范围与 /delete-article 相同。
+    所有URL处理完后只重新生成一次周报。
+    
+    Args:
+        request: 包含文章URL列表的请求体
+        
+    Returns:
+        dict: 包含成功状态和每个URL删除详情的响应
+    """
+    # URL 已由请求模型去除首尾空白并校验非空，这里只去除重复URL，保持原有顺序
+    urls = list(dict.fromkeys(request.urls))
+    if not urls:
+        raise HTTPException(status_code=400, detail="URL列表不能为空")
+    
+    try:
+        # 文章池一次读写删除全部URL，与单篇增删走同一个写入队列
+        pool_results = await _queue_article_changes([("delete", url) for url in urls])
+        results = {}
+        deleted_count = 0
+        for url, pool_success in zip(urls, pool_results):
+            category_results = await DatabaseWriteService.delete_article_from_all_categories(url)
+            weekly_success = await asyncio.to_thread(delete_article_from_weekly, url)
+            results[url] = {
+                "from_pool": pool_success,
+                "from_categories": category_results,
+                "from_weekly": weekly_success,
+            }
+            if pool_success or any(category_results.values()) or weekly_success:
+                deleted_count += 1
+        
+        # 所有删除完成后统一更新周报
+        await update_weekly_digest()
+        
+        if deleted_count == 0:
+            return {
+                "ok": False,
+                "message": "文章不存在或删除失败",
+                "results": results,
+            }
+        
+        return {
+            "ok": True,
+            "message": f"已删除 {deleted_count}/{len(urls)} 篇文章",
+            "results": results,
+        }
+    except Exception as e:
+        logger.error(f"批量删除文章失败: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"批量删除文章失败: {str(e)}")
+
+
 @router.post("/archive-article")
 async def archive_article_from_pool(request: ArchiveArticleFromPoolRequest, admin: None = Depends(_require_admin)):
     """
@@ -1053,8 +1443,6 @@ async def archive_article_from_pool(request: ArchiveArticleFromPoolRequest, admi
         raise HTTPException(status_code=400, detail=f"无效的分类，支持的分类：{', '.join(valid_categories)}")
     
     # 检查文章是否已归档
-    from ...services.data_loader import DataLoader
-    from ...services.database_data_service import DatabaseDataService
     if await DatabaseDataService.is_article_archived(url):
         raise HTTPException(status_code=400, detail="文章已归档，无法重复归档")
     
@@ -1081,7 +1469,6 @@ async def archive_article_from_pool(request: ArchiveArticleFromPoolRequest, admi
         raise HTTPException(status_code=404, detail="在文章池中未找到该文章")
     
     # 使用DataLoader归档文章
-    from ...services.database_write_service import DatabaseWriteService
     success = await DatabaseWriteService.archive_article_to_category(article_to_archive, category, tool_tags)
     
     if not success:
@@ -1494,7 +1881,6 @@ def decode_unicode_escapes(text: str) -> str:
         str: 解码后的字符串
     """
     try:
-        import codecs
         # 使用 codecs 解码 Unicode 转义序列
         # 需要先编码为 latin-1，然后解码为 unicode_escape
         return codecs.decode(text.encode('latin-1'), 'unicode_escape')
@@ -1760,12 +2146,23 @@ async def create_draft_from_articles_disabled(request: dict, admin: None = Depen
         raise HTTPException(status_code=500, detail=f"创建草稿失败: {str(e)}")
 
 
-@router.get("/panel", response_class=HTMLResponse)
-async def digest_panel():
-    """
-    简单的前端页面：展示预览内容 + 一键触发按钮。
-    """
-    html = """
+# 管理面板脚本作为静态文件由 /static 提供，URL 带内容哈希，脚本更新后浏览器会重新获取
+_PANEL_JS_PATH = Path(__file__).resolve().parents[1] / "static" / "panel.js"
+_PANEL_JS_VERSION = hashlib.md5(_PANEL_JS_PATH.read_bytes()).hexdigest()[:12]
+
+# 压缩管理面板 HTML：去掉每行的缩进、空行和 HTML 注释；
+# 保留换行，行内脚本的 // 注释和语句分隔不受影响（页面中的 textarea 均为空，不受缩进去除影响）
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_LINE_INDENT_RE = re.compile(r"\n\s+")
+
+
+def _minify_html(html: str) -> str:
+    return _LINE_INDENT_RE.sub("\n", _HTML_COMMENT_RE.sub("", html)).strip()
+
+
+# 管理面板页面：简单的前端页面，展示预览内容 + 一键触发按钮
+# 内容不变，模块加载时压缩、编码、gzip 一次并计算 ETag
+_PANEL_HTML = """
     <!DOCTYPE html>
     <html lang="zh-CN">
     <head>
@@ -1780,6 +2177,15 @@ async def digest_panel():
           }
         }
       </script>
+      <script>
+        // 页面开始解析时就用已保存的授权码预取首屏数据，与 panel.js 的下载、执行并行
+        (function () {
+          const code = localStorage.getItem("aicoding_admin_code");
+          if (code) {
+            window.panelBootstrapPromise = fetch("./bootstrap", { headers: { "X-Admin-Code": code } });
+          }
+        })();
+      </script>
     </head>
     <body class="bg-gray-50 text-gray-900 font-sans">
       <div class="max-w-7xl mx-auto p-6">
@@ -1802,8 +2208,8 @@ async def digest_panel():
           <h2 class="text-lg font-semibold text-gray-900 mb-4">添加文章</h2>
           <div class="bg-white rounded-xl shadow-sm border border-gray-200 p-6">
             <div class="mb-4">
-              <label for="article-url" class="block text-sm font-medium text-gray-700 mb-2">文章URL：</label>
-              <input type="url" id="article-url" class="w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent" placeholder="粘贴文章链接，例如：https://mp.weixin.qq.com/s/..." />
+              <label for="article-url" class="block text-sm font-medium text-gray-700 mb-2">文章URL（每行一个，可一次粘贴多条）：</label>
+              <textarea id="article-url" rows="3" class="w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent" placeholder="粘贴文章链接，例如：https://mp.weixin.qq.com/s/..."></textarea>
             </div>
             <div class="flex gap-2">
               <button id="add-article-btn" class="px-4 py-2 bg-blue-600 text-white text-sm rounded-lg hover:bg-blue-700 transition-colors disabled:opacity-50 disabled:cursor-not-allowed">添加文章</button>
@@ -2106,2293 +2512,40 @@ async def digest_panel():
         </div>
       </div>
 
-      <script>
-        // 最开始的日志，确保脚本执行
-        console.log('[DEBUG] ========== 管理员面板脚本开始执行 ==========');
-        console.log('[DEBUG] 当前时间:', new Date().toISOString());
-        
-        const ADMIN_CODE_KEY = "aicoding_admin_code";
-        let authFailCount = 0;
-        let authBlockedUntil = 0; // timestamp ms
-
-        function getAdminCode() {
-          return localStorage.getItem(ADMIN_CODE_KEY) || "";
-        }
-
-        function setAdminCode(code) {
-          localStorage.setItem(ADMIN_CODE_KEY, code || "");
-        }
+      <script src="/static/panel.js?v=__PANEL_JS_VERSION__"></script>
+    </body>
+    </html>
+    """.replace("__PANEL_JS_VERSION__", _PANEL_JS_VERSION)
+_PANEL_HTML = _minify_html(_PANEL_HTML)
+_PANEL_HTML_BYTES = _PANEL_HTML.encode("utf-8")
+_PANEL_HTML_GZIP = gzip.compress(_PANEL_HTML_BYTES, compresslevel=9)
+_PANEL_ETAG = f'"{hashlib.md5(_PANEL_HTML_BYTES).hexdigest()}"'
+# 压缩与未压缩的响应体不同，强 ETag 也要区分
+_PANEL_GZIP_ETAG = f'"{hashlib.md5(_PANEL_HTML_BYTES).hexdigest()}-gz"'
+_PANEL_CACHE_CONTROL = "public, max-age=3600"
+# 响应头同样只构建一次，Response 只读取不修改传入的 headers
+_PANEL_HEADERS = {"ETag": _PANEL_ETAG, "Cache-Control": _PANEL_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+# 304 不带响应体，也不带 Content-Encoding
+_PANEL_GZIP_304_HEADERS = {**_PANEL_HEADERS, "ETag": _PANEL_GZIP_ETAG}
+_PANEL_GZIP_HEADERS = {**_PANEL_GZIP_304_HEADERS, "Content-Encoding": "gzip"}
 
-        function showAuthOverlay() {
-          console.log('[DEBUG] showAuthOverlay 开始执行');
-          const overlay = document.getElementById("auth-overlay");
-          const input = document.getElementById("admin-code-input");
-          const statusEl = document.getElementById("auth-status");
-          
-          console.log('[DEBUG] 授权对话框元素:', { overlay, input, statusEl });
-          
-          if (!overlay) {
-            console.error('[DEBUG] 授权对话框元素未找到！');
-            return;
-          }
-          
-          console.log('[DEBUG] 授权对话框当前类名:', overlay.className);
-          overlay.classList.remove("hidden");
-          overlay.classList.add("flex");
-          console.log('[DEBUG] 授权对话框更新后类名:', overlay.className);
-          
-          if (statusEl) {
-            statusEl.textContent = "";
-            statusEl.className = "text-sm";
-          }
-          if (input) {
-            input.value = "";
-            input.focus();
-          }
-          console.log('[DEBUG] 授权对话框应该已显示');
-        }
 
-        function hideAuthOverlay() {
-          console.log('[DEBUG] 隐藏授权对话框');
-          const overlay = document.getElementById("auth-overlay");
-          if (overlay) {
-            overlay.classList.add("hidden");
-            overlay.classList.remove("flex");
-          }
-        }
+@router.get("/panel", response_class=HTMLResponse)
+async def digest_panel(
+    if_none_match: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+):
+    """
+    简单的前端页面：展示预览内容 + 一键触发按钮。
 
-        function handleAuthError(contextStatusEl) {
-          const now = Date.now();
-          if (authBlockedUntil && now < authBlockedUntil) {
-            const seconds = Math.ceil((authBlockedUntil - now) / 1000);
-            if (contextStatusEl) {
-              contextStatusEl.textContent = `❌ 授权多次失败，请 ${seconds} 秒后再试`;
-              contextStatusEl.className = "status error";
-            }
-            return false;
-          }
-
-          authFailCount += 1;
-          if (authFailCount >= 5) {
-            // 简单限流：5 次失败后，锁定 60 秒
-            authBlockedUntil = now + 60 * 1000;
-          }
-
-          setAdminCode("");
-          showAuthOverlay();
-          if (contextStatusEl) {
-            contextStatusEl.textContent = "❌ 授权码错误，请重新输入";
-            contextStatusEl.className = "status error";
-          }
-          return false;
-        }
-
-        async function ensureAdminCode() {
-          console.log('[DEBUG] ensureAdminCode 开始执行');
-          let code = getAdminCode();
-          console.log('[DEBUG] 从 localStorage 获取授权码:', code ? '已存在' : '不存在');
-          if (!code) {
-            console.log('[DEBUG] 授权码不存在，显示授权对话框');
-            showAuthOverlay();
-            return false;
-          }
-          console.log('[DEBUG] 授权码存在，继续执行');
-          return true;
-        }
-
-        async function crawlArticles() {
-            const btn = document.getElementById("crawl-btn");
-            const statusEl = document.getElementById("crawl-status");
-
-            btn.disabled = true;
-            statusEl.textContent = "正在从网络抓取文章，请稍候...（可能需要几十秒）";
-            statusEl.className = "text-sm";
-
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./crawl-articles", {
-                    method: "POST",
-                    headers: { "X-Admin-Code": adminCode || "" }
-                });
-
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusEl);
-                    return;
-                }
-
-                const data = await res.json();
-                if (data.ok) {
-                    statusEl.textContent = `✅ ${data.message}`;
-                    statusEl.className = "text-sm text-green-600";
-                    loadCandidateList(); // Refresh the list
-                    loadCandidateList(); // Refresh the list
-                } else {
-                    statusEl.textContent = `❌ ${data.message || "抓取失败"}`;
-                    statusEl.className = "text-sm text-red-600";
-                }
-            } catch (err) {
-                console.error(err);
-                statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
-                statusEl.className = "text-sm text-red-600";
-            } finally {
-                btn.disabled = false;
-            }
-        }
-
-        async function loadToolKeywords() {
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./tool-keywords", {
-                    headers: { "X-Admin-Code": adminCode || "" }
-                });
-                if (res.status === 401 || res.status === 403) {
-                    return;
-                }
-                const data = await res.json();
-                if (data.ok) {
-                    const select = document.getElementById("tool-keyword-select");
-                    const countEl = document.getElementById("tool-keyword-count");
-                    if (select) {
-                        // 保留第一个选项
-                        select.innerHTML = '<option value="">-- 选择工具关键字 --</option>';
-                        data.keywords.forEach(keyword => {
-                            const option = document.createElement("option");
-                            option.value = keyword;
-                            option.textContent = keyword;
-                            select.appendChild(option);
-                        });
-                    }
-                    if (countEl) {
-                        countEl.textContent = data.count || 0;
-                    }
-                }
-            } catch (err) {
-                console.error("加载工具关键字失败:", err);
-            }
-        }
-
-        async function crawlToolArticles(keyword = null) {
-            const btn = keyword 
-                ? document.getElementById("crawl-tool-article-btn")
-                : document.getElementById("crawl-all-tool-articles-btn");
-            const statusEl = document.getElementById("crawl-tool-article-status");
-
-            btn.disabled = true;
-            statusEl.textContent = keyword 
-                ? `正在爬取工具 "${keyword}" 的相关资讯，请稍候...`
-                : "正在爬取所有工具的相关资讯，请稍候...";
-            statusEl.className = "text-sm";
-
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./crawl-tool-articles", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || ""
-                    },
-                    body: JSON.stringify({ keyword: keyword || "" })
-                });
-
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusEl);
-                    return;
-                }
-
-                const data = await res.json();
-                if (data.ok) {
-                    statusEl.textContent = `✅ ${data.message}`;
-                    statusEl.className = "text-sm text-green-600";
-                    loadCandidateList(); // Refresh the list
-                } else {
-                    statusEl.textContent = `❌ ${data.message || "抓取失败"}`;
-                    statusEl.className = "text-sm text-red-600";
-                }
-            } catch (err) {
-                console.error(err);
-                statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
-                statusEl.className = "text-sm text-red-600";
-            } finally {
-                btn.disabled = false;
-            }
-        }
-
-        // 爬取工具
-        async function crawlTools() {
-            const sourceUrl = document.getElementById("crawl-tool-url").value.trim();
-            const category = document.getElementById("crawl-tool-category").value;
-            const maxItems = parseInt(document.getElementById("crawl-tool-max").value) || 100;
-            const statusEl = document.getElementById("crawl-tool-status");
-            
-            // 验证URL
-            if (!sourceUrl) {
-                statusEl.innerHTML = '<span class="text-red-600">❌ 请输入爬取源URL</span>';
-                return;
-            }
-            
-            if (!sourceUrl.startsWith("http://") && !sourceUrl.startsWith("https://")) {
-                statusEl.innerHTML = '<span class="text-red-600">❌ URL格式不正确，必须以 http:// 或 https:// 开头</span>';
-                return;
-            }
-            
-            statusEl.innerHTML = '<span class="text-blue-600">🔄 正在爬取工具，请稍候...</span>';
-            
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./crawl-tools", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({
-                        source_url: sourceUrl,
-                        category: category || null,
-                        max_items: maxItems
-                    }),
-                });
-                
-                if (!res.ok) {
-                    const error = await res.json();
-                    throw new Error(error.detail || "爬取失败");
-                }
-                
-                const data = await res.json();
-                if (data.ok) {
-                    statusEl.innerHTML = `<span class="text-green-600">✅ ${data.message}</span>`;
-                    // 刷新工具候选池列表
-                    setTimeout(() => {
-                        loadToolCandidateList();
-                        statusEl.innerHTML = "";
-                    }, 1000);
-                } else {
-                    throw new Error(data.message || "爬取失败");
-                }
-            } catch (err) {
-                console.error("爬取工具失败:", err);
-                statusEl.innerHTML = `<span class="text-red-600">❌ 爬取失败: ${err.message}</span>`;
-            }
-        }
-        
-        // 加载工具候选池
-        async function loadToolCandidateList() {
-            const listEl = document.getElementById("tool-candidate-list");
-            if (!listEl) return;
-            
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./tool-candidates", {
-                    headers: {
-                        "X-Admin-Code": adminCode || "",
-                    },
-                });
-                
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(listEl);
-                    return;
-                }
-                
-                const data = await res.json();
-                if (!data.ok) {
-                    listEl.innerHTML = `<p class="text-red-600">加载失败: ${data.message || "未知错误"}</p>`;
-                    return;
-                }
-                
-                const candidates = data.candidates || [];
-                
-                if (candidates.length === 0) {
-                    listEl.innerHTML = '<p class="text-gray-500">暂无待审核的工具</p>';
-                    return;
-                }
-                
-                listEl.innerHTML = "";
-                candidates.forEach((tool) => {
-                    const div = document.createElement("div");
-                    div.className = "border border-gray-200 rounded-lg p-4 mb-3";
-                    const nameEscaped = tool.name.replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                    const descEscaped = (tool.description || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                    const urlEscaped = tool.url.replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                    
-                    div.innerHTML = `
-                        <div class="flex justify-between items-start mb-2">
-                            <div class="flex-1">
-                                <h4 class="font-semibold text-gray-900">${nameEscaped}</h4>
-                                <p class="text-sm text-gray-600 mt-1">${descEscaped}</p>
-                                <a href="${urlEscaped}" target="_blank" class="text-sm text-blue-600 hover:underline mt-1 block">${urlEscaped}</a>
-                                <div class="text-xs text-gray-500 mt-2">
-                                    分类: ${tool.category || "未分类"} | 
-                                    提交时间: ${tool.submitted_at ? new Date(tool.submitted_at).toLocaleString("zh-CN") : "未知"}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="flex gap-2 mt-3">
-                            <button class="px-3 py-1 bg-green-600 text-white text-sm rounded hover:bg-green-700" data-url="${urlEscaped}" data-category="${tool.category || "other"}">采纳</button>
-                            <button class="px-3 py-1 bg-gray-600 text-white text-sm rounded hover:bg-gray-700" data-url="${urlEscaped}">忽略</button>
-                        </div>
-                    `;
-                    
-                    div.querySelector("button.bg-green-600").addEventListener("click", () => {
-                        const promptText = "请选择工具分类:\\nide, plugin, cli, codeagent, ai-test, review, devops, doc, design, ui, mcp, other";
-                        const category = prompt(promptText, tool.category || "other");
-                        if (category) {
-                            acceptToolCandidate(tool.url, category);
-                        }
-                    });
-                    div.querySelector("button.bg-gray-600").addEventListener("click", () => rejectToolCandidate(tool.url));
-                    
-                    listEl.appendChild(div);
-                });
-            } catch (err) {
-                console.error("加载工具候选池失败:", err);
-                listEl.innerHTML = `<p class="text-red-600">加载失败: ${err.message}</p>`;
-            }
-        }
-        
-        async function acceptToolCandidate(url, category) {
-            const listEl = document.getElementById("tool-candidate-list");
-            const statusMsg = document.createElement("div");
-            statusMsg.className = "text-sm text-blue-600 mb-2";
-            statusMsg.textContent = "正在采纳工具...";
-            listEl.insertBefore(statusMsg, listEl.firstChild);
-            
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./accept-tool-candidate", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({ url: url, category: category })
-                });
-                
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusMsg);
-                    return;
-                }
-                
-                const data = await res.json();
-                if (data.ok) {
-                    statusMsg.textContent = `✅ ${data.message}`;
-                    statusMsg.className = "text-sm text-green-600 mb-2";
-                    setTimeout(() => {
-                        statusMsg.remove();
-                        loadToolCandidateList();
-                    }, 2000);
-                } else {
-                    statusMsg.textContent = `❌ ${data.message || "采纳失败"}`;
-                    statusMsg.className = "text-sm text-red-600 mb-2";
-                }
-            } catch (err) {
-                console.error(err);
-                statusMsg.textContent = "❌ 请求失败，请查看浏览器控制台。";
-                statusMsg.className = "text-sm text-red-600 mb-2";
-            }
-        }
-        
-        async function rejectToolCandidate(url) {
-            const listEl = document.getElementById("tool-candidate-list");
-            const statusMsg = document.createElement("div");
-            statusMsg.className = "text-sm text-blue-600 mb-2";
-            statusMsg.textContent = "正在忽略工具...";
-            listEl.insertBefore(statusMsg, listEl.firstChild);
-            
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./reject-tool-candidate", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({ url: url })
-                });
-                
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusMsg);
-                    return;
-                }
-                
-                const data = await res.json();
-                if (data.ok) {
-                    statusMsg.textContent = `✅ ${data.message}`;
-                    statusMsg.className = "text-sm text-green-600 mb-2";
-                    setTimeout(() => {
-                        statusMsg.remove();
-                        loadToolCandidateList();
-                    }, 2000);
-                } else {
-                    statusMsg.textContent = `❌ ${data.message || "忽略失败"}`;
-                    statusMsg.className = "text-sm text-red-600 mb-2";
-                }
-            } catch (err) {
-                console.error(err);
-                statusMsg.textContent = "❌ 请求失败，请查看浏览器控制台。";
-                statusMsg.className = "text-sm text-red-600 mb-2";
-            }
-        }
-
-        async function loadCandidateList() {
-            console.log('[DEBUG] loadCandidateList 开始执行');
-            const listEl = document.getElementById("candidate-list");
-            const statusEl = document.getElementById("crawl-status");
-            if (!listEl) {
-                console.error('[DEBUG] candidate-list 元素未找到');
-                return;
-            }
-            listEl.innerHTML = "加载中...";
-
-            try {
-                const adminCode = getAdminCode();
-                console.log('[DEBUG] 请求候选列表，URL: ./candidates');
-                const res = await fetch(`./candidates?_t=${Date.now()}`, {
-                    headers: { "X-Admin-Code": adminCode || "" }
-                });
-                console.log('[DEBUG] 候选列表响应状态:', res.status, res.statusText);
-
-                if (res.status === 401 || res.status === 403) {
-                    console.log('[DEBUG] 授权失败，状态码:', res.status);
-                    handleAuthError(statusEl);
-                    return;
-                }
-
-                if (!res.ok) {
-                    console.error('[DEBUG] 请求失败，状态码:', res.status);
-                    listEl.innerHTML = `<p class="text-red-600">请求失败: HTTP ${res.status}</p>`;
-                    return;
-                }
-
-                const data = await res.json();
-                console.log('[DEBUG] 候选列表数据:', data);
-                if (!data.ok || !data.grouped_candidates || Object.keys(data.grouped_candidates).length === 0) {
-                    console.log('[DEBUG] 没有候选文章');
-                    listEl.innerHTML = '<p class="text-gray-600">当前没有待审核的文章。</p>';
-                    return;
-                }
-
-                listEl.innerHTML = "";
-                Object.keys(data.grouped_candidates).forEach(keyword => {
-                    const articles = data.grouped_candidates[keyword];
-                    const groupContainer = document.createElement("div");
-                    groupContainer.className = "mb-6";
-                    
-                    const groupTitle = document.createElement("h3");
-                    groupTitle.className = "text-base font-semibold text-gray-900 mb-3";
-                    const keywordEscaped = keyword.replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                    groupTitle.innerHTML = `关键词: ${keywordEscaped} <span class="text-gray-500">(${articles.length}篇)</span>`;
-                    groupContainer.appendChild(groupTitle);
-
-                    articles.forEach((item, idx) => {
-                        // 保存候选文章信息，用于归档时自动填充工具标签
-                        candidateArticlesMap[item.url] = item;
-                        
-                        const div = document.createElement("div");
-                        div.className = "bg-white rounded-lg p-4 mb-3 border border-gray-200 shadow-sm";
-                        const urlEscaped = item.url.replace(/'/g, "&#39;").replace(/"/g, "&quot;");
-                        const titleEscaped = (item.title || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                        const sourceEscaped = (item.source || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                        const summaryEscaped = (item.summary || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                        const isArchived = item.is_archived || false;
-
-                        // 构建标签区域
-                        let tagsHtml = '';
-                        if (isArchived) {
-                            tagsHtml = '<span class="px-2 py-1 bg-purple-100 text-purple-700 text-xs rounded-full font-medium">已归档</span>';
-                        }
-
-                        // 构建按钮区域
-                        let archiveButtonHtml = '';
-                        if (isArchived) {
-                            archiveButtonHtml = '<button class="px-3 py-1 bg-gray-400 text-white text-xs rounded-lg cursor-not-allowed opacity-50" disabled>已归档</button>';
-                        } else {
-                            archiveButtonHtml = `<button class="px-3 py-1 bg-blue-600 text-white text-xs rounded-lg hover:bg-blue-700 transition-colors archive-btn" data-url="${urlEscaped}">归档</button>`;
-                        }
-
-                        div.innerHTML = `
-                            <div class="flex justify-between items-start mb-2">
-                              <div class="flex-1">
-                                <div class="font-semibold text-gray-900 mb-1 flex items-center gap-2">
-                                  <span>${idx + 1}.</span>
-                                  <a href="${item.url}" target="_blank" rel="noopener noreferrer" class="text-blue-600 hover:text-blue-700">${titleEscaped}</a>
-                                  ${tagsHtml}
-                                </div>
-                              </div>
-                              <div class="flex gap-2 ml-4">
-                                <button class="px-3 py-1 bg-green-600 text-white text-xs rounded-lg hover:bg-green-700 transition-colors" data-url="${urlEscaped}">采纳</button>
-                                ${archiveButtonHtml}
-                                <button class="px-3 py-1 bg-gray-600 text-white text-xs rounded-lg hover:bg-gray-700 transition-colors" data-url="${urlEscaped}">忽略</button>
-                              </div>
-                            </div>
-                            <div class="text-xs text-gray-600 mb-1">来源：${sourceEscaped}</div>
-                            <div class="text-sm text-gray-700">${summaryEscaped}</div>
-                        `;
-                        
-                        div.querySelector("button.bg-green-600").addEventListener("click", () => acceptCandidate(item.url));
-                        if (!isArchived) {
-                            div.querySelector("button.archive-btn").addEventListener("click", () => showArchiveModal(item.url));
-                        }
-                        div.querySelector("button.bg-gray-600").addEventListener("click", () => rejectCandidate(item.url));
-
-                        groupContainer.appendChild(div);
-                    });
-                    listEl.appendChild(groupContainer);
-                });
-            } catch (err) {
-                console.error('[DEBUG] loadCandidateList 出错:', err);
-                listEl.innerHTML = `<p class="text-red-600">加载候选文章失败: ${err.message}</p>`;
-            }
-        }
-
-        async function acceptCandidate(url) {
-            const statusEl = document.getElementById("crawl-status");
-            statusEl.textContent = "正在采纳文章...";
-            statusEl.className = "text-sm";
-
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./accept-candidate", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({ url: url })
-                });
-
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusEl);
-                    return;
-                }
-
-                const data = await res.json();
-                if (data.ok) {
-                    statusEl.textContent = `✅ ${data.message}`;
-                    statusEl.className = "text-sm text-green-600";
-                    loadCandidateList();
-                    loadToolCandidateList();
-                    loadArticleList();
-                    loadPreview();
-                } else {
-                    statusEl.textContent = `❌ ${data.message || "采纳失败"}`;
-                    statusEl.className = "text-sm text-red-600";
-                }
-            } catch (err) {
-                console.error(err);
-                statusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
-                statusEl.className = "text-sm text-red-600";
-            }
-        }
-
-        async function rejectCandidate(url) {
-            const statusEl = document.getElementById("crawl-status");
-            statusEl.textContent = "正在忽略文章...";
-            statusEl.className = "text-sm";
-
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./reject-candidate", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({ url: url })
-                });
-
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusEl);
-                    return;
-                }
-
-                const data = await res.json();
-                if (data.ok) {
-                    statusEl.textContent = `✅ ${data.message}`;
-                    statusEl.className = "text-sm text-green-600";
-                    loadCandidateList();
-                    loadPreview();
-                } else {
-                    statusEl.textContent = `❌ ${data.message || "忽略失败"}`;
-                    statusEl.className = "text-sm text-red-600";
-                }
-            } catch (err) {
-                console.error(err);
-                statusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
-                statusEl.className = "text-sm text-red-600";
-            }
-        }
-
-        let currentArchiveUrl = null;
-        let archiveSource = null; // 'candidate' 或 'article'
-        let candidateArticlesMap = {}; // 存储候选文章信息，key为URL
-
-        function showArchiveModal(url, source = 'candidate') {
-            currentArchiveUrl = url;
-            archiveSource = source; // 记录归档来源
-            const modal = document.getElementById("archive-modal");
-            const statusEl = document.getElementById("archive-status");
-            const categorySelect = document.getElementById("archive-category");
-            const toolTagsInput = document.getElementById("archive-tool-tags");
-            
-            if (modal) {
-                modal.classList.remove("hidden");
-                modal.classList.add("flex");
-            }
-            if (statusEl) {
-                statusEl.textContent = "";
-                statusEl.className = "text-sm";
-            }
-            if (categorySelect) {
-                categorySelect.value = "programming";
-            }
-            if (toolTagsInput) {
-                // 如果是候选池归档，自动从候选文章信息中提取工具名称
-                if (source === 'candidate') {
-                    const articleInfo = candidateArticlesMap[url];
-                    if (articleInfo && articleInfo.crawled_from && articleInfo.crawled_from.startsWith("tool_keyword:")) {
-                        const toolName = articleInfo.crawled_from.replace("tool_keyword:", "").trim();
-                        toolTagsInput.value = toolName;
-                    } else {
-                        toolTagsInput.value = "";
-                    }
-                } else {
-                    toolTagsInput.value = "";
-                }
-            }
-        }
-
-        function hideArchiveModal() {
-            const modal = document.getElementById("archive-modal");
-            if (modal) {
-                modal.classList.add("hidden");
-                modal.classList.remove("flex");
-            }
-            currentArchiveUrl = null;
-            archiveSource = null;
-        }
-
-        async function archiveCandidate(url, category, toolTags) {
-            const statusEl = document.getElementById("crawl-status");
-            const archiveStatusEl = document.getElementById("archive-status");
-            
-            archiveStatusEl.textContent = "正在归档文章...";
-            archiveStatusEl.className = "text-sm text-blue-600";
-
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./archive-candidate", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({ 
-                        url: url, 
-                        category: category,
-                        tool_tags: toolTags || []
-                    })
-                });
-
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(statusEl);
-                    hideArchiveModal();
-                    return;
-                }
-
-                const data = await res.json();
-                if (data.ok) {
-                    archiveStatusEl.textContent = `✅ ${data.message}`;
-                    archiveStatusEl.className = "text-sm text-green-600";
-                    statusEl.textContent = `✅ ${data.message}`;
-                    statusEl.className = "text-sm text-green-600";
-                    
-                    // 延迟关闭对话框，让用户看到成功消息
-                    setTimeout(() => {
-                        hideArchiveModal();
-                        loadCandidateList();
-                        loadPreview();
-                    }, 1500);
-                } else {
-                    archiveStatusEl.textContent = `❌ ${data.message || "归档失败"}`;
-                    archiveStatusEl.className = "text-sm text-red-600";
-                }
-            } catch (err) {
-                console.error(err);
-                archiveStatusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
-                archiveStatusEl.className = "text-sm text-red-600";
-            }
-        }
-        
-        // 从文章池归档文章
-        async function archiveArticleFromPool(url, category, toolTags) {
-            const archiveStatusEl = document.getElementById("archive-status");
-            
-            if (!archiveStatusEl) {
-                console.error("archive-status 元素未找到");
-                return;
-            }
-            
-            archiveStatusEl.textContent = "正在归档文章...";
-            archiveStatusEl.className = "text-sm text-blue-600";
-
-            try {
-                const adminCode = getAdminCode();
-                const res = await fetch("./archive-article", {
-                    method: "POST",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "X-Admin-Code": adminCode || "",
-                    },
-                    body: JSON.stringify({ 
-                        url: url, 
-                        category: category,
-                        tool_tags: toolTags || []
-                    })
-                });
-
-                if (res.status === 401 || res.status === 403) {
-                    handleAuthError(archiveStatusEl);
-                    hideArchiveModal();
-                    return;
-                }
-
-                const data = await res.json();
-                if (data.ok) {
-                    archiveStatusEl.textContent = `✅ ${data.message}`;
-                    archiveStatusEl.className = "text-sm text-green-600";
-                    
-                    // 延迟关闭对话框，让用户看到成功消息，然后重新加载文章列表更新状态
-                    setTimeout(() => {
-                        hideArchiveModal();
-                        loadArticleList(); // 重新加载文章列表，更新归档状态
-                    }, 1500);
-                } else {
-                    archiveStatusEl.textContent = `❌ ${data.message || "归档失败"}`;
-                    archiveStatusEl.className = "text-sm text-red-600";
-                }
-            } catch (err) {
-                console.error(err);
-                archiveStatusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
-                archiveStatusEl.className = "text-sm text-red-600";
-            }
-        }
-
-        async function loadArticleList() {
-          console.log('[DEBUG] loadArticleList 开始执行');
-          const listEl = document.getElementById("article-list");
-          const statusEl = document.getElementById("list-status");
-          if (!listEl) {
-            console.error('[DEBUG] article-list 元素未找到');
-            return;
-          }
-          if (statusEl) statusEl.textContent = "";
-          listEl.innerHTML = "加载中...";
-
-          try {
-            const adminCode = getAdminCode();
-            console.log('[DEBUG] 请求文章列表，URL: ./articles');
-            const res = await fetch("./articles", {
-              headers: { "X-Admin-Code": adminCode || "" },
-            });
-            console.log('[DEBUG] 文章列表响应状态:', res.status, res.statusText);
-
-            if (res.status === 401 || res.status === 403) {
-              console.log('[DEBUG] 授权失败，状态码:', res.status);
-              handleAuthError(statusEl);
-              return;
-            }
-
-            if (!res.ok) {
-              console.error('[DEBUG] 请求失败，状态码:', res.status);
-              listEl.innerHTML = `<p class="text-red-600">请求失败: HTTP ${res.status}</p>`;
-              return;
-            }
-
-            const data = await res.json();
-            console.log('[DEBUG] 文章列表数据:', data);
-            
-                if (!data.ok || !data.articles || data.articles.length === 0) {
-              console.log('[DEBUG] 没有已配置的文章');
-              listEl.innerHTML = '<p class="text-gray-600">当前没有已配置的文章。</p>';
-              return;
-            }
-
-            listEl.innerHTML = "";
-            data.articles.forEach((item, idx) => {
-              const div = document.createElement("div");
-              div.className = "bg-white rounded-lg p-4 mb-3 border border-gray-200 shadow-sm";
-              const urlEscaped = item.url.replace(/'/g, "&#39;").replace(/"/g, "&quot;");
-              const titleEscaped = (item.title || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-              const sourceEscaped = (item.source || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-              const summaryEscaped = (item.summary || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-              
-              // 检查归档状态
-              const isArchived = item.is_archived || false;
-              let tagsHtml = '';
-              if (isArchived) {
-                tagsHtml = '<span class="px-2 py-1 bg-purple-100 text-purple-700 text-xs rounded-full font-medium mr-2">已归档</span>';
-              }
-              
-              // 归档按钮
-              let archiveButtonHtml = '';
-              if (isArchived) {
-                archiveButtonHtml = '<button class="px-3 py-1 bg-gray-400 text-white text-xs rounded-lg cursor-not-allowed opacity-50" disabled>已归档</button>';
-              } else {
-                archiveButtonHtml = `<button class="px-3 py-1 bg-blue-600 text-white text-xs rounded-lg hover:bg-blue-700 transition-colors archive-article-btn" data-url="${urlEscaped}">归档</button>`;
-              }
-              
-              div.innerHTML = `
-                <div class="flex justify-between items-start mb-2">
-                  <div class="flex-1">
-                    <div class="font-semibold text-gray-900 mb-1 flex items-center gap-2">
-                      ${idx + 1}. <a href="${item.url}" target="_blank" rel="noopener noreferrer" class="text-blue-600 hover:text-blue-700">${titleEscaped}</a>
-                      ${tagsHtml}
-                    </div>
-                  </div>
-                  <div class="ml-4 flex gap-2">
-                    ${archiveButtonHtml}
-                    <button class="px-3 py-1 bg-red-600 text-white text-xs rounded-lg hover:bg-red-700 transition-colors delete-article-btn" data-url="${urlEscaped}">删除</button>
-                  </div>
-                </div>
-                <div class="text-xs text-gray-600 mb-1">来源：${sourceEscaped}</div>
-                <div class="text-sm text-gray-700">${summaryEscaped}</div>
-              `;
-              
-              // 绑定删除按钮事件（使用更具体的class选择器）
-              const deleteBtn = div.querySelector("button.delete-article-btn");
-              if (deleteBtn) {
-                deleteBtn.addEventListener("click", function() {
-                  deleteArticle(item.url);
-                });
-              } else {
-                console.error('[DEBUG] 删除按钮未找到，URL:', item.url);
-              }
-              
-              // 绑定归档按钮事件
-              if (!isArchived) {
-                const archiveBtn = div.querySelector("button.archive-article-btn");
-                if (archiveBtn) {
-                  archiveBtn.addEventListener("click", function() {
-                    showArchiveModal(item.url, 'article'); // 标记为从文章池归档
-                  });
-                }
-              }
-              
-              listEl.appendChild(div);
-            });
-            console.log('[DEBUG] 文章列表加载完成，共', data.articles.length, '篇');
-          } catch (err) {
-            console.error('[DEBUG] loadArticleList 出错:', err);
-            listEl.innerHTML = `<p class="text-red-600">加载失败: ${err.message}</p>`;
-          }
-        }
-
-        async function deleteArticle(url) {
-          if (!confirm("确定要删除这篇文章吗？")) {
-            return;
-          }
-
-          const statusEl = document.getElementById("list-status");
-          statusEl.textContent = "正在删除...";
-          statusEl.className = "status";
-
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./delete-article", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || "",
-              },
-              body: JSON.stringify({ url: url })
-            });
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            const data = await res.json();
-            
-            if (data.ok) {
-              statusEl.textContent = `✅ ${data.message}`;
-              statusEl.className = "text-sm text-green-600";
-              // 重新加载文章列表和预览
-              loadArticleList();
-              loadPreview();
-            } else {
-              statusEl.textContent = `❌ ${data.message || "删除失败"}`;
-              statusEl.className = "text-sm text-red-600";
-            }
-          } catch (err) {
-            console.error(err);
-            statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
-            statusEl.className = "status error";
-          }
-        }
-
-        async function loadPreview() {
-          console.log('[DEBUG] loadPreview 开始执行');
-          const metaEl = document.getElementById("meta");
-          const listEl = document.getElementById("articles");
-          const statusEl = document.getElementById("status");
-          if (!metaEl || !listEl || !statusEl) {
-            console.error("[DEBUG] 预览元素未找到", { metaEl, listEl, statusEl });
-            return;
-          }
-          statusEl.textContent = "";
-          listEl.innerHTML = "";
-          metaEl.textContent = "加载中...";
-
-          try {
-            const adminCode = getAdminCode();
-            console.log('[DEBUG] 请求预览数据，URL: ./preview');
-            const res = await fetch("./preview", {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            console.log('[DEBUG] 预览响应状态:', res.status, res.statusText);
-            
-            if (res.status === 401 || res.status === 403) {
-              console.log('[DEBUG] 授权失败，状态码:', res.status);
-              handleAuthError(statusEl);
-              return;
-            }
-
-            if (!res.ok) {
-              console.error('[DEBUG] 请求失败，状态码:', res.status);
-              metaEl.textContent = `请求失败: HTTP ${res.status}`;
-              return;
-            }
-
-            const data = await res.json();
-            console.log('[DEBUG] 预览数据:', data);
-            metaEl.textContent = `日期：${data.date} ｜ 主题：${data.theme} ｜ 定时：${String(data.schedule.hour).padStart(2,'0')}:${String(data.schedule.minute).padStart(2,'0')} ｜ 篇数：${data.schedule.count}`;
-
-            if (!data.articles || data.articles.length === 0) {
-              console.log('[DEBUG] 预览中没有可用文章');
-              listEl.innerHTML = '<p class="text-gray-600">当前配置下没有可用文章，请在服务器的 data/articles/ai_articles.json 中添加。</p>';
-              return;
-            }
-
-            data.articles.forEach((item, idx) => {
-              const div = document.createElement("div");
-              div.className = "bg-white rounded-lg p-4 mb-3 border border-gray-200 shadow-sm";
-              div.innerHTML = `
-                <div class="font-semibold text-gray-900 mb-1">
-                  ${idx + 1}. <a href="${item.url}" target="_blank" rel="noopener noreferrer" class="text-blue-600 hover:text-blue-700">${item.title}</a>
-                </div>
-                <div class="text-xs text-gray-600 mb-1">来源：${item.source}</div>
-                <div class="text-sm text-gray-700">${item.summary || ""}</div>
-              `;
-              listEl.appendChild(div);
-            });
-            console.log('[DEBUG] 预览加载完成，共', data.articles.length, '篇');
-          } catch (err) {
-            console.error('[DEBUG] loadPreview 出错:', err);
-            metaEl.textContent = `加载失败: ${err.message}`;
-          }
-        }
-
-        async function addArticle() {
-          const urlInput = document.getElementById("article-url");
-          const btn = document.getElementById("add-article-btn");
-          const statusEl = document.getElementById("add-status");
-          const url = urlInput.value.trim();
-          
-          if (!url) {
-            statusEl.textContent = "❌ 请输入文章URL";
-            statusEl.className = "status error";
-            return;
-          }
-          
-          btn.disabled = true;
-          statusEl.textContent = "正在爬取文章信息，请稍候...";
-          statusEl.className = "status";
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./add-article", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || "",
-              },
-              body: JSON.stringify({ url: url })
-            });
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            // 检查 HTTP 状态码
-            if (!res.ok) {
-              let errorText = "未知错误";
-              try {
-                const errorData = await res.json();
-                errorText = errorData.detail || errorData.message || errorText;
-              } catch {
-                try {
-                  errorText = await res.text();
-                } catch {
-                  errorText = `HTTP ${res.status}`;
-                }
-              }
-              statusEl.textContent = `❌ 服务器错误 (${res.status})：${errorText}`;
-              statusEl.className = "text-sm text-red-600";
-              return;
-            }
-            
-            const data = await res.json();
-            
-            if (data.ok) {
-              statusEl.textContent = `✅ ${data.message}：${data.article.title}`;
-              statusEl.className = "text-sm text-green-600";
-              urlInput.value = "";
-              // 添加成功后重新加载文章列表和预览
-              loadArticleList();
-              loadPreview();
-            } else {
-              statusEl.textContent = `❌ ${data.message || "添加失败"}`;
-              statusEl.className = "text-sm text-red-600";
-            }
-          } catch (err) {
-            console.error(err);
-            let errorMsg = "❌ 请求失败";
-            if (err instanceof TypeError && err.message.includes("fetch")) {
-              errorMsg += "：无法连接到服务器，请检查服务是否正常运行";
-            } else if (err.message) {
-              errorMsg += `：${err.message}`;
-            } else {
-              errorMsg += "，请查看浏览器控制台或服务器日志";
-            }
-            statusEl.textContent = errorMsg;
-            statusEl.className = "status error";
-          } finally {
-            btn.disabled = false;
-          }
-        }
-
-        async function triggerOnce() {
-          const btn = document.getElementById("trigger-btn");
-          const statusEl = document.getElementById("status");
-          btn.disabled = true;
-          statusEl.textContent = "正在触发推送，请稍候...";
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./trigger", {
-              method: "POST",
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            const data = await res.json();
-            if (data.ok) {
-              statusEl.textContent = `✅ 已触发一次推送：${data.date} ｜ 主题：${data.theme}`;
-              loadArticleList();
-              loadCandidateList();
-            } else {
-              statusEl.textContent = "❌ 推送失败，请查看服务器日志。";
-            }
-          } catch (err) {
-            console.error(err);
-            statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
-          } finally {
-            btn.disabled = false;
-            // 触发后重新加载预览，保证展示的内容与最近一次一致
-            loadPreview();
-          }
-        }
-
-        document.getElementById("crawl-btn").addEventListener("click", crawlArticles);
-        document.getElementById("crawl-tool-article-btn").addEventListener("click", function() {
-            const select = document.getElementById("tool-keyword-select");
-            const keyword = select ? select.value : null;
-            if (!keyword) {
-                alert("请先选择工具关键字");
-                return;
-            }
-            crawlToolArticles(keyword);
-        });
-        document.getElementById("crawl-all-tool-articles-btn").addEventListener("click", function() {
-            crawlToolArticles(null);
-        });
-        document.getElementById("add-article-btn").addEventListener("click", addArticle);
-        document.getElementById("article-url").addEventListener("keypress", function(e) {
-          if (e.key === "Enter") {
-            addArticle();
-          }
-        });
-        document.getElementById("trigger-btn").addEventListener("click", triggerOnce);
-
-        document.getElementById("auth-submit-btn").addEventListener("click", async function () {
-          const input = document.getElementById("admin-code-input");
-          const statusEl = document.getElementById("auth-status");
-          const code = input.value.trim();
-          if (!code) {
-            statusEl.textContent = "❌ 请输入授权码";
-            statusEl.className = "status error";
-            return;
-          }
-          setAdminCode(code);
-          hideAuthOverlay();
-          await initializePanel();
-        });
-
-        document.getElementById("admin-code-input").addEventListener("keypress", function (e) {
-          if (e.key === "Enter") {
-            document.getElementById("auth-submit-btn").click();
-          }
-        });
-
-        async function initializePanel() {
-          console.log('[DEBUG] initializePanel 开始执行');
-          const ok = await ensureAdminCode();
-          console.log('[DEBUG] ensureAdminCode 返回:', ok);
-          if (!ok) {
-            console.log('[DEBUG] 授权码验证失败，停止初始化');
-            return;
-          }
-          console.log('[DEBUG] 开始加载数据...');
-          try {
-            await Promise.all([
-              loadCandidateList(),
-              loadToolCandidateList(),
-              loadArticleList(),
-              loadPreview(),
-              loadToolKeywords()
-            ]);
-            console.log('[DEBUG] 所有数据加载完成');
-          } catch (err) {
-            console.error('[DEBUG] 数据加载出错:', err);
-          }
-        }
-
-        // 归档对话框事件绑定
-        const archiveModal = document.getElementById("archive-modal");
-        const archiveCancelBtn = document.getElementById("archive-cancel-btn");
-        const archiveConfirmBtn = document.getElementById("archive-confirm-btn");
-        const archiveCategory = document.getElementById("archive-category");
-
-        if (archiveCancelBtn) {
-          archiveCancelBtn.addEventListener("click", hideArchiveModal);
-        }
-
-        if (archiveConfirmBtn) {
-          archiveConfirmBtn.addEventListener("click", function() {
-            if (currentArchiveUrl) {
-              const category = archiveCategory ? archiveCategory.value : "programming";
-              const toolTagsInput = document.getElementById("archive-tool-tags");
-              let toolTags = [];
-              if (toolTagsInput && toolTagsInput.value.trim()) {
-                // 解析工具标签（逗号分隔，去除空格）
-                toolTags = toolTagsInput.value.split(',').map(tag => tag.trim()).filter(tag => tag);
-              }
-              
-              // 根据归档来源调用不同的函数
-              if (archiveSource === 'article') {
-                archiveArticleFromPool(currentArchiveUrl, category, toolTags);
-              } else {
-                archiveCandidate(currentArchiveUrl, category, toolTags);
-              }
-            }
-          });
-        }
-
-        // 点击背景关闭对话框
-        if (archiveModal) {
-          archiveModal.addEventListener("click", function(e) {
-            if (e.target === archiveModal) {
-              hideArchiveModal();
-            }
-          });
-        }
-
-        // 配置弹窗基础功能
-        const configModal = document.getElementById("config-modal");
-        const openConfigBtn = document.getElementById("open-config-btn");
-        const closeConfigBtn = document.getElementById("close-config-btn");
-
-        function openConfigModal() {
-          if (configModal) {
-            configModal.classList.remove("hidden");
-            configModal.classList.add("flex");
-            switchConfigSection("keywords");
-          }
-        }
-
-        function closeConfigModal() {
-          if (configModal) {
-            configModal.classList.add("hidden");
-            configModal.classList.remove("flex");
-          }
-        }
-
-        async function loadKeywordConfig() {
-          const textarea = document.getElementById("config-keywords-input");
-          const statusEl = document.getElementById("config-keywords-status");
-          if (!textarea) return;
-          
-          if (statusEl) statusEl.textContent = "";
-          textarea.value = "";
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/keywords", {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              if (statusEl) {
-                statusEl.textContent = "❌ 需要授权";
-                statusEl.className = "text-sm text-red-600";
-              }
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok && data.keywords) {
-              textarea.value = data.keywords.join("\\n");
-            } else {
-              textarea.value = "AI 编码\\n数字孪生\\nCursor";
-            }
-          } catch (err) {
-            console.error("加载关键词失败:", err);
-            textarea.value = "AI 编码\\n数字孪生\\nCursor";
-          }
-        }
-
-        async function loadScheduleConfig() {
-          const cronInput = document.getElementById("schedule-cron");
-          const hourInput = document.getElementById("schedule-hour");
-          const minuteInput = document.getElementById("schedule-minute");
-          const countInput = document.getElementById("schedule-count");
-          const maxInput = document.getElementById("schedule-max");
-          const statusEl = document.getElementById("config-schedule-status");
-          
-          if (statusEl) statusEl.textContent = "";
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/schedule", {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              if (statusEl) {
-                statusEl.textContent = "❌ 需要授权";
-                statusEl.className = "text-sm text-red-600";
-              }
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok && data.schedule) {
-              const s = data.schedule;
-              if (cronInput) cronInput.value = s.cron || "";
-              if (hourInput) hourInput.value = s.hour || "";
-              if (minuteInput) minuteInput.value = s.minute || "";
-              if (countInput) countInput.value = s.count || "";
-              if (maxInput) maxInput.value = s.max_articles_per_keyword || "";
-            }
-          } catch (err) {
-            console.error("加载调度配置失败:", err);
-          }
-        }
-
-        async function loadWecomTemplateConfig() {
-          const textarea = document.getElementById("wecom-template-input");
-          const statusEl = document.getElementById("config-template-status");
-          if (!textarea) return;
-          
-          if (statusEl) statusEl.textContent = "";
-          
-          const defaultTemplateObj = {
-            "title": "**每日精选通知｜{date}**",
-            "theme": "> 今日主题：{theme}",
-            "item": {
-              "title": "{idx}. [{title}]({url})",
-              "source": "   - 来源：{source}",
-              "summary": "   - 摘要：{summary}"
-            },
-            "footer": "> 以上内容每日推送，仅限内部分享。"
-          };
-          const defaultTemplate = JSON.stringify(defaultTemplateObj, null, 2);
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/wecom-template", {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              if (statusEl) {
-                statusEl.textContent = "❌ 需要授权";
-                statusEl.className = "text-sm text-red-600";
-              }
-              textarea.value = defaultTemplate;
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok && data.template) {
-              textarea.value = JSON.stringify(data.template, null, 2);
-            } else {
-              textarea.value = defaultTemplate;
-            }
-          } catch (err) {
-            console.error("加载模板失败:", err);
-            textarea.value = defaultTemplate;
-          }
-        }
-
-        async function loadEnvConfig() {
-          const adminCodeInput = document.getElementById("env-admin-code");
-          const wecomWebhookInput = document.getElementById("env-wecom-webhook");
-          const statusEl = document.getElementById("config-env-status");
-          
-          if (!adminCodeInput || !wecomWebhookInput) return;
-          
-          if (statusEl) statusEl.textContent = "";
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/env", {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              if (statusEl) {
-                statusEl.textContent = "❌ 需要授权";
-                statusEl.className = "text-sm text-red-600";
-              }
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok && data.env) {
-              adminCodeInput.value = data.env.admin_code || "";
-              wecomWebhookInput.value = data.env.wecom_webhook || "";
-            }
-          } catch (err) {
-            console.error("加载系统配置失败:", err);
-          }
-        }
-
-        async function saveEnvConfig() {
-          const adminCodeInput = document.getElementById("env-admin-code");
-          const wecomWebhookInput = document.getElementById("env-wecom-webhook");
-          const statusEl = document.getElementById("config-env-status");
-          
-          if (!adminCodeInput || !wecomWebhookInput) return;
-          
-          const adminCode = adminCodeInput.value.trim();
-          const wecomWebhook = wecomWebhookInput.value.trim();
-          
-          if (!adminCode && !wecomWebhook) {
-            if (statusEl) {
-              statusEl.textContent = "❌ 请至少填写一项配置";
-              statusEl.className = "text-sm text-red-600";
-            }
-            return;
-          }
-          
-          if (statusEl) {
-            statusEl.textContent = "保存中...";
-            statusEl.className = "text-sm";
-          }
-          
-          try {
-            const currentAdminCode = getAdminCode();
-            const res = await fetch("./config/env", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": currentAdminCode || ""
-              },
-              body: JSON.stringify({
-                admin_code: adminCode,
-                wecom_webhook: wecomWebhook
-              })
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ 系统配置已保存（需要重启服务后生效）";
-                statusEl.className = "text-sm text-green-600";
-              }
-              // 如果更新了管理员验证码，更新本地存储
-              if (adminCode) {
-                localStorage.setItem(ADMIN_CODE_KEY, adminCode);
-              }
-            } else {
-              throw new Error(data.message || "保存失败");
-            }
-          } catch (err) {
-            console.error("保存系统配置失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 保存失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          }
-        }
-
-        async function backupToGitHub() {
-          const btn = document.getElementById("backup-to-github-btn");
-          const statusEl = document.getElementById("config-backup-status");
-          const btnText = document.getElementById("backup-btn-text");
-          
-          if (!btn || !statusEl) return;
-          
-          // 禁用按钮
-          btn.disabled = true;
-          if (btnText) btnText.textContent = "备份中...";
-          
-          if (statusEl) {
-            statusEl.textContent = "正在备份数据，请稍候...";
-            statusEl.className = "text-sm text-blue-600";
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./backup/export-to-github", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || ""
-              }
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              const errorData = await res.json().catch(() => ({ detail: "备份失败" }));
-              throw new Error(errorData.detail || "HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ 备份任务已启动，请查看服务器日志了解执行结果";
-                statusEl.className = "text-sm text-green-600";
-              }
-            } else {
-              throw new Error(data.message || "备份失败");
-            }
-          } catch (err) {
-            console.error("备份失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 备份失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          } finally {
-            // 恢复按钮
-            btn.disabled = false;
-            if (btnText) btnText.textContent = "备份数据到GitHub";
-          }
-        }
-
-        function switchConfigSection(sectionName) {
-          const sections = ["keywords", "schedule", "template", "env", "backup"];
-          const menuBtns = document.querySelectorAll(".config-menu-btn");
-          
-          sections.forEach(function(name) {
-            const sectionEl = document.getElementById("config-" + name + "-section");
-            const btn = document.querySelector('[data-section="' + name + '"]');
-            if (sectionEl) {
-              if (name === sectionName) {
-                sectionEl.classList.remove("hidden");
-                sectionEl.classList.add("block");
-              } else {
-                sectionEl.classList.add("hidden");
-                sectionEl.classList.remove("block");
-              }
-            }
-            if (btn) {
-              if (name === sectionName) {
-                btn.classList.add("is-active");
-                btn.classList.remove("bg-gray-50", "text-gray-900");
-                btn.classList.add("bg-blue-600", "text-white");
-              } else {
-                btn.classList.remove("is-active");
-                btn.classList.remove("bg-blue-600", "text-white");
-                btn.classList.add("bg-gray-50", "text-gray-900");
-              }
-            }
-          });
-          
-          if (sectionName === "keywords") {
-            loadKeywordConfig();
-          } else if (sectionName === "schedule") {
-            loadScheduleConfig();
-          } else if (sectionName === "template") {
-            loadWecomTemplateConfig();
-          } else if (sectionName === "env") {
-            loadEnvConfig();
-          }
-        }
-
-        if (openConfigBtn) {
-          openConfigBtn.addEventListener("click", openConfigModal);
-        }
-        if (closeConfigBtn) {
-          closeConfigBtn.addEventListener("click", closeConfigModal);
-        }
-        if (configModal) {
-          configModal.addEventListener("click", function(event) {
-            if (event.target === configModal) {
-              closeConfigModal();
-            }
-          });
-        }
-
-        async function saveKeywordConfig() {
-          const textarea = document.getElementById("config-keywords-input");
-          const statusEl = document.getElementById("config-keywords-status");
-          if (!textarea) return;
-          
-          const keywords = textarea.value.split("\\n").map(function(k) {
-            return k.trim();
-          }).filter(function(k) {
-            return k.length > 0;
-          });
-          
-          if (keywords.length === 0) {
-            if (statusEl) {
-              statusEl.textContent = "❌ 关键词不能为空";
-              statusEl.className = "text-sm text-red-600";
-            }
-            return;
-          }
-          
-          if (statusEl) {
-            statusEl.textContent = "保存中...";
-            statusEl.className = "text-sm";
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/keywords", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || ""
-              },
-              body: JSON.stringify({ keywords: keywords })
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ 关键词已保存";
-                statusEl.className = "text-sm text-green-600";
-              }
-            } else {
-              throw new Error(data.message || "保存失败");
-            }
-          } catch (err) {
-            console.error("保存关键词失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 保存失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          }
-        }
-
-        async function saveScheduleConfig() {
-          const cronInput = document.getElementById("schedule-cron");
-          const hourInput = document.getElementById("schedule-hour");
-          const minuteInput = document.getElementById("schedule-minute");
-          const countInput = document.getElementById("schedule-count");
-          const maxInput = document.getElementById("schedule-max");
-          const statusEl = document.getElementById("config-schedule-status");
-          
-          const payload = {};
-          if (cronInput && cronInput.value.trim()) {
-            payload.cron = cronInput.value.trim();
-          }
-          if (hourInput && hourInput.value) {
-            payload.hour = parseInt(hourInput.value, 10);
-          }
-          if (minuteInput && minuteInput.value) {
-            payload.minute = parseInt(minuteInput.value, 10);
-          }
-          if (countInput && countInput.value) {
-            payload.count = parseInt(countInput.value, 10);
-          }
-          if (maxInput && maxInput.value) {
-            payload.max_articles_per_keyword = parseInt(maxInput.value, 10);
-          }
-          
-          if (Object.keys(payload).length === 0) {
-            if (statusEl) {
-              statusEl.textContent = "❌ 请至少填写一项配置";
-              statusEl.className = "text-sm text-red-600";
-            }
-            return;
-          }
-          
-          if (statusEl) {
-            statusEl.textContent = "保存中...";
-            statusEl.className = "text-sm";
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/schedule", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || ""
-              },
-              body: JSON.stringify(payload)
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ 调度配置已保存";
-                statusEl.className = "text-sm text-green-600";
-              }
-            } else {
-              throw new Error(data.message || "保存失败");
-            }
-          } catch (err) {
-            console.error("保存调度配置失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 保存失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          }
-        }
-
-        async function saveWecomTemplateConfig() {
-          const textarea = document.getElementById("wecom-template-input");
-          const statusEl = document.getElementById("config-template-status");
-          if (!textarea) return;
-          
-          let template;
-          try {
-            template = JSON.parse(textarea.value);
-          } catch (err) {
-            if (statusEl) {
-              statusEl.textContent = "❌ JSON 格式错误: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-            return;
-          }
-          
-          if (statusEl) {
-            statusEl.textContent = "保存中...";
-            statusEl.className = "text-sm";
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./config/wecom-template", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || ""
-              },
-              body: JSON.stringify({ template: template })
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ 企业微信模板已保存";
-                statusEl.className = "text-sm text-green-600";
-              }
-            } else {
-              throw new Error(data.message || "保存失败");
-            }
-          } catch (err) {
-            console.error("保存模板失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 保存失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          }
-        }
-
-        document.querySelectorAll(".config-menu-btn").forEach(function(btn) {
-          btn.addEventListener("click", function() {
-            const section = btn.getAttribute("data-section");
-            if (section) {
-              switchConfigSection(section);
-            }
-          });
-        });
-
-        document.getElementById("save-keywords-btn").addEventListener("click", saveKeywordConfig);
-        document.getElementById("save-schedule-btn").addEventListener("click", saveScheduleConfig);
-        document.getElementById("save-template-btn").addEventListener("click", saveWecomTemplateConfig);
-        document.getElementById("save-env-btn").addEventListener("click", saveEnvConfig);
-        const backupBtn = document.getElementById("backup-to-github-btn");
-        if (backupBtn) {
-          backupBtn.addEventListener("click", backupToGitHub);
-        }
-
-        // ========== 微信公众号草稿箱功能已暂时屏蔽 ==========
-        // 以下函数暂时屏蔽，但保留代码以便后续启用
-        /*
-        async function loadDraftsList() {
-          const listEl = document.getElementById("drafts-list");
-          const statusEl = document.getElementById("drafts-status");
-          
-          if (!listEl) return;
-          
-          if (statusEl) statusEl.textContent = "";
-          listEl.innerHTML = "加载中...";
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./wechat-mp/drafts?offset=0&count=20", {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              listEl.innerHTML = "<p>需要授权</p>";
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok && data.drafts) {
-              if (data.drafts.length === 0) {
-                listEl.innerHTML = "<p>草稿箱为空</p>";
-                return;
-              }
-              
-              listEl.innerHTML = "";
-              data.drafts.forEach(function(draft) {
-                const mediaId = draft.media_id || draft.media_id;
-                const content = draft.content || {};
-                const newsItem = content.news_item || [];
-                const createTime = content.create_time ? new Date(content.create_time * 1000).toLocaleString() : "未知";
-                
-                const draftDiv = document.createElement("div");
-                draftDiv.className = "draft-item";
-                draftDiv.innerHTML = `
-                  <div class="draft-header">
-                    <div>
-                      <div class="draft-title">草稿 #${mediaId.substring(0, 8)}...</div>
-                      <div class="draft-meta">创建时间: ${createTime} | 文章数: ${newsItem.length}</div>
-                    </div>
-                  </div>
-                  <div class="draft-articles">
-                    ${newsItem.map(function(article, idx) {
-                      const title = (article.title || "无标题").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                      const author = (article.author || "未知").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-                      const url = article.content_source_url || "#";
-                      return `
-                        <div class="draft-article-item">
-                          <strong>${idx + 1}. ${title}</strong>
-                          <div style="font-size: 12px; color: #6b7280; margin-top: 4px;">
-                            作者: ${author} | 
-                            <a href="${url}" target="_blank">原文链接</a>
-                          </div>
-                        </div>
-                      `;
-                    }).join("")}
-                  </div>
-                  <div class="draft-actions-btns">
-                    <button class="btn-success" data-action="edit" data-media-id="${mediaId}">编辑</button>
-                    <button class="btn-primary" data-action="publish" data-media-id="${mediaId}">发布</button>
-                    <button class="btn-secondary" data-action="delete" data-media-id="${mediaId}">删除</button>
-                  </div>
-                `;
-                listEl.appendChild(draftDiv);
-              });
-            } else {
-              listEl.innerHTML = "<p>加载失败</p>";
-            }
-          } catch (err) {
-            console.error("加载草稿列表失败:", err);
-            listEl.innerHTML = "<p>加载失败: " + err.message + "</p>";
-          }
-        }
-
-        async function createDraftFromArticles() {
-          const statusEl = document.getElementById("drafts-status");
-          const articlesData = await fetch("./articles", {
-            headers: { "X-Admin-Code": getAdminCode() || "" }
-          }).then(r => r.json());
-          
-          if (!articlesData.ok || !articlesData.articles || articlesData.articles.length === 0) {
-            if (statusEl) {
-              statusEl.textContent = "❌ 文章池为空，请先添加文章";
-              statusEl.className = "text-sm text-red-600";
-            }
-            return;
-          }
-          
-          // 让用户选择文章（简化版：使用所有文章）
-          const articleUrls = articlesData.articles.map(a => a.url);
-          
-          if (statusEl) {
-            statusEl.textContent = "正在创建草稿...";
-            statusEl.className = "text-sm";
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch("./wechat-mp/create-draft-from-articles", {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || ""
-              },
-              body: JSON.stringify({ article_ids: articleUrls })
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ " + data.message;
-                statusEl.className = "text-sm text-green-600";
-              }
-              loadDraftsList();
-            } else {
-              throw new Error(data.message || "创建失败");
-            }
-          } catch (err) {
-            console.error("创建草稿失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 创建失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          }
-        }
-
-        window.editDraft = async function(mediaId) {
-          const modal = document.getElementById("draft-edit-modal");
-          const contentEl = document.getElementById("draft-edit-content");
-          
-          if (!modal || !contentEl) return;
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch(`./wechat-mp/draft/${mediaId}`, {
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok && data.draft) {
-              const draft = data.draft;
-              const newsItem = draft.news_item || [];
-              
-              if (newsItem.length === 0) {
-                contentEl.innerHTML = "<p>草稿中没有文章</p>";
-                modal.classList.add("is-visible");
-                return;
-              }
-              
-              // 使用 DOM 方法创建元素，避免转义问题
-              contentEl.innerHTML = "";
-              newsItem.forEach(function(article, idx) {
-                const formDiv = document.createElement("div");
-                formDiv.className = "draft-edit-form";
-                
-                const h3 = document.createElement("h3");
-                h3.textContent = "文章 " + (idx + 1);
-                formDiv.appendChild(h3);
-                
-                // 标题（限制 20 个字符）
-                const titleLabel = document.createElement("label");
-                titleLabel.textContent = "标题（20字以内）";
-                formDiv.appendChild(titleLabel);
-                const titleInput = document.createElement("input");
-                titleInput.type = "text";
-                titleInput.id = "draft-title-" + idx;
-                titleInput.value = article.title || "";
-                titleInput.placeholder = "标题（20字以内）";
-                titleInput.maxLength = 20;  // HTML5 最大长度限制
-                // 添加实时字符计数提示
-                const titleCounter = document.createElement("div");
-                titleCounter.id = "draft-title-counter-" + idx;
-                titleCounter.style.cssText = "font-size: 12px; color: #6b7280; margin-top: -10px; margin-bottom: 12px;";
-                titleCounter.textContent = `已输入 ${(article.title || "").length} / 20 字符`;
-                formDiv.appendChild(titleInput);
-                formDiv.appendChild(titleCounter);
-                // 监听输入变化，更新字符计数
-                titleInput.addEventListener("input", function() {
-                  const length = this.value.length;
-                  titleCounter.textContent = `已输入 ${length} / 20 字符`;
-                  if (length > 20) {
-                    titleCounter.style.color = "#ef4444";
-                  } else {
-                    titleCounter.style.color = "#6b7280";
-                  }
-                });
-                
-                // 作者
-                const authorLabel = document.createElement("label");
-                authorLabel.textContent = "作者";
-                formDiv.appendChild(authorLabel);
-                const authorInput = document.createElement("input");
-                authorInput.type = "text";
-                authorInput.id = "draft-author-" + idx;
-                authorInput.value = article.author || "";
-                authorInput.placeholder = "作者";
-                formDiv.appendChild(authorInput);
-                
-                // 内容（HTML编辑器）
-                const contentLabel = document.createElement("label");
-                contentLabel.textContent = "内容（HTML格式）";
-                formDiv.appendChild(contentLabel);
-                
-                // 工具栏
-                const toolbar = document.createElement("div");
-                toolbar.style.cssText = "margin-bottom: 8px; padding: 8px; background: #f5f5f5; border-radius: 4px; display: flex; gap: 8px; flex-wrap: wrap;";
-                toolbar.innerHTML = `
-                  <button type="button" class="html-editor-btn" data-command="bold" title="粗体">B</button>
-                  <button type="button" class="html-editor-btn" data-command="italic" title="斜体">I</button>
-                  <button type="button" class="html-editor-btn" data-command="underline" title="下划线">U</button>
-                  <button type="button" class="html-editor-btn" data-command="formatBlock" data-value="p" title="段落">P</button>
-                  <button type="button" class="html-editor-btn" data-command="insertUnorderedList" title="无序列表">•</button>
-                  <button type="button" class="html-editor-btn" data-command="insertOrderedList" title="有序列表">1.</button>
-                `;
-                formDiv.appendChild(toolbar);
-                
-                // HTML 编辑器（contenteditable div）
-                const contentEditor = document.createElement("div");
-                contentEditor.id = "draft-content-" + idx;
-                contentEditor.contentEditable = true;
-                contentEditor.style.cssText = "min-height: 200px; padding: 12px; border: 1px solid #d1d5db; border-radius: 4px; background: #fff; outline: none;";
-                contentEditor.innerHTML = article.content || "";  // 直接设置 HTML 内容
-                formDiv.appendChild(contentEditor);
-                
-                // 为工具栏按钮绑定事件
-                toolbar.querySelectorAll(".html-editor-btn").forEach(function(btn) {
-                  btn.addEventListener("click", function(e) {
-                    e.preventDefault();
-                    const command = this.getAttribute("data-command");
-                    const value = this.getAttribute("data-value");
-                    contentEditor.focus();
-                    document.execCommand(command, false, value || null);
-                  });
-                });
-                
-                contentEl.appendChild(formDiv);
-              });
-              
-              contentEl.innerHTML += `
-                <div class="form-actions" style="margin-top: 20px;">
-                  <button class="btn-success" data-save-draft="${mediaId}">保存修改</button>
-                  <button class="btn-secondary" onclick="closeDraftEdit()">取消</button>
-                </div>
-              `;
-              
-              // 绑定保存按钮
-              const saveBtn = contentEl.querySelector(`[data-save-draft="${mediaId}"]`);
-              if (saveBtn) {
-                saveBtn.addEventListener("click", function() {
-                  saveDraftEdit(mediaId);
-                });
-              }
-              
-              modal.classList.add("is-visible");
-            }
-          } catch (err) {
-            console.error("加载草稿详情失败:", err);
-            alert("加载草稿详情失败: " + err.message);
-          }
-        }
-
-        window.saveDraftEdit = async function(mediaId) {
-          const contentEl = document.getElementById("draft-edit-content");
-          if (!contentEl) return;
-          
-          const forms = contentEl.querySelectorAll(".draft-edit-form");
-          const articles = [];
-          
-          forms.forEach(function(form, idx) {
-            let title = document.getElementById(`draft-title-${idx}`).value.trim();
-            const author = document.getElementById(`draft-author-${idx}`).value;
-            // 从 contenteditable div 获取 HTML 内容
-            const contentEditor = document.getElementById(`draft-content-${idx}`);
-            const content = contentEditor ? contentEditor.innerHTML : "";
-            
-            // 确保标题在 20 个字符以内
-            const maxTitleLength = 20;
-            if (title.length > maxTitleLength) {
-              // 尝试在合适的位置截断（优先在标点符号、空格处）
-              let truncated = title.substring(0, maxTitleLength);
-              // 查找最后一个标点符号或空格的位置（在截断范围内）
-              const separators = ['。', '，', '、', '：', '；', '！', '？', ' ', '·', '-', '—', '–'];
-              for (let i = 0; i < separators.length; i++) {
-                const sep = separators[i];
-                const lastSepPos = truncated.lastIndexOf(sep);
-                if (lastSepPos > maxTitleLength * 0.6) {  // 至少保留 60% 的内容
-                  truncated = truncated.substring(0, lastSepPos);
-                  break;
-                }
-              }
-              title = truncated;
-              console.log(`标题已缩减: ${document.getElementById(`draft-title-${idx}`).value} -> ${title}`);
-            }
-            
-            articles.push({
-              title: title,
-              author: author,
-              content: content,
-              // 不包含 content_source_url 和 digest
-              thumb_media_id: "",
-              show_cover_pic: 1,
-            });
-          });
-          
-          try {
-            const adminCode = getAdminCode();
-            // 更新每篇文章
-            for (let i = 0; i < articles.length; i++) {
-              const res = await fetch(`./wechat-mp/draft/${mediaId}/update`, {
-                method: "POST",
-                headers: {
-                  "Content-Type": "application/json",
-                  "X-Admin-Code": adminCode || ""
-                },
-                body: JSON.stringify({
-                  index: i,
-                  article: articles[i]
-                })
-              });
-              
-              if (!res.ok) {
-                throw new Error("更新失败");
-              }
-            }
-            
-            alert("草稿更新成功！");
-            closeDraftEdit();
-            loadDraftsList();
-          } catch (err) {
-            console.error("保存草稿失败:", err);
-            alert("保存失败: " + err.message);
-          }
-        }
-
-        window.closeDraftEdit = function() {
-          const modal = document.getElementById("draft-edit-modal");
-          if (modal) {
-            modal.classList.remove("is-visible");
-          }
-        }
-
-        window.publishDraft = async function(mediaId) {
-          if (!confirm("确定要发布这个草稿吗？")) {
-            return;
-          }
-          
-          const statusEl = document.getElementById("drafts-status");
-          if (statusEl) {
-            statusEl.textContent = "正在发布...";
-            statusEl.className = "text-sm";
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch(`./wechat-mp/publish`, {
-              method: "POST",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Admin-Code": adminCode || ""
-              },
-              body: JSON.stringify({ media_id: mediaId })
-            });
-            
-            if (res.status === 401 || res.status === 403) {
-              handleAuthError(statusEl);
-              return;
-            }
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              if (statusEl) {
-                statusEl.textContent = "✅ 发布成功！";
-                statusEl.className = "text-sm text-green-600";
-              }
-              loadDraftsList();
-            } else {
-              throw new Error(data.message || "发布失败");
-            }
-          } catch (err) {
-            console.error("发布草稿失败:", err);
-            if (statusEl) {
-              statusEl.textContent = "❌ 发布失败: " + err.message;
-              statusEl.className = "text-sm text-red-600";
-            }
-          }
-        }
-
-        window.deleteDraft = async function(mediaId) {
-          if (!confirm("确定要删除这个草稿吗？")) {
-            return;
-          }
-          
-          try {
-            const adminCode = getAdminCode();
-            const res = await fetch(`./wechat-mp/draft/${mediaId}/delete`, {
-              method: "POST",
-              headers: { "X-Admin-Code": adminCode || "" }
-            });
-            
-            if (!res.ok) {
-              throw new Error("HTTP " + res.status);
-            }
-            
-            const data = await res.json();
-            if (data.ok) {
-              loadDraftsList();
-            } else {
-              throw new Error(data.message || "删除失败");
-            }
-          } catch (err) {
-            console.error("删除草稿失败:", err);
-            alert("删除失败: " + err.message);
-          }
-        }
-
-        // 绑定草稿箱按钮事件
-        const createDraftBtn = document.getElementById("create-draft-btn");
-        const refreshDraftsBtn = document.getElementById("refresh-drafts-btn");
-        const closeDraftEditBtn = document.getElementById("close-draft-edit-btn");
-        const draftEditModal = document.getElementById("draft-edit-modal");
-        
-        if (createDraftBtn) {
-          createDraftBtn.addEventListener("click", createDraftFromArticles);
-        }
-        if (refreshDraftsBtn) {
-          refreshDraftsBtn.addEventListener("click", loadDraftsList);
-        }
-        if (closeDraftEditBtn) {
-          closeDraftEditBtn.addEventListener("click", closeDraftEdit);
-        }
-        if (draftEditModal) {
-          draftEditModal.addEventListener("click", function(event) {
-            if (event.target.id === "draft-edit-modal") {
-              closeDraftEdit();
-            }
-          });
-        }
-        
-        // 使用事件委托处理草稿操作按钮
-        const draftsList = document.getElementById("drafts-list");
-        if (draftsList) {
-          draftsList.addEventListener("click", function(event) {
-            const btn = event.target;
-            if (btn.hasAttribute("data-action")) {
-              const action = btn.getAttribute("data-action");
-              const mediaId = btn.getAttribute("data-media-id");
-              if (action === "edit") {
-                editDraft(mediaId);
-              } else if (action === "publish") {
-                publishDraft(mediaId);
-              } else if (action === "delete") {
-                deleteDraft(mediaId);
-              }
-            }
-          });
-        }
-
-        // 加载草稿列表（已屏蔽）
-        // loadDraftsList();
-        */
-        
-        // 初始加载：检查是否已有授权码，没有则弹出对话框
-        console.log('[DEBUG] 脚本开始执行');
-        
-        // 确保 DOM 加载完成后再执行
-        if (document.readyState === 'loading') {
-          document.addEventListener('DOMContentLoaded', function() {
-            console.log('[DEBUG] DOM 加载完成，开始初始化面板');
-            initializePanel();
-          });
-        } else {
-          console.log('[DEBUG] DOM 已就绪，立即初始化面板');
-          initializePanel();
-        }
-      </script>
-    </body>
-    </html>
+    页面内容在模块加载时已编码好，客户端支持 gzip 时返回预压缩的内容；
+    压缩与未压缩的内容使用不同的 ETag，浏览器带上对应的 If-None-Match 时直接返回 304。
     """
-    return HTMLResponse(content=html)
-
-
+    client_tags = [tag.strip() for tag in if_none_match.split(",")] if if_none_match else ()
+    if accepts_gzip(accept_encoding):
+        if _PANEL_GZIP_ETAG in client_tags:
+            return Response(status_code=304, headers=_PANEL_GZIP_304_HEADERS)
+        return Response(content=_PANEL_HTML_GZIP, media_type="text/html; charset=utf-8", headers=_PANEL_GZIP_HEADERS)
+    if _PANEL_ETAG in client_tags:
+        return Response(status_code=304, headers=_PANEL_HEADERS)
+    return Response(content=_PANEL_HTML_BYTES, media_type="text/html; charset=utf-8", headers=_PANEL_HEADERS)
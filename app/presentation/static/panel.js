@@ -0,0 +1,2470 @@
+// 最开始的日志，确保脚本执行
+console.log('[DEBUG] ========== 管理员面板脚本开始执行 ==========');
+console.log('[DEBUG] 当前时间:', new Date().toISOString());
+
+const ADMIN_CODE_KEY = "aicoding_admin_code";
+let authFailCount = 0;
+let authBlockedUntil = 0; // timestamp ms
+
+function getAdminCode() {
+  return localStorage.getItem(ADMIN_CODE_KEY) || "";
+}
+
+function setAdminCode(code) {
+  localStorage.setItem(ADMIN_CODE_KEY, code || "");
+}
+
+function showAuthOverlay() {
+  console.log('[DEBUG] showAuthOverlay 开始执行');
+  const overlay = document.getElementById("auth-overlay");
+  const input = document.getElementById("admin-code-input");
+  const statusEl = document.getElementById("auth-status");
+
+  console.log('[DEBUG] 授权对话框元素:', { overlay, input, statusEl });
+
+  if (!overlay) {
+    console.error('[DEBUG] 授权对话框元素未找到！');
+    return;
+  }
+
+  console.log('[DEBUG] 授权对话框当前类名:', overlay.className);
+  overlay.classList.remove("hidden");
+  overlay.classList.add("flex");
+  console.log('[DEBUG] 授权对话框更新后类名:', overlay.className);
+
+  if (statusEl) {
+    statusEl.textContent = "";
+    statusEl.className = "text-sm";
+  }
+  if (input) {
+    input.value = "";
+    input.focus();
+  }
+  console.log('[DEBUG] 授权对话框应该已显示');
+}
+
+function hideAuthOverlay() {
+  console.log('[DEBUG] 隐藏授权对话框');
+  const overlay = document.getElementById("auth-overlay");
+  if (overlay) {
+    overlay.classList.add("hidden");
+    overlay.classList.remove("flex");
+  }
+}
+
+function handleAuthError(contextStatusEl) {
+  const now = Date.now();
+  if (authBlockedUntil && now < authBlockedUntil) {
+    const seconds = Math.ceil((authBlockedUntil - now) / 1000);
+    if (contextStatusEl) {
+      contextStatusEl.textContent = `❌ 授权多次失败，请 ${seconds} 秒后再试`;
+      contextStatusEl.className = "status error";
+    }
+    return false;
+  }
+
+  authFailCount += 1;
+  if (authFailCount >= 5) {
+    // 简单限流：5 次失败后，锁定 60 秒
+    authBlockedUntil = now + 60 * 1000;
+  }
+
+  setAdminCode("");
+  showAuthOverlay();
+  if (contextStatusEl) {
+    contextStatusEl.textContent = "❌ 授权码错误，请重新输入";
+    contextStatusEl.className = "status error";
+  }
+  return false;
+}
+
+async function ensureAdminCode() {
+  console.log('[DEBUG] ensureAdminCode 开始执行');
+  let code = getAdminCode();
+  console.log('[DEBUG] 从 localStorage 获取授权码:', code ? '已存在' : '不存在');
+  if (!code) {
+    console.log('[DEBUG] 授权码不存在，显示授权对话框');
+    showAuthOverlay();
+    return false;
+  }
+  console.log('[DEBUG] 授权码存在，继续执行');
+  return true;
+}
+
+// 已解析的 JSON 响应缓存：key -> { etag, data }，同时写入 sessionStorage 供刷新页面后复用
+const jsonResponseCache = new Map();
+
+// 带 ETag 协商的 JSON 请求：发送上次的 ETag，服务端返回 304 时直接复用已解析的数据，不再重新解析
+// 返回 { res, data, etag }；请求失败时 data 为 null，由调用方根据 res.status 处理
+async function cachedFetchJSON(key, url) {
+  const storageKey = `panel-json:${key}`;
+  let cached = jsonResponseCache.get(key);
+  if (!cached) {
+    try {
+      cached = JSON.parse(sessionStorage.getItem(storageKey) || "null");
+    } catch (e) {
+      cached = null;
+    }
+  }
+
+  const headers = { "X-Admin-Code": getAdminCode() || "" };
+  if (cached && cached.etag) headers["If-None-Match"] = cached.etag;
+  // no-store：由这里自己处理条件请求，避免浏览器 HTTP 缓存把 304 转换成 200
+  const res = await fetch(url, { headers, cache: "no-store" });
+
+  if (res.status === 304 && cached) {
+    jsonResponseCache.set(key, cached);
+    return { res, data: cached.data, etag: cached.etag };
+  }
+  if (!res.ok) {
+    return { res, data: null, etag: null };
+  }
+
+  const data = await res.json();
+  const etag = res.headers.get("ETag");
+  if (etag) {
+    const entry = { etag, data };
+    jsonResponseCache.set(key, entry);
+    try {
+      sessionStorage.setItem(storageKey, JSON.stringify(entry));
+    } catch (e) {
+      // sessionStorage 已满或不可用时只保留内存缓存
+    }
+  }
+  return { res, data, etag };
+}
+
+// 操作成功后的刷新先收集起来，在下一帧统一执行；同一加载函数在一帧内多次请求只执行一次
+const pendingRefreshes = new Set();
+let refreshFlush = null;
+// loadPanelData 的一次 /bootstrap 请求已覆盖这些加载函数
+const PANEL_DATA_LOADERS = new Set([loadArticleList, loadPreview, loadCandidateList]);
+
+// 返回的 Promise 在本帧收集到的刷新全部完成后 resolve
+function scheduleRefresh(loader) {
+  pendingRefreshes.add(loader);
+  if (!refreshFlush) {
+    refreshFlush = new Promise(resolve => {
+      requestAnimationFrame(() => {
+        let loaders = [...pendingRefreshes];
+        pendingRefreshes.clear();
+        refreshFlush = null;
+        if (loaders.includes(loadPanelData)) {
+          loaders = loaders.filter(fn => !PANEL_DATA_LOADERS.has(fn));
+        }
+        resolve(Promise.all(loaders.map(fn => fn())));
+      });
+    });
+  }
+  return refreshFlush;
+}
+
+async function crawlArticles() {
+    const btn = document.getElementById("crawl-btn");
+    const statusEl = document.getElementById("crawl-status");
+
+    btn.disabled = true;
+    statusEl.textContent = "正在从网络抓取文章，请稍候...（可能需要几十秒）";
+    statusEl.className = "text-sm";
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./crawl-articles", {
+            method: "POST",
+            headers: { "X-Admin-Code": adminCode || "" }
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusEl);
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusEl.textContent = `✅ ${data.message}`;
+            statusEl.className = "text-sm text-green-600";
+            scheduleRefresh(loadCandidateList); // Refresh the list
+        } else {
+            statusEl.textContent = `❌ ${data.message || "抓取失败"}`;
+            statusEl.className = "text-sm text-red-600";
+        }
+    } catch (err) {
+        console.error(err);
+        statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
+        statusEl.className = "text-sm text-red-600";
+    } finally {
+        btn.disabled = false;
+    }
+}
+
+async function loadToolKeywords() {
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./tool-keywords", {
+            headers: { "X-Admin-Code": adminCode || "" }
+        });
+        if (res.status === 401 || res.status === 403) {
+            return;
+        }
+        const data = await res.json();
+        if (data.ok) {
+            const select = document.getElementById("tool-keyword-select");
+            const countEl = document.getElementById("tool-keyword-count");
+            if (select) {
+                // 保留第一个选项
+                select.innerHTML = '<option value="">-- 选择工具关键字 --</option>';
+                data.keywords.forEach(keyword => {
+                    const option = document.createElement("option");
+                    option.value = keyword;
+                    option.textContent = keyword;
+                    select.appendChild(option);
+                });
+            }
+            if (countEl) {
+                countEl.textContent = data.count || 0;
+            }
+        }
+    } catch (err) {
+        console.error("加载工具关键字失败:", err);
+    }
+}
+
+async function crawlToolArticles(keyword = null) {
+    const btn = keyword 
+        ? document.getElementById("crawl-tool-article-btn")
+        : document.getElementById("crawl-all-tool-articles-btn");
+    const statusEl = document.getElementById("crawl-tool-article-status");
+
+    btn.disabled = true;
+    statusEl.textContent = keyword 
+        ? `正在爬取工具 "${keyword}" 的相关资讯，请稍候...`
+        : "正在爬取所有工具的相关资讯，请稍候...";
+    statusEl.className = "text-sm";
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./crawl-tool-articles", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || ""
+            },
+            body: JSON.stringify({ keyword: keyword || "" })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusEl);
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusEl.textContent = `✅ ${data.message}`;
+            statusEl.className = "text-sm text-green-600";
+            scheduleRefresh(loadCandidateList); // Refresh the list
+        } else {
+            statusEl.textContent = `❌ ${data.message || "抓取失败"}`;
+            statusEl.className = "text-sm text-red-600";
+        }
+    } catch (err) {
+        console.error(err);
+        statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
+        statusEl.className = "text-sm text-red-600";
+    } finally {
+        btn.disabled = false;
+    }
+}
+
+// 爬取工具
+async function crawlTools() {
+    const sourceUrl = document.getElementById("crawl-tool-url").value.trim();
+    const category = document.getElementById("crawl-tool-category").value;
+    const maxItems = parseInt(document.getElementById("crawl-tool-max").value) || 100;
+    const statusEl = document.getElementById("crawl-tool-status");
+
+    // 验证URL
+    if (!sourceUrl) {
+        statusEl.innerHTML = '<span class="text-red-600">❌ 请输入爬取源URL</span>';
+        return;
+    }
+
+    if (!sourceUrl.startsWith("http://") && !sourceUrl.startsWith("https://")) {
+        statusEl.innerHTML = '<span class="text-red-600">❌ URL格式不正确，必须以 http:// 或 https:// 开头</span>';
+        return;
+    }
+
+    statusEl.innerHTML = '<span class="text-blue-600">🔄 正在爬取工具，请稍候...</span>';
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./crawl-tools", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({
+                source_url: sourceUrl,
+                category: category || null,
+                max_items: maxItems
+            }),
+        });
+
+        if (!res.ok) {
+            const error = await res.json();
+            throw new Error(error.detail || "爬取失败");
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusEl.innerHTML = `<span class="text-green-600">✅ ${data.message}</span>`;
+            // 刷新工具候选池列表
+            setTimeout(() => {
+                scheduleRefresh(loadToolCandidateList);
+                statusEl.innerHTML = "";
+            }, 1000);
+        } else {
+            throw new Error(data.message || "爬取失败");
+        }
+    } catch (err) {
+        console.error("爬取工具失败:", err);
+        statusEl.innerHTML = `<span class="text-red-600">❌ 爬取失败: ${err.message}</span>`;
+    }
+}
+
+// 加载工具候选池
+async function loadToolCandidateList() {
+    const listEl = document.getElementById("tool-candidate-list");
+    if (!listEl) return;
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./tool-candidates", {
+            headers: {
+                "X-Admin-Code": adminCode || "",
+            },
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(listEl);
+            return;
+        }
+
+        const data = await res.json();
+        if (!data.ok) {
+            listEl.innerHTML = `<p class="text-red-600">加载失败: ${data.message || "未知错误"}</p>`;
+            return;
+        }
+
+        const candidates = data.candidates || [];
+
+        if (candidates.length === 0) {
+            listEl.innerHTML = '<p class="text-gray-500">暂无待审核的工具</p>';
+            return;
+        }
+
+        listEl.innerHTML = "";
+        candidates.forEach((tool) => {
+            const div = document.createElement("div");
+            div.className = "border border-gray-200 rounded-lg p-4 mb-3";
+            const nameEscaped = tool.name.replace(/</g, "&lt;").replace(/>/g, "&gt;");
+            const descEscaped = (tool.description || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+            const urlEscaped = tool.url.replace(/</g, "&lt;").replace(/>/g, "&gt;");
+
+            div.innerHTML = `
+                <div class="flex justify-between items-start mb-2">
+                    <div class="flex-1">
+                        <h4 class="font-semibold text-gray-900">${nameEscaped}</h4>
+                        <p class="text-sm text-gray-600 mt-1">${descEscaped}</p>
+                        <a href="${urlEscaped}" target="_blank" class="text-sm text-blue-600 hover:underline mt-1 block">${urlEscaped}</a>
+                        <div class="text-xs text-gray-500 mt-2">
+                            分类: ${tool.category || "未分类"} | 
+                            提交时间: ${tool.submitted_at ? new Date(tool.submitted_at).toLocaleString("zh-CN") : "未知"}
+                        </div>
+                    </div>
+                </div>
+                <div class="flex gap-2 mt-3">
+                    <button class="px-3 py-1 bg-green-600 text-white text-sm rounded hover:bg-green-700" data-url="${urlEscaped}" data-category="${tool.category || "other"}">采纳</button>
+                    <button class="px-3 py-1 bg-gray-600 text-white text-sm rounded hover:bg-gray-700" data-url="${urlEscaped}">忽略</button>
+                </div>
+            `;
+
+            div.querySelector("button.bg-green-600").addEventListener("click", () => {
+                const promptText = "请选择工具分类:\nide, plugin, cli, codeagent, ai-test, review, devops, doc, design, ui, mcp, other";
+                const category = prompt(promptText, tool.category || "other");
+                if (category) {
+                    acceptToolCandidate(tool.url, category);
+                }
+            });
+            div.querySelector("button.bg-gray-600").addEventListener("click", () => rejectToolCandidate(tool.url));
+
+            listEl.appendChild(div);
+        });
+    } catch (err) {
+        console.error("加载工具候选池失败:", err);
+        listEl.innerHTML = `<p class="text-red-600">加载失败: ${err.message}</p>`;
+    }
+}
+
+async function acceptToolCandidate(url, category) {
+    const listEl = document.getElementById("tool-candidate-list");
+    const statusMsg = document.createElement("div");
+    statusMsg.className = "text-sm text-blue-600 mb-2";
+    statusMsg.textContent = "正在采纳工具...";
+    listEl.insertBefore(statusMsg, listEl.firstChild);
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./accept-tool-candidate", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({ url: url, category: category })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusMsg);
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusMsg.textContent = `✅ ${data.message}`;
+            statusMsg.className = "text-sm text-green-600 mb-2";
+            setTimeout(() => {
+                statusMsg.remove();
+                scheduleRefresh(loadToolCandidateList);
+            }, 2000);
+        } else {
+            statusMsg.textContent = `❌ ${data.message || "采纳失败"}`;
+            statusMsg.className = "text-sm text-red-600 mb-2";
+        }
+    } catch (err) {
+        console.error(err);
+        statusMsg.textContent = "❌ 请求失败，请查看浏览器控制台。";
+        statusMsg.className = "text-sm text-red-600 mb-2";
+    }
+}
+
+async function rejectToolCandidate(url) {
+    const listEl = document.getElementById("tool-candidate-list");
+    const statusMsg = document.createElement("div");
+    statusMsg.className = "text-sm text-blue-600 mb-2";
+    statusMsg.textContent = "正在忽略工具...";
+    listEl.insertBefore(statusMsg, listEl.firstChild);
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./reject-tool-candidate", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({ url: url })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusMsg);
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusMsg.textContent = `✅ ${data.message}`;
+            statusMsg.className = "text-sm text-green-600 mb-2";
+            setTimeout(() => {
+                statusMsg.remove();
+                scheduleRefresh(loadToolCandidateList);
+            }, 2000);
+        } else {
+            statusMsg.textContent = `❌ ${data.message || "忽略失败"}`;
+            statusMsg.className = "text-sm text-red-600 mb-2";
+        }
+    } catch (err) {
+        console.error(err);
+        statusMsg.textContent = "❌ 请求失败，请查看浏览器控制台。";
+        statusMsg.className = "text-sm text-red-600 mb-2";
+    }
+}
+
+async function loadCandidateList() {
+    console.log('[DEBUG] loadCandidateList 开始执行');
+    const listEl = document.getElementById("candidate-list");
+    const statusEl = document.getElementById("crawl-status");
+    if (!listEl) {
+        console.error('[DEBUG] candidate-list 元素未找到');
+        return;
+    }
+    if (!listEl.dataset.etag) listEl.innerHTML = "加载中...";
+
+    try {
+        console.log('[DEBUG] 请求候选列表，URL: ./candidates');
+        const { res, data, etag } = await cachedFetchJSON("candidates", "./candidates");
+        console.log('[DEBUG] 候选列表响应状态:', res.status, res.statusText);
+
+        if (res.status === 401 || res.status === 403) {
+            console.log('[DEBUG] 授权失败，状态码:', res.status);
+            delete listEl.dataset.etag;
+            handleAuthError(statusEl);
+            return;
+        }
+
+        if (!data) {
+            console.error('[DEBUG] 请求失败，状态码:', res.status);
+            delete listEl.dataset.etag;
+            listEl.innerHTML = `<p class="text-red-600">请求失败: HTTP ${res.status}</p>`;
+            return;
+        }
+
+        // 内容与当前渲染的版本相同时保留现有列表，不重建 DOM
+        if (etag && listEl.dataset.etag === etag) return;
+        console.log('[DEBUG] 候选列表数据:', data);
+        renderCandidateList(listEl, data);
+        listEl.dataset.etag = etag || "";
+    } catch (err) {
+        console.error('[DEBUG] loadCandidateList 出错:', err);
+        delete listEl.dataset.etag;
+        listEl.innerHTML = `<p class="text-red-600">加载候选文章失败: ${err.message}</p>`;
+    }
+}
+
+// 渲染候选池列表，data 为 /candidates 的响应结构 { ok, grouped_candidates }
+function renderCandidateList(listEl, data) {
+    if (!data.ok || !data.grouped_candidates || Object.keys(data.grouped_candidates).length === 0) {
+        console.log('[DEBUG] 没有候选文章');
+        listEl.innerHTML = '<p class="text-gray-600">当前没有待审核的文章。</p>';
+        return;
+    }
+
+    listEl.innerHTML = "";
+    Object.keys(data.grouped_candidates).forEach(keyword => {
+        const articles = data.grouped_candidates[keyword];
+        const groupContainer = document.createElement("div");
+        groupContainer.className = "mb-6";
+
+        const groupTitle = document.createElement("h3");
+        groupTitle.className = "text-base font-semibold text-gray-900 mb-3";
+        const keywordEscaped = keyword.replace(/</g, "&lt;").replace(/>/g, "&gt;");
+        groupTitle.innerHTML = `关键词: ${keywordEscaped} <span class="text-gray-500">(${articles.length}篇)</span>`;
+        groupContainer.appendChild(groupTitle);
+
+        articles.forEach((item, idx) => {
+            // 保存候选文章信息，用于归档时自动填充工具标签
+            candidateArticlesMap[item.url] = item;
+
+            const div = document.createElement("div");
+            div.className = "bg-white rounded-lg p-4 mb-3 border border-gray-200 shadow-sm";
+            const urlEscaped = item.url.replace(/'/g, "&#39;").replace(/"/g, "&quot;");
+            const titleEscaped = (item.title || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+            const sourceEscaped = (item.source || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+            const summaryEscaped = (item.summary || "").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+            const isArchived = item.is_archived || false;
+
+            // 构建标签区域
+            let tagsHtml = '';
+            if (isArchived) {
+                tagsHtml = '<span class="px-2 py-1 bg-purple-100 text-purple-700 text-xs rounded-full font-medium">已归档</span>';
+            }
+
+            // 构建按钮区域
+            let archiveButtonHtml = '';
+            if (isArchived) {
+                archiveButtonHtml = '<button class="px-3 py-1 bg-gray-400 text-white text-xs rounded-lg cursor-not-allowed opacity-50" disabled>已归档</button>';
+            } else {
+                archiveButtonHtml = `<button class="px-3 py-1 bg-blue-600 text-white text-xs rounded-lg hover:bg-blue-700 transition-colors archive-btn" data-url="${urlEscaped}">归档</button>`;
+            }
+
+            div.innerHTML = `
+                <div class="flex justify-between items-start mb-2">
+                  <div class="flex-1">
+                    <div class="font-semibold text-gray-900 mb-1 flex items-center gap-2">
+                      <span>${idx + 1}.</span>
+                      <a href="${item.url}" target="_blank" rel="noopener noreferrer" class="text-blue-600 hover:text-blue-700">${titleEscaped}</a>
+                      ${tagsHtml}
+                    </div>
+                  </div>
+                  <div class="flex gap-2 ml-4">
+                    <button class="px-3 py-1 bg-green-600 text-white text-xs rounded-lg hover:bg-green-700 transition-colors" data-url="${urlEscaped}">采纳</button>
+                    ${archiveButtonHtml}
+                    <button class="px-3 py-1 bg-gray-600 text-white text-xs rounded-lg hover:bg-gray-700 transition-colors" data-url="${urlEscaped}">忽略</button>
+                  </div>
+                </div>
+                <div class="text-xs text-gray-600 mb-1">来源：${sourceEscaped}</div>
+                <div class="text-sm text-gray-700">${summaryEscaped}</div>
+            `;
+
+            div.querySelector("button.bg-green-600").addEventListener("click", () => acceptCandidate(item.url));
+            if (!isArchived) {
+                div.querySelector("button.archive-btn").addEventListener("click", () => showArchiveModal(item.url));
+            }
+            div.querySelector("button.bg-gray-600").addEventListener("click", () => rejectCandidate(item.url));
+
+            groupContainer.appendChild(div);
+        });
+        listEl.appendChild(groupContainer);
+    });
+}
+
+async function acceptCandidate(url) {
+    const statusEl = document.getElementById("crawl-status");
+    statusEl.textContent = "正在采纳文章...";
+    statusEl.className = "text-sm";
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./accept-candidate", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({ url: url })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusEl);
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusEl.textContent = `✅ ${data.message}`;
+            statusEl.className = "text-sm text-green-600";
+            scheduleRefresh(loadCandidateList);
+            scheduleRefresh(loadToolCandidateList);
+            scheduleRefresh(loadPanelData);
+        } else {
+            statusEl.textContent = `❌ ${data.message || "采纳失败"}`;
+            statusEl.className = "text-sm text-red-600";
+        }
+    } catch (err) {
+        console.error(err);
+        statusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
+        statusEl.className = "text-sm text-red-600";
+    }
+}
+
+async function rejectCandidate(url) {
+    const statusEl = document.getElementById("crawl-status");
+    statusEl.textContent = "正在忽略文章...";
+    statusEl.className = "text-sm";
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./reject-candidate", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({ url: url })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusEl);
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            statusEl.textContent = `✅ ${data.message}`;
+            statusEl.className = "text-sm text-green-600";
+            scheduleRefresh(loadCandidateList);
+            scheduleRefresh(loadPreview);
+        } else {
+            statusEl.textContent = `❌ ${data.message || "忽略失败"}`;
+            statusEl.className = "text-sm text-red-600";
+        }
+    } catch (err) {
+        console.error(err);
+        statusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
+        statusEl.className = "text-sm text-red-600";
+    }
+}
+
+let currentArchiveUrl = null;
+let archiveSource = null; // 'candidate' 或 'article'
+let candidateArticlesMap = {}; // 存储候选文章信息，key为URL
+
+function showArchiveModal(url, source = 'candidate') {
+    currentArchiveUrl = url;
+    archiveSource = source; // 记录归档来源
+    const modal = document.getElementById("archive-modal");
+    const statusEl = document.getElementById("archive-status");
+    const categorySelect = document.getElementById("archive-category");
+    const toolTagsInput = document.getElementById("archive-tool-tags");
+
+    if (modal) {
+        modal.classList.remove("hidden");
+        modal.classList.add("flex");
+    }
+    if (statusEl) {
+        statusEl.textContent = "";
+        statusEl.className = "text-sm";
+    }
+    if (categorySelect) {
+        categorySelect.value = "programming";
+    }
+    if (toolTagsInput) {
+        // 如果是候选池归档，自动从候选文章信息中提取工具名称
+        if (source === 'candidate') {
+            const articleInfo = candidateArticlesMap[url];
+            if (articleInfo && articleInfo.crawled_from && articleInfo.crawled_from.startsWith("tool_keyword:")) {
+                const toolName = articleInfo.crawled_from.replace("tool_keyword:", "").trim();
+                toolTagsInput.value = toolName;
+            } else {
+                toolTagsInput.value = "";
+            }
+        } else {
+            toolTagsInput.value = "";
+        }
+    }
+}
+
+function hideArchiveModal() {
+    const modal = document.getElementById("archive-modal");
+    if (modal) {
+        modal.classList.add("hidden");
+        modal.classList.remove("flex");
+    }
+    currentArchiveUrl = null;
+    archiveSource = null;
+}
+
+async function archiveCandidate(url, category, toolTags) {
+    const statusEl = document.getElementById("crawl-status");
+    const archiveStatusEl = document.getElementById("archive-status");
+
+    archiveStatusEl.textContent = "正在归档文章...";
+    archiveStatusEl.className = "text-sm text-blue-600";
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./archive-candidate", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({ 
+                url: url, 
+                category: category,
+                tool_tags: toolTags || []
+            })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(statusEl);
+            hideArchiveModal();
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            archiveStatusEl.textContent = `✅ ${data.message}`;
+            archiveStatusEl.className = "text-sm text-green-600";
+            statusEl.textContent = `✅ ${data.message}`;
+            statusEl.className = "text-sm text-green-600";
+
+            // 延迟关闭对话框，让用户看到成功消息
+            setTimeout(() => {
+                hideArchiveModal();
+                scheduleRefresh(loadCandidateList);
+                scheduleRefresh(loadPreview);
+            }, 1500);
+        } else {
+            archiveStatusEl.textContent = `❌ ${data.message || "归档失败"}`;
+            archiveStatusEl.className = "text-sm text-red-600";
+        }
+    } catch (err) {
+        console.error(err);
+        archiveStatusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
+        archiveStatusEl.className = "text-sm text-red-600";
+    }
+}
+
+// 从文章池归档文章
+async function archiveArticleFromPool(url, category, toolTags) {
+    const archiveStatusEl = document.getElementById("archive-status");
+
+    if (!archiveStatusEl) {
+        console.error("archive-status 元素未找到");
+        return;
+    }
+
+    archiveStatusEl.textContent = "正在归档文章...";
+    archiveStatusEl.className = "text-sm text-blue-600";
+
+    try {
+        const adminCode = getAdminCode();
+        const res = await fetch("./archive-article", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-Admin-Code": adminCode || "",
+            },
+            body: JSON.stringify({ 
+                url: url, 
+                category: category,
+                tool_tags: toolTags || []
+            })
+        });
+
+        if (res.status === 401 || res.status === 403) {
+            handleAuthError(archiveStatusEl);
+            hideArchiveModal();
+            return;
+        }
+
+        const data = await res.json();
+        if (data.ok) {
+            archiveStatusEl.textContent = `✅ ${data.message}`;
+            archiveStatusEl.className = "text-sm text-green-600";
+
+            // 延迟关闭对话框，让用户看到成功消息，然后重新加载文章列表更新状态
+            setTimeout(() => {
+                hideArchiveModal();
+                scheduleRefresh(loadArticleList); // 重新加载文章列表，更新归档状态
+            }, 1500);
+        } else {
+            archiveStatusEl.textContent = `❌ ${data.message || "归档失败"}`;
+            archiveStatusEl.className = "text-sm text-red-600";
+        }
+    } catch (err) {
+        console.error(err);
+        archiveStatusEl.textContent = "❌ 请求失败，请查看浏览器控制台。";
+        archiveStatusEl.className = "text-sm text-red-600";
+    }
+}
+
+// 创建带 class 和文本的元素
+function createEl(tag, className, text) {
+  const el = document.createElement(tag);
+  if (className) el.className = className;
+  if (text !== undefined) el.textContent = text;
+  return el;
+}
+
+async function loadArticleList() {
+  console.log('[DEBUG] loadArticleList 开始执行');
+  const listEl = document.getElementById("article-list");
+  const statusEl = document.getElementById("list-status");
+  if (!listEl) {
+    console.error('[DEBUG] article-list 元素未找到');
+    return;
+  }
+  if (statusEl) statusEl.textContent = "";
+  if (!listEl.dataset.etag) listEl.innerHTML = "加载中...";
+
+  try {
+    console.log('[DEBUG] 请求文章列表，URL: ./articles');
+    const { res, data, etag } = await cachedFetchJSON("articles", "./articles");
+    console.log('[DEBUG] 文章列表响应状态:', res.status, res.statusText);
+
+    if (res.status === 401 || res.status === 403) {
+      console.log('[DEBUG] 授权失败，状态码:', res.status);
+      delete listEl.dataset.etag;
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!data) {
+      console.error('[DEBUG] 请求失败，状态码:', res.status);
+      delete listEl.dataset.etag;
+      listEl.innerHTML = `<p class="text-red-600">请求失败: HTTP ${res.status}</p>`;
+      return;
+    }
+
+    // 内容与当前渲染的版本相同时保留现有列表，不重建 DOM
+    if (etag && listEl.dataset.etag === etag) return;
+    console.log('[DEBUG] 文章列表数据:', data);
+    renderArticleList(listEl, data);
+    listEl.dataset.etag = etag || "";
+  } catch (err) {
+    console.error('[DEBUG] loadArticleList 出错:', err);
+    delete listEl.dataset.etag;
+    listEl.innerHTML = `<p class="text-red-600">加载失败: ${err.message}</p>`;
+  }
+}
+
+// 渲染文章池列表，data 为 /articles 的响应结构 { ok, articles }
+function renderArticleList(listEl, data) {
+  if (!data.ok || !data.articles || data.articles.length === 0) {
+    console.log('[DEBUG] 没有已配置的文章');
+    listEl.innerHTML = '<p class="text-gray-600">当前没有已配置的文章。</p>';
+    return;
+  }
+
+  // 用 DOM 节点构建列表，文本直接写入 textContent，无需手动转义
+  const frag = document.createDocumentFragment();
+  data.articles.forEach((item, idx) => {
+    const div = createEl("div", "bg-white rounded-lg p-4 mb-3 border border-gray-200 shadow-sm");
+
+    // 检查归档状态
+    const isArchived = item.is_archived || false;
+
+    const titleRow = createEl("div", "font-semibold text-gray-900 mb-1 flex items-center gap-2");
+    const link = createEl("a", "text-blue-600 hover:text-blue-700", item.title || "");
+    link.href = item.url;
+    link.target = "_blank";
+    link.rel = "noopener noreferrer";
+    titleRow.append(`${idx + 1}. `, link);
+    if (isArchived) {
+      titleRow.appendChild(createEl("span", "px-2 py-1 bg-purple-100 text-purple-700 text-xs rounded-full font-medium mr-2", "已归档"));
+    }
+    const titleCol = createEl("div", "flex-1");
+    titleCol.appendChild(titleRow);
+
+    // 归档按钮
+    let archiveBtn;
+    if (isArchived) {
+      archiveBtn = createEl("button", "px-3 py-1 bg-gray-400 text-white text-xs rounded-lg cursor-not-allowed opacity-50", "已归档");
+      archiveBtn.disabled = true;
+    } else {
+      archiveBtn = createEl("button", "px-3 py-1 bg-blue-600 text-white text-xs rounded-lg hover:bg-blue-700 transition-colors archive-article-btn", "归档");
+      archiveBtn.dataset.url = item.url;
+      archiveBtn.addEventListener("click", function() {
+        showArchiveModal(item.url, 'article'); // 标记为从文章池归档
+      });
+    }
+
+    // 删除按钮
+    const deleteBtn = createEl("button", "px-3 py-1 bg-red-600 text-white text-xs rounded-lg hover:bg-red-700 transition-colors delete-article-btn", "删除");
+    deleteBtn.dataset.url = item.url;
+    deleteBtn.addEventListener("click", function() {
+      deleteArticle(item.url);
+    });
+
+    const actions = createEl("div", "ml-4 flex gap-2");
+    actions.append(archiveBtn, deleteBtn);
+    const header = createEl("div", "flex justify-between items-start mb-2");
+    header.append(titleCol, actions);
+
+    div.append(
+      header,
+      createEl("div", "text-xs text-gray-600 mb-1", `来源：${item.source || ""}`),
+      createEl("div", "text-sm text-gray-700", item.summary || "")
+    );
+    frag.appendChild(div);
+  });
+  listEl.replaceChildren(frag);
+  console.log('[DEBUG] 文章列表加载完成，共', data.articles.length, '篇');
+}
+
+async function deleteArticle(url) {
+  if (!confirm("确定要删除这篇文章吗？")) {
+    return;
+  }
+
+  const statusEl = document.getElementById("list-status");
+  statusEl.textContent = "正在删除...";
+  statusEl.className = "status";
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./delete-article", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || "",
+      },
+      body: JSON.stringify({ url: url })
+    });
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+    const data = await res.json();
+
+    if (data.ok) {
+      statusEl.textContent = `✅ ${data.message}`;
+      statusEl.className = "text-sm text-green-600";
+      // 重新加载文章列表和预览
+      scheduleRefresh(loadPanelData);
+    } else {
+      statusEl.textContent = `❌ ${data.message || "删除失败"}`;
+      statusEl.className = "text-sm text-red-600";
+    }
+  } catch (err) {
+    console.error(err);
+    statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
+    statusEl.className = "status error";
+  }
+}
+
+async function loadPreview() {
+  console.log('[DEBUG] loadPreview 开始执行');
+  const metaEl = document.getElementById("meta");
+  const listEl = document.getElementById("articles");
+  const statusEl = document.getElementById("status");
+  if (!metaEl || !listEl || !statusEl) {
+    console.error("[DEBUG] 预览元素未找到", { metaEl, listEl, statusEl });
+    return;
+  }
+  statusEl.textContent = "";
+  listEl.innerHTML = "";
+  metaEl.textContent = "加载中...";
+
+  // 预览每次随机抽样，服务端不提供 ETag，这里不经过 cachedFetchJSON
+  try {
+    const adminCode = getAdminCode();
+    console.log('[DEBUG] 请求预览数据，URL: ./preview');
+    const res = await fetch("./preview", {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+    console.log('[DEBUG] 预览响应状态:', res.status, res.statusText);
+
+    if (res.status === 401 || res.status === 403) {
+      console.log('[DEBUG] 授权失败，状态码:', res.status);
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      console.error('[DEBUG] 请求失败，状态码:', res.status);
+      metaEl.textContent = `请求失败: HTTP ${res.status}`;
+      return;
+    }
+
+    const data = await res.json();
+    console.log('[DEBUG] 预览数据:', data);
+    renderPreview(metaEl, listEl, data);
+  } catch (err) {
+    console.error('[DEBUG] loadPreview 出错:', err);
+    metaEl.textContent = `加载失败: ${err.message}`;
+  }
+}
+
+// 渲染日报预览，data 为 /preview 的响应结构
+function renderPreview(metaEl, listEl, data) {
+  metaEl.textContent = `日期：${data.date} ｜ 主题：${data.theme} ｜ 定时：${String(data.schedule.hour).padStart(2,'0')}:${String(data.schedule.minute).padStart(2,'0')} ｜ 篇数：${data.schedule.count}`;
+
+  if (!data.articles || data.articles.length === 0) {
+    console.log('[DEBUG] 预览中没有可用文章');
+    listEl.innerHTML = '<p class="text-gray-600">当前配置下没有可用文章，请在服务器的 data/articles/ai_articles.json 中添加。</p>';
+    return;
+  }
+
+  // 与文章池列表相同，用 DOM 节点构建后一次性替换，文本写入 textContent，不经过 HTML 解析
+  const frag = document.createDocumentFragment();
+  data.articles.forEach((item, idx) => {
+    const div = createEl("div", "bg-white rounded-lg p-4 mb-3 border border-gray-200 shadow-sm");
+    const titleRow = createEl("div", "font-semibold text-gray-900 mb-1");
+    const link = createEl("a", "text-blue-600 hover:text-blue-700", item.title || "");
+    link.href = item.url;
+    link.target = "_blank";
+    link.rel = "noopener noreferrer";
+    titleRow.append(`${idx + 1}. `, link);
+
+    div.append(
+      titleRow,
+      createEl("div", "text-xs text-gray-600 mb-1", `来源：${item.source || ""}`),
+      createEl("div", "text-sm text-gray-700", item.summary || "")
+    );
+    frag.appendChild(div);
+  });
+  listEl.replaceChildren(frag);
+  console.log('[DEBUG] 预览加载完成，共', data.articles.length, '篇');
+}
+
+// 一次请求 /bootstrap 同时刷新文章池列表、日报预览和候选池列表
+async function loadPanelData() {
+  const articleListEl = document.getElementById("article-list");
+  const listStatusEl = document.getElementById("list-status");
+  const metaEl = document.getElementById("meta");
+  const previewListEl = document.getElementById("articles");
+  const statusEl = document.getElementById("status");
+  const candidateListEl = document.getElementById("candidate-list");
+  if (!articleListEl || !metaEl || !previewListEl || !statusEl || !candidateListEl) {
+    console.error("[DEBUG] 面板元素未找到");
+    return;
+  }
+  if (listStatusEl) listStatusEl.textContent = "";
+  statusEl.textContent = "";
+  // 这里整体重新渲染，清除单个接口记录的已渲染版本
+  delete articleListEl.dataset.etag;
+  delete candidateListEl.dataset.etag;
+  articleListEl.innerHTML = "加载中...";
+  previewListEl.innerHTML = "";
+  metaEl.textContent = "加载中...";
+  candidateListEl.innerHTML = "加载中...";
+
+  try {
+    // 首次加载优先使用页面 head 中已发出的预取请求
+    const prefetched = window.panelBootstrapPromise;
+    window.panelBootstrapPromise = null;
+    const adminCode = getAdminCode();
+    const res = await (prefetched || fetch("./bootstrap", {
+      headers: { "X-Admin-Code": adminCode || "" },
+    }));
+
+    if (res.status === 401 || res.status === 403) {
+      console.log('[DEBUG] 授权失败，状态码:', res.status);
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      console.error('[DEBUG] 请求失败，状态码:', res.status);
+      articleListEl.innerHTML = `<p class="text-red-600">请求失败: HTTP ${res.status}</p>`;
+      metaEl.textContent = `请求失败: HTTP ${res.status}`;
+      candidateListEl.innerHTML = `<p class="text-red-600">请求失败: HTTP ${res.status}</p>`;
+      return;
+    }
+
+    const data = await res.json();
+    renderArticleList(articleListEl, { ok: data.ok, articles: data.articles });
+    renderPreview(metaEl, previewListEl, data.preview);
+    renderCandidateList(candidateListEl, { ok: data.ok, grouped_candidates: data.grouped_candidates });
+  } catch (err) {
+    console.error('[DEBUG] loadPanelData 出错:', err);
+    articleListEl.innerHTML = `<p class="text-red-600">加载失败: ${err.message}</p>`;
+    metaEl.textContent = `加载失败: ${err.message}`;
+    candidateListEl.innerHTML = `<p class="text-red-600">加载候选文章失败: ${err.message}</p>`;
+  }
+}
+
+// 回车提交不经过按钮的 disabled 状态，用标志保证同一时间只有一个添加请求在执行；
+// 同一批URL在 ADD_RESUBMIT_TTL_MS 内重复提交直接忽略，避免服务端重复爬取
+const ADD_RESUBMIT_TTL_MS = 2000;
+// 与服务端批量接口的URL数量上限一致
+const MAX_BATCH_URLS = 50;
+let addInFlight = false;
+let lastAddSubmission = { key: "", at: 0 };
+
+async function addArticle() {
+  if (addInFlight) return;
+  const urlInput = document.getElementById("article-url");
+  const btn = document.getElementById("add-article-btn");
+  const statusEl = document.getElementById("add-status");
+  // 按空白（含换行）拆分，去重
+  const urls = [...new Set(urlInput.value.split(/\s+/).filter(Boolean))];
+
+  if (urls.length === 0) {
+    statusEl.textContent = "❌ 请输入文章URL";
+    statusEl.className = "status error";
+    return;
+  }
+  if (urls.length > MAX_BATCH_URLS) {
+    statusEl.textContent = `❌ 一次最多添加 ${MAX_BATCH_URLS} 篇文章`;
+    statusEl.className = "status error";
+    return;
+  }
+  const isBatch = urls.length > 1;
+
+  const submissionKey = urls.join("\n");
+  const now = Date.now();
+  if (submissionKey === lastAddSubmission.key && now - lastAddSubmission.at < ADD_RESUBMIT_TTL_MS) {
+    return;
+  }
+  lastAddSubmission = { key: submissionKey, at: now };
+
+  addInFlight = true;
+  btn.disabled = true;
+  statusEl.textContent = isBatch ? `正在爬取 ${urls.length} 篇文章信息，请稍候...` : "正在爬取文章信息，请稍候...";
+  statusEl.className = "status";
+
+  try {
+    const adminCode = getAdminCode();
+    // 多个URL一次提交到批量接口，由服务端并发爬取
+    const res = await fetch(isBatch ? "./add-articles" : "./add-article", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || "",
+      },
+      body: JSON.stringify(isBatch ? { urls: urls } : { url: urls[0] })
+    });
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    // 检查 HTTP 状态码
+    if (!res.ok) {
+      let errorText = "未知错误";
+      try {
+        const errorData = await res.json();
+        errorText = errorData.detail || errorData.message || errorText;
+      } catch {
+        try {
+          errorText = await res.text();
+        } catch {
+          errorText = `HTTP ${res.status}`;
+        }
+      }
+      statusEl.textContent = `❌ 服务器错误 (${res.status})：${errorText}`;
+      statusEl.className = "text-sm text-red-600";
+      return;
+    }
+
+    const data = await res.json();
+
+    if (isBatch) {
+      const failed = data.results.filter(r => !r.ok);
+      statusEl.textContent = `${data.ok ? "✅" : "❌"} ${data.message}` +
+        (failed.length ? `；未添加：${failed.map(r => `${r.url}（${r.message}）`).join("；")}` : "");
+      statusEl.className = data.ok ? "text-sm text-green-600" : "text-sm text-red-600";
+      // 只保留未添加成功的URL，便于重试
+      urlInput.value = failed.map(r => r.url).join("\n");
+      if (data.ok) {
+        scheduleRefresh(loadPanelData);
+      }
+    } else if (data.ok) {
+      statusEl.textContent = `✅ ${data.message}：${data.article.title}`;
+      statusEl.className = "text-sm text-green-600";
+      urlInput.value = "";
+      // 添加成功后重新加载文章列表和预览
+      scheduleRefresh(loadPanelData);
+    } else {
+      statusEl.textContent = `❌ ${data.message || "添加失败"}`;
+      statusEl.className = "text-sm text-red-600";
+    }
+  } catch (err) {
+    console.error(err);
+    let errorMsg = "❌ 请求失败";
+    if (err instanceof TypeError && err.message.includes("fetch")) {
+      errorMsg += "：无法连接到服务器，请检查服务是否正常运行";
+    } else if (err.message) {
+      errorMsg += `：${err.message}`;
+    } else {
+      errorMsg += "，请查看浏览器控制台或服务器日志";
+    }
+    statusEl.textContent = errorMsg;
+    statusEl.className = "status error";
+  } finally {
+    // 从请求结束时开始计算重复提交的间隔，爬取耗时较长时也能挡住紧随其后的回车
+    lastAddSubmission.at = Date.now();
+    addInFlight = false;
+    btn.disabled = false;
+  }
+}
+
+async function triggerOnce() {
+  const btn = document.getElementById("trigger-btn");
+  const statusEl = document.getElementById("status");
+  btn.disabled = true;
+  statusEl.textContent = "正在触发推送，请稍候...";
+  try {
+    const adminCode = getAdminCode();
+    // 不等待企业微信接口返回，推送在服务端后台进行
+    const res = await fetch("./trigger?wait=false", {
+      method: "POST",
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+    const data = await res.json();
+    if (data.ok) {
+      statusEl.textContent = data.queued
+        ? `✅ 推送已提交，正在后台发送：${data.date} ｜ 主题：${data.theme}`
+        : `✅ 已触发一次推送：${data.date} ｜ 主题：${data.theme}`;
+    } else {
+      statusEl.textContent = "❌ 推送失败，请查看服务器日志。";
+    }
+  } catch (err) {
+    console.error(err);
+    statusEl.textContent = "❌ 请求失败，请查看浏览器控制台或服务器日志。";
+  } finally {
+    btn.disabled = false;
+  }
+
+  // 触发后用一次 /bootstrap 请求刷新文章池、预览和候选池，保证展示的内容与最近一次一致
+  // 刷新会清空状态栏，完成后恢复本次推送的结果提示
+  const message = statusEl.textContent;
+  await scheduleRefresh(loadPanelData);
+  statusEl.textContent = message;
+}
+
+document.getElementById("crawl-btn").addEventListener("click", crawlArticles);
+document.getElementById("crawl-tool-article-btn").addEventListener("click", function() {
+    const select = document.getElementById("tool-keyword-select");
+    const keyword = select ? select.value : null;
+    if (!keyword) {
+        alert("请先选择工具关键字");
+        return;
+    }
+    crawlToolArticles(keyword);
+});
+document.getElementById("crawl-all-tool-articles-btn").addEventListener("click", function() {
+    crawlToolArticles(null);
+});
+document.getElementById("add-article-btn").addEventListener("click", addArticle);
+document.getElementById("article-url").addEventListener("keypress", function(e) {
+  // Enter 提交，Shift+Enter 换行
+  if (e.key === "Enter" && !e.shiftKey) {
+    e.preventDefault();
+    addArticle();
+  }
+});
+document.getElementById("trigger-btn").addEventListener("click", triggerOnce);
+
+document.getElementById("auth-submit-btn").addEventListener("click", async function () {
+  const input = document.getElementById("admin-code-input");
+  const statusEl = document.getElementById("auth-status");
+  const code = input.value.trim();
+  if (!code) {
+    statusEl.textContent = "❌ 请输入授权码";
+    statusEl.className = "status error";
+    return;
+  }
+  setAdminCode(code);
+  hideAuthOverlay();
+  await initializePanel();
+});
+
+document.getElementById("admin-code-input").addEventListener("keypress", function (e) {
+  if (e.key === "Enter") {
+    document.getElementById("auth-submit-btn").click();
+  }
+});
+
+async function initializePanel() {
+  console.log('[DEBUG] initializePanel 开始执行');
+  const ok = await ensureAdminCode();
+  console.log('[DEBUG] ensureAdminCode 返回:', ok);
+  if (!ok) {
+    console.log('[DEBUG] 授权码验证失败，停止初始化');
+    return;
+  }
+  console.log('[DEBUG] 开始加载数据...');
+  try {
+    await Promise.all([
+      loadToolCandidateList(),
+      loadPanelData(),
+      loadToolKeywords()
+    ]);
+    console.log('[DEBUG] 所有数据加载完成');
+  } catch (err) {
+    console.error('[DEBUG] 数据加载出错:', err);
+  }
+}
+
+// 归档对话框事件绑定
+const archiveModal = document.getElementById("archive-modal");
+const archiveCancelBtn = document.getElementById("archive-cancel-btn");
+const archiveConfirmBtn = document.getElementById("archive-confirm-btn");
+const archiveCategory = document.getElementById("archive-category");
+
+if (archiveCancelBtn) {
+  archiveCancelBtn.addEventListener("click", hideArchiveModal);
+}
+
+if (archiveConfirmBtn) {
+  archiveConfirmBtn.addEventListener("click", function() {
+    if (currentArchiveUrl) {
+      const category = archiveCategory ? archiveCategory.value : "programming";
+      const toolTagsInput = document.getElementById("archive-tool-tags");
+      let toolTags = [];
+      if (toolTagsInput && toolTagsInput.value.trim()) {
+        // 解析工具标签（逗号分隔，去除空格）
+        toolTags = toolTagsInput.value.split(',').map(tag => tag.trim()).filter(tag => tag);
+      }
+
+      // 根据归档来源调用不同的函数
+      if (archiveSource === 'article') {
+        archiveArticleFromPool(currentArchiveUrl, category, toolTags);
+      } else {
+        archiveCandidate(currentArchiveUrl, category, toolTags);
+      }
+    }
+  });
+}
+
+// 点击背景关闭对话框
+if (archiveModal) {
+  archiveModal.addEventListener("click", function(e) {
+    if (e.target === archiveModal) {
+      hideArchiveModal();
+    }
+  });
+}
+
+// 配置弹窗基础功能
+const configModal = document.getElementById("config-modal");
+const openConfigBtn = document.getElementById("open-config-btn");
+const closeConfigBtn = document.getElementById("close-config-btn");
+
+function openConfigModal() {
+  if (configModal) {
+    configModal.classList.remove("hidden");
+    configModal.classList.add("flex");
+    switchConfigSection("keywords");
+  }
+}
+
+function closeConfigModal() {
+  if (configModal) {
+    configModal.classList.add("hidden");
+    configModal.classList.remove("flex");
+  }
+}
+
+async function loadKeywordConfig() {
+  const textarea = document.getElementById("config-keywords-input");
+  const statusEl = document.getElementById("config-keywords-status");
+  if (!textarea) return;
+
+  if (statusEl) statusEl.textContent = "";
+  textarea.value = "";
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/keywords", {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      if (statusEl) {
+        statusEl.textContent = "❌ 需要授权";
+        statusEl.className = "text-sm text-red-600";
+      }
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok && data.keywords) {
+      textarea.value = data.keywords.join("\n");
+    } else {
+      textarea.value = "AI 编码\n数字孪生\nCursor";
+    }
+  } catch (err) {
+    console.error("加载关键词失败:", err);
+    textarea.value = "AI 编码\n数字孪生\nCursor";
+  }
+}
+
+async function loadScheduleConfig() {
+  const cronInput = document.getElementById("schedule-cron");
+  const hourInput = document.getElementById("schedule-hour");
+  const minuteInput = document.getElementById("schedule-minute");
+  const countInput = document.getElementById("schedule-count");
+  const maxInput = document.getElementById("schedule-max");
+  const statusEl = document.getElementById("config-schedule-status");
+
+  if (statusEl) statusEl.textContent = "";
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/schedule", {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      if (statusEl) {
+        statusEl.textContent = "❌ 需要授权";
+        statusEl.className = "text-sm text-red-600";
+      }
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok && data.schedule) {
+      const s = data.schedule;
+      if (cronInput) cronInput.value = s.cron || "";
+      if (hourInput) hourInput.value = s.hour || "";
+      if (minuteInput) minuteInput.value = s.minute || "";
+      if (countInput) countInput.value = s.count || "";
+      if (maxInput) maxInput.value = s.max_articles_per_keyword || "";
+    }
+  } catch (err) {
+    console.error("加载调度配置失败:", err);
+  }
+}
+
+async function loadWecomTemplateConfig() {
+  const textarea = document.getElementById("wecom-template-input");
+  const statusEl = document.getElementById("config-template-status");
+  if (!textarea) return;
+
+  if (statusEl) statusEl.textContent = "";
+
+  const defaultTemplateObj = {
+    "title": "**每日精选通知｜{date}**",
+    "theme": "> 今日主题：{theme}",
+    "item": {
+      "title": "{idx}. [{title}]({url})",
+      "source": "   - 来源：{source}",
+      "summary": "   - 摘要：{summary}"
+    },
+    "footer": "> 以上内容每日推送，仅限内部分享。"
+  };
+  const defaultTemplate = JSON.stringify(defaultTemplateObj, null, 2);
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/wecom-template", {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      if (statusEl) {
+        statusEl.textContent = "❌ 需要授权";
+        statusEl.className = "text-sm text-red-600";
+      }
+      textarea.value = defaultTemplate;
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok && data.template) {
+      textarea.value = JSON.stringify(data.template, null, 2);
+    } else {
+      textarea.value = defaultTemplate;
+    }
+  } catch (err) {
+    console.error("加载模板失败:", err);
+    textarea.value = defaultTemplate;
+  }
+}
+
+async function loadEnvConfig() {
+  const adminCodeInput = document.getElementById("env-admin-code");
+  const wecomWebhookInput = document.getElementById("env-wecom-webhook");
+  const statusEl = document.getElementById("config-env-status");
+
+  if (!adminCodeInput || !wecomWebhookInput) return;
+
+  if (statusEl) statusEl.textContent = "";
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/env", {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      if (statusEl) {
+        statusEl.textContent = "❌ 需要授权";
+        statusEl.className = "text-sm text-red-600";
+      }
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok && data.env) {
+      adminCodeInput.value = data.env.admin_code || "";
+      wecomWebhookInput.value = data.env.wecom_webhook || "";
+    }
+  } catch (err) {
+    console.error("加载系统配置失败:", err);
+  }
+}
+
+async function saveEnvConfig() {
+  const adminCodeInput = document.getElementById("env-admin-code");
+  const wecomWebhookInput = document.getElementById("env-wecom-webhook");
+  const statusEl = document.getElementById("config-env-status");
+
+  if (!adminCodeInput || !wecomWebhookInput) return;
+
+  const adminCode = adminCodeInput.value.trim();
+  const wecomWebhook = wecomWebhookInput.value.trim();
+
+  if (!adminCode && !wecomWebhook) {
+    if (statusEl) {
+      statusEl.textContent = "❌ 请至少填写一项配置";
+      statusEl.className = "text-sm text-red-600";
+    }
+    return;
+  }
+
+  if (statusEl) {
+    statusEl.textContent = "保存中...";
+    statusEl.className = "text-sm";
+  }
+
+  try {
+    const currentAdminCode = getAdminCode();
+    const res = await fetch("./config/env", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": currentAdminCode || ""
+      },
+      body: JSON.stringify({
+        admin_code: adminCode,
+        wecom_webhook: wecomWebhook
+      })
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ 系统配置已保存（需要重启服务后生效）";
+        statusEl.className = "text-sm text-green-600";
+      }
+      // 如果更新了管理员验证码，更新本地存储
+      if (adminCode) {
+        localStorage.setItem(ADMIN_CODE_KEY, adminCode);
+      }
+    } else {
+      throw new Error(data.message || "保存失败");
+    }
+  } catch (err) {
+    console.error("保存系统配置失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 保存失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  }
+}
+
+async function backupToGitHub() {
+  const btn = document.getElementById("backup-to-github-btn");
+  const statusEl = document.getElementById("config-backup-status");
+  const btnText = document.getElementById("backup-btn-text");
+
+  if (!btn || !statusEl) return;
+
+  // 禁用按钮
+  btn.disabled = true;
+  if (btnText) btnText.textContent = "备份中...";
+
+  if (statusEl) {
+    statusEl.textContent = "正在备份数据，请稍候...";
+    statusEl.className = "text-sm text-blue-600";
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./backup/export-to-github", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || ""
+      }
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      const errorData = await res.json().catch(() => ({ detail: "备份失败" }));
+      throw new Error(errorData.detail || "HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ 备份任务已启动，请查看服务器日志了解执行结果";
+        statusEl.className = "text-sm text-green-600";
+      }
+    } else {
+      throw new Error(data.message || "备份失败");
+    }
+  } catch (err) {
+    console.error("备份失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 备份失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  } finally {
+    // 恢复按钮
+    btn.disabled = false;
+    if (btnText) btnText.textContent = "备份数据到GitHub";
+  }
+}
+
+function switchConfigSection(sectionName) {
+  const sections = ["keywords", "schedule", "template", "env", "backup"];
+  const menuBtns = document.querySelectorAll(".config-menu-btn");
+
+  sections.forEach(function(name) {
+    const sectionEl = document.getElementById("config-" + name + "-section");
+    const btn = document.querySelector('[data-section="' + name + '"]');
+    if (sectionEl) {
+      if (name === sectionName) {
+        sectionEl.classList.remove("hidden");
+        sectionEl.classList.add("block");
+      } else {
+        sectionEl.classList.add("hidden");
+        sectionEl.classList.remove("block");
+      }
+    }
+    if (btn) {
+      if (name === sectionName) {
+        btn.classList.add("is-active");
+        btn.classList.remove("bg-gray-50", "text-gray-900");
+        btn.classList.add("bg-blue-600", "text-white");
+      } else {
+        btn.classList.remove("is-active");
+        btn.classList.remove("bg-blue-600", "text-white");
+        btn.classList.add("bg-gray-50", "text-gray-900");
+      }
+    }
+  });
+
+  if (sectionName === "keywords") {
+    loadKeywordConfig();
+  } else if (sectionName === "schedule") {
+    loadScheduleConfig();
+  } else if (sectionName === "template") {
+    loadWecomTemplateConfig();
+  } else if (sectionName === "env") {
+    loadEnvConfig();
+  }
+}
+
+if (openConfigBtn) {
+  openConfigBtn.addEventListener("click", openConfigModal);
+}
+if (closeConfigBtn) {
+  closeConfigBtn.addEventListener("click", closeConfigModal);
+}
+if (configModal) {
+  configModal.addEventListener("click", function(event) {
+    if (event.target === configModal) {
+      closeConfigModal();
+    }
+  });
+}
+
+async function saveKeywordConfig() {
+  const textarea = document.getElementById("config-keywords-input");
+  const statusEl = document.getElementById("config-keywords-status");
+  if (!textarea) return;
+
+  const keywords = textarea.value.split("\n").map(function(k) {
+    return k.trim();
+  }).filter(function(k) {
+    return k.length > 0;
+  });
+
+  if (keywords.length === 0) {
+    if (statusEl) {
+      statusEl.textContent = "❌ 关键词不能为空";
+      statusEl.className = "text-sm text-red-600";
+    }
+    return;
+  }
+
+  if (statusEl) {
+    statusEl.textContent = "保存中...";
+    statusEl.className = "text-sm";
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/keywords", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || ""
+      },
+      body: JSON.stringify({ keywords: keywords })
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ 关键词已保存";
+        statusEl.className = "text-sm text-green-600";
+      }
+    } else {
+      throw new Error(data.message || "保存失败");
+    }
+  } catch (err) {
+    console.error("保存关键词失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 保存失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  }
+}
+
+async function saveScheduleConfig() {
+  const cronInput = document.getElementById("schedule-cron");
+  const hourInput = document.getElementById("schedule-hour");
+  const minuteInput = document.getElementById("schedule-minute");
+  const countInput = document.getElementById("schedule-count");
+  const maxInput = document.getElementById("schedule-max");
+  const statusEl = document.getElementById("config-schedule-status");
+
+  const payload = {};
+  if (cronInput && cronInput.value.trim()) {
+    payload.cron = cronInput.value.trim();
+  }
+  if (hourInput && hourInput.value) {
+    payload.hour = parseInt(hourInput.value, 10);
+  }
+  if (minuteInput && minuteInput.value) {
+    payload.minute = parseInt(minuteInput.value, 10);
+  }
+  if (countInput && countInput.value) {
+    payload.count = parseInt(countInput.value, 10);
+  }
+  if (maxInput && maxInput.value) {
+    payload.max_articles_per_keyword = parseInt(maxInput.value, 10);
+  }
+
+  if (Object.keys(payload).length === 0) {
+    if (statusEl) {
+      statusEl.textContent = "❌ 请至少填写一项配置";
+      statusEl.className = "text-sm text-red-600";
+    }
+    return;
+  }
+
+  if (statusEl) {
+    statusEl.textContent = "保存中...";
+    statusEl.className = "text-sm";
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/schedule", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || ""
+      },
+      body: JSON.stringify(payload)
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ 调度配置已保存";
+        statusEl.className = "text-sm text-green-600";
+      }
+    } else {
+      throw new Error(data.message || "保存失败");
+    }
+  } catch (err) {
+    console.error("保存调度配置失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 保存失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  }
+}
+
+async function saveWecomTemplateConfig() {
+  const textarea = document.getElementById("wecom-template-input");
+  const statusEl = document.getElementById("config-template-status");
+  if (!textarea) return;
+
+  let template;
+  try {
+    template = JSON.parse(textarea.value);
+  } catch (err) {
+    if (statusEl) {
+      statusEl.textContent = "❌ JSON 格式错误: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+    return;
+  }
+
+  if (statusEl) {
+    statusEl.textContent = "保存中...";
+    statusEl.className = "text-sm";
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./config/wecom-template", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || ""
+      },
+      body: JSON.stringify({ template: template })
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ 企业微信模板已保存";
+        statusEl.className = "text-sm text-green-600";
+      }
+    } else {
+      throw new Error(data.message || "保存失败");
+    }
+  } catch (err) {
+    console.error("保存模板失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 保存失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  }
+}
+
+document.querySelectorAll(".config-menu-btn").forEach(function(btn) {
+  btn.addEventListener("click", function() {
+    const section = btn.getAttribute("data-section");
+    if (section) {
+      switchConfigSection(section);
+    }
+  });
+});
+
+document.getElementById("save-keywords-btn").addEventListener("click", saveKeywordConfig);
+document.getElementById("save-schedule-btn").addEventListener("click", saveScheduleConfig);
+document.getElementById("save-template-btn").addEventListener("click", saveWecomTemplateConfig);
+document.getElementById("save-env-btn").addEventListener("click", saveEnvConfig);
+const backupBtn = document.getElementById("backup-to-github-btn");
+if (backupBtn) {
+  backupBtn.addEventListener("click", backupToGitHub);
+}
+
+// ========== 微信公众号草稿箱功能已暂时屏蔽 ==========
+// 以下函数暂时屏蔽，但保留代码以便后续启用
+/*
+async function loadDraftsList() {
+  const listEl = document.getElementById("drafts-list");
+  const statusEl = document.getElementById("drafts-status");
+
+  if (!listEl) return;
+
+  if (statusEl) statusEl.textContent = "";
+  listEl.innerHTML = "加载中...";
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./wechat-mp/drafts?offset=0&count=20", {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      listEl.innerHTML = "<p>需要授权</p>";
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok && data.drafts) {
+      if (data.drafts.length === 0) {
+        listEl.innerHTML = "<p>草稿箱为空</p>";
+        return;
+      }
+
+      listEl.innerHTML = "";
+      data.drafts.forEach(function(draft) {
+        const mediaId = draft.media_id || draft.media_id;
+        const content = draft.content || {};
+        const newsItem = content.news_item || [];
+        const createTime = content.create_time ? new Date(content.create_time * 1000).toLocaleString() : "未知";
+
+        const draftDiv = document.createElement("div");
+        draftDiv.className = "draft-item";
+        draftDiv.innerHTML = `
+          <div class="draft-header">
+            <div>
+              <div class="draft-title">草稿 #${mediaId.substring(0, 8)}...</div>
+              <div class="draft-meta">创建时间: ${createTime} | 文章数: ${newsItem.length}</div>
+            </div>
+          </div>
+          <div class="draft-articles">
+            ${newsItem.map(function(article, idx) {
+              const title = (article.title || "无标题").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+              const author = (article.author || "未知").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+              const url = article.content_source_url || "#";
+              return `
+                <div class="draft-article-item">
+                  <strong>${idx + 1}. ${title}</strong>
+                  <div style="font-size: 12px; color: #6b7280; margin-top: 4px;">
+                    作者: ${author} | 
+                    <a href="${url}" target="_blank">原文链接</a>
+                  </div>
+                </div>
+              `;
+            }).join("")}
+          </div>
+          <div class="draft-actions-btns">
+            <button class="btn-success" data-action="edit" data-media-id="${mediaId}">编辑</button>
+            <button class="btn-primary" data-action="publish" data-media-id="${mediaId}">发布</button>
+            <button class="btn-secondary" data-action="delete" data-media-id="${mediaId}">删除</button>
+          </div>
+        `;
+        listEl.appendChild(draftDiv);
+      });
+    } else {
+      listEl.innerHTML = "<p>加载失败</p>";
+    }
+  } catch (err) {
+    console.error("加载草稿列表失败:", err);
+    listEl.innerHTML = "<p>加载失败: " + err.message + "</p>";
+  }
+}
+
+async function createDraftFromArticles() {
+  const statusEl = document.getElementById("drafts-status");
+  const articlesData = await fetch("./articles", {
+    headers: { "X-Admin-Code": getAdminCode() || "" }
+  }).then(r => r.json());
+
+  if (!articlesData.ok || !articlesData.articles || articlesData.articles.length === 0) {
+    if (statusEl) {
+      statusEl.textContent = "❌ 文章池为空，请先添加文章";
+      statusEl.className = "text-sm text-red-600";
+    }
+    return;
+  }
+
+  // 让用户选择文章（简化版：使用所有文章）
+  const articleUrls = articlesData.articles.map(a => a.url);
+
+  if (statusEl) {
+    statusEl.textContent = "正在创建草稿...";
+    statusEl.className = "text-sm";
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch("./wechat-mp/create-draft-from-articles", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || ""
+      },
+      body: JSON.stringify({ article_ids: articleUrls })
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ " + data.message;
+        statusEl.className = "text-sm text-green-600";
+      }
+      loadDraftsList();
+    } else {
+      throw new Error(data.message || "创建失败");
+    }
+  } catch (err) {
+    console.error("创建草稿失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 创建失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  }
+}
+
+window.editDraft = async function(mediaId) {
+  const modal = document.getElementById("draft-edit-modal");
+  const contentEl = document.getElementById("draft-edit-content");
+
+  if (!modal || !contentEl) return;
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch(`./wechat-mp/draft/${mediaId}`, {
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok && data.draft) {
+      const draft = data.draft;
+      const newsItem = draft.news_item || [];
+
+      if (newsItem.length === 0) {
+        contentEl.innerHTML = "<p>草稿中没有文章</p>";
+        modal.classList.add("is-visible");
+        return;
+      }
+
+      // 使用 DOM 方法创建元素，避免转义问题
+      contentEl.innerHTML = "";
+      newsItem.forEach(function(article, idx) {
+        const formDiv = document.createElement("div");
+        formDiv.className = "draft-edit-form";
+
+        const h3 = document.createElement("h3");
+        h3.textContent = "文章 " + (idx + 1);
+        formDiv.appendChild(h3);
+
+        // 标题（限制 20 个字符）
+        const titleLabel = document.createElement("label");
+        titleLabel.textContent = "标题（20字以内）";
+        formDiv.appendChild(titleLabel);
+        const titleInput = document.createElement("input");
+        titleInput.type = "text";
+        titleInput.id = "draft-title-" + idx;
+        titleInput.value = article.title || "";
+        titleInput.placeholder = "标题（20字以内）";
+        titleInput.maxLength = 20;  // HTML5 最大长度限制
+        // 添加实时字符计数提示
+        const titleCounter = document.createElement("div");
+        titleCounter.id = "draft-title-counter-" + idx;
+        titleCounter.style.cssText = "font-size: 12px; color: #6b7280; margin-top: -10px; margin-bottom: 12px;";
+        titleCounter.textContent = `已输入 ${(article.title || "").length} / 20 字符`;
+        formDiv.appendChild(titleInput);
+        formDiv.appendChild(titleCounter);
+        // 监听输入变化，更新字符计数
+        titleInput.addEventListener("input", function() {
+          const length = this.value.length;
+          titleCounter.textContent = `已输入 ${length} / 20 字符`;
+          if (length > 20) {
+            titleCounter.style.color = "#ef4444";
+          } else {
+            titleCounter.style.color = "#6b7280";
+          }
+        });
+
+        // 作者
+        const authorLabel = document.createElement("label");
+        authorLabel.textContent = "作者";
+        formDiv.appendChild(authorLabel);
+        const authorInput = document.createElement("input");
+        authorInput.type = "text";
+        authorInput.id = "draft-author-" + idx;
+        authorInput.value = article.author || "";
+        authorInput.placeholder = "作者";
+        formDiv.appendChild(authorInput);
+
+        // 内容（HTML编辑器）
+        const contentLabel = document.createElement("label");
+        contentLabel.textContent = "内容（HTML格式）";
+        formDiv.appendChild(contentLabel);
+
+        // 工具栏
+        const toolbar = document.createElement("div");
+        toolbar.style.cssText = "margin-bottom: 8px; padding: 8px; background: #f5f5f5; border-radius: 4px; display: flex; gap: 8px; flex-wrap: wrap;";
+        toolbar.innerHTML = `
+          <button type="button" class="html-editor-btn" data-command="bold" title="粗体">B</button>
+          <button type="button" class="html-editor-btn" data-command="italic" title="斜体">I</button>
+          <button type="button" class="html-editor-btn" data-command="underline" title="下划线">U</button>
+          <button type="button" class="html-editor-btn" data-command="formatBlock" data-value="p" title="段落">P</button>
+          <button type="button" class="html-editor-btn" data-command="insertUnorderedList" title="无序列表">•</button>
+          <button type="button" class="html-editor-btn" data-command="insertOrderedList" title="有序列表">1.</button>
+        `;
+        formDiv.appendChild(toolbar);
+
+        // HTML 编辑器（contenteditable div）
+        const contentEditor = document.createElement("div");
+        contentEditor.id = "draft-content-" + idx;
+        contentEditor.contentEditable = true;
+        contentEditor.style.cssText = "min-height: 200px; padding: 12px; border: 1px solid #d1d5db; border-radius: 4px; background: #fff; outline: none;";
+        contentEditor.innerHTML = article.content || "";  // 直接设置 HTML 内容
+        formDiv.appendChild(contentEditor);
+
+        // 为工具栏按钮绑定事件
+        toolbar.querySelectorAll(".html-editor-btn").forEach(function(btn) {
+          btn.addEventListener("click", function(e) {
+            e.preventDefault();
+            const command = this.getAttribute("data-command");
+            const value = this.getAttribute("data-value");
+            contentEditor.focus();
+            document.execCommand(command, false, value || null);
+          });
+        });
+
+        contentEl.appendChild(formDiv);
+      });
+
+      contentEl.innerHTML += `
+        <div class="form-actions" style="margin-top: 20px;">
+          <button class="btn-success" data-save-draft="${mediaId}">保存修改</button>
+          <button class="btn-secondary" onclick="closeDraftEdit()">取消</button>
+        </div>
+      `;
+
+      // 绑定保存按钮
+      const saveBtn = contentEl.querySelector(`[data-save-draft="${mediaId}"]`);
+      if (saveBtn) {
+        saveBtn.addEventListener("click", function() {
+          saveDraftEdit(mediaId);
+        });
+      }
+
+      modal.classList.add("is-visible");
+    }
+  } catch (err) {
+    console.error("加载草稿详情失败:", err);
+    alert("加载草稿详情失败: " + err.message);
+  }
+}
+
+window.saveDraftEdit = async function(mediaId) {
+  const contentEl = document.getElementById("draft-edit-content");
+  if (!contentEl) return;
+
+  const forms = contentEl.querySelectorAll(".draft-edit-form");
+  const articles = [];
+
+  forms.forEach(function(form, idx) {
+    let title = document.getElementById(`draft-title-${idx}`).value.trim();
+    const author = document.getElementById(`draft-author-${idx}`).value;
+    // 从 contenteditable div 获取 HTML 内容
+    const contentEditor = document.getElementById(`draft-content-${idx}`);
+    const content = contentEditor ? contentEditor.innerHTML : "";
+
+    // 确保标题在 20 个字符以内
+    const maxTitleLength = 20;
+    if (title.length > maxTitleLength) {
+      // 尝试在合适的位置截断（优先在标点符号、空格处）
+      let truncated = title.substring(0, maxTitleLength);
+      // 查找最后一个标点符号或空格的位置（在截断范围内）
+      const separators = ['。', '，', '、', '：', '；', '！', '？', ' ', '·', '-', '—', '–'];
+      for (let i = 0; i < separators.length; i++) {
+        const sep = separators[i];
+        const lastSepPos = truncated.lastIndexOf(sep);
+        if (lastSepPos > maxTitleLength * 0.6) {  // 至少保留 60% 的内容
+          truncated = truncated.substring(0, lastSepPos);
+          break;
+        }
+      }
+      title = truncated;
+      console.log(`标题已缩减: ${document.getElementById(`draft-title-${idx}`).value} -> ${title}`);
+    }
+
+    articles.push({
+      title: title,
+      author: author,
+      content: content,
+      // 不包含 content_source_url 和 digest
+      thumb_media_id: "",
+      show_cover_pic: 1,
+    });
+  });
+
+  try {
+    const adminCode = getAdminCode();
+    // 更新每篇文章
+    for (let i = 0; i < articles.length; i++) {
+      const res = await fetch(`./wechat-mp/draft/${mediaId}/update`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          "X-Admin-Code": adminCode || ""
+        },
+        body: JSON.stringify({
+          index: i,
+          article: articles[i]
+        })
+      });
+
+      if (!res.ok) {
+        throw new Error("更新失败");
+      }
+    }
+
+    alert("草稿更新成功！");
+    closeDraftEdit();
+    loadDraftsList();
+  } catch (err) {
+    console.error("保存草稿失败:", err);
+    alert("保存失败: " + err.message);
+  }
+}
+
+window.closeDraftEdit = function() {
+  const modal = document.getElementById("draft-edit-modal");
+  if (modal) {
+    modal.classList.remove("is-visible");
+  }
+}
+
+window.publishDraft = async function(mediaId) {
+  if (!confirm("确定要发布这个草稿吗？")) {
+    return;
+  }
+
+  const statusEl = document.getElementById("drafts-status");
+  if (statusEl) {
+    statusEl.textContent = "正在发布...";
+    statusEl.className = "text-sm";
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch(`./wechat-mp/publish`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        "X-Admin-Code": adminCode || ""
+      },
+      body: JSON.stringify({ media_id: mediaId })
+    });
+
+    if (res.status === 401 || res.status === 403) {
+      handleAuthError(statusEl);
+      return;
+    }
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      if (statusEl) {
+        statusEl.textContent = "✅ 发布成功！";
+        statusEl.className = "text-sm text-green-600";
+      }
+      loadDraftsList();
+    } else {
+      throw new Error(data.message || "发布失败");
+    }
+  } catch (err) {
+    console.error("发布草稿失败:", err);
+    if (statusEl) {
+      statusEl.textContent = "❌ 发布失败: " + err.message;
+      statusEl.className = "text-sm text-red-600";
+    }
+  }
+}
+
+window.deleteDraft = async function(mediaId) {
+  if (!confirm("确定要删除这个草稿吗？")) {
+    return;
+  }
+
+  try {
+    const adminCode = getAdminCode();
+    const res = await fetch(`./wechat-mp/draft/${mediaId}/delete`, {
+      method: "POST",
+      headers: { "X-Admin-Code": adminCode || "" }
+    });
+
+    if (!res.ok) {
+      throw new Error("HTTP " + res.status);
+    }
+
+    const data = await res.json();
+    if (data.ok) {
+      loadDraftsList();
+    } else {
+      throw new Error(data.message || "删除失败");
+    }
+  } catch (err) {
+    console.error("删除草稿失败:", err);
+    alert("删除失败: " + err.message);
+  }
+}
+
+// 绑定草稿箱按钮事件
+const createDraftBtn = document.getElementById("create-draft-btn");
+const refreshDraftsBtn = document.getElementById("refresh-drafts-btn");
+const closeDraftEditBtn = document.getElementById("close-draft-edit-btn");
+const draftEditModal = document.getElementById("draft-edit-modal");
+
+if (createDraftBtn) {
+  createDraftBtn.addEventListener("click", createDraftFromArticles);
+}
+if (refreshDraftsBtn) {
+  refreshDraftsBtn.addEventListener("click", loadDraftsList);
+}
+if (closeDraftEditBtn) {
+  closeDraftEditBtn.addEventListener("click", closeDraftEdit);
+}
+if (draftEditModal) {
+  draftEditModal.addEventListener("click", function(event) {
+    if (event.target.id === "draft-edit-modal") {
+      closeDraftEdit();
+    }
+  });
+}
+
+// 使用事件委托处理草稿操作按钮
+const draftsList = document.getElementById("drafts-list");
+if (draftsList) {
+  draftsList.addEventListener("click", function(event) {
+    const btn = event.target;
+    if (btn.hasAttribute("data-action")) {
+      const action = btn.getAttribute("data-action");
+      const mediaId = btn.getAttribute("data-media-id");
+      if (action === "edit") {
+        editDraft(mediaId);
+      } else if (action === "publish") {
+        publishDraft(mediaId);
+      } else if (action === "delete") {
+        deleteDraft(mediaId);
+      }
+    }
+  });
+}
+
+// 加载草稿列表（已屏蔽）
+// loadDraftsList();
+*/
+
+// 初始加载：检查是否已有授权码，没有则弹出对话框
+console.log('[DEBUG] 脚本开始执行');
+
+// 确保 DOM 加载完成后再执行
+if (document.readyState === 'loading') {
+  document.addEventListener('DOMContentLoaded', function() {
+    console.log('[DEBUG] DOM 加载完成，开始初始化面板');
+    initializePanel();
+  });
+} else {
+  console.log('[DEBUG] DOM 已就绪，立即初始化面板');
+  initializePanel();
+}
@@ -1,4 +1,10 @@
 """HTML模板模块"""
+import gzip
+from typing import Optional
+
+from fastapi.responses import Response
+
+from .encoding import accepts_gzip
 
 INDEX_HTML = """
         <!DOCTYPE html>
@@ -41,6 +47,9 @@ INDEX_HTML = """
             /* 确保 Tailwind CSS 只影响当前页面 */
             body { margin: 0; padding: 0; }
             
+            /* 管理员入口的显隐由 hidden 类控制；.mobile-nav-link 的 display: block 优先级高于 Tailwind 的 .hidden，用 ID 选择器压过它 */
+            #admin-entry.hidden, #mobile-admin-entry.hidden { display: none; }
+            
             /* 科技感字体 */
             .tech-font {
               font-family: 'Orbitron', 'Rajdhani', sans-serif;
@@ -557,13 +566,13 @@ INDEX_HTML = """
                   <nav class="flex items-center gap-2 flex-wrap">
                     <!-- 最新资讯下拉菜单 -->
                     <div class="relative">
-                      <button class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan rounded-lg transition-all whitespace-nowrap flex items-center gap-2" onclick="toggleNewsDropdown()">
+                      <button class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan rounded-lg transition-all whitespace-nowrap flex items-center gap-2" onclick="toggleDropdown('news')" data-dropdown="news">
                         📰 最新资讯
                         <svg class="w-4 h-4 transition-transform duration-200" id="news-dropdown-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7"></path>
                         </svg>
                       </button>
-                      <div class="news-dropdown-menu absolute top-full left-0 mt-1 w-48 hidden z-50" id="news-dropdown-menu">
+                      <div class="news-dropdown-menu absolute top-full left-0 mt-1 w-48 hidden z-50" id="news-dropdown-menu" data-dropdown-menu="news">
                         <a href="/news" class="block px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan transition-all">
                           💻 编程资讯
                         </a>
@@ -574,13 +583,13 @@ INDEX_HTML = """
                     </div>
                     <!-- 每周资讯下拉菜单 -->
                     <div class="relative">
-                      <button class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan rounded-lg transition-all whitespace-nowrap flex items-center gap-2" onclick="toggleWeeklyDropdown()">
+                      <button class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan rounded-lg transition-all whitespace-nowrap flex items-center gap-2" onclick="toggleDropdown('weekly')" data-dropdown="weekly">
                         📅 每周资讯
                         <svg class="w-4 h-4 transition-transform duration-200" id="weekly-dropdown-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7"></path>
                         </svg>
                       </button>
-                      <div class="weekly-dropdown-menu absolute top-full left-0 mt-1 w-48 hidden z-50" id="weekly-dropdown-menu">
+                      <div class="weekly-dropdown-menu absolute top-full left-0 mt-1 w-48 hidden z-50" id="weekly-dropdown-menu" data-dropdown-menu="weekly">
                         <!-- 动态加载的weekly列表 -->
                       </div>
                     </div>
@@ -592,13 +601,13 @@ INDEX_HTML = """
                 </a>
                     <!-- 社区资源下拉菜单 -->
                     <div class="relative">
-                      <button class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-purple rounded-lg transition-all whitespace-nowrap flex items-center gap-2" onclick="toggleResourcesDropdown()">
+                      <button class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-purple rounded-lg transition-all whitespace-nowrap flex items-center gap-2" onclick="toggleDropdown('resources')" data-dropdown="resources">
                         🌐 社区资源
                         <svg class="w-4 h-4 transition-transform duration-200" id="resources-dropdown-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7"></path>
                         </svg>
                       </button>
-                      <div class="resources-dropdown-menu absolute top-full left-0 mt-1 w-48 hidden z-50" id="resources-dropdown-menu">
+                      <div class="resources-dropdown-menu absolute top-full left-0 mt-1 w-48 hidden z-50" id="resources-dropdown-menu" data-dropdown-menu="resources">
                         <a href="/resources?category=飞书知识库" class="block px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-purple transition-all">
                           📚 飞书知识库
                         </a>
@@ -640,7 +649,7 @@ INDEX_HTML = """
               </nav>
                   
                   <!-- 管理员入口（隐藏，需要输入授权码后显示，放在最右侧） -->
-                  <a href="/digest/panel" id="admin-entry" class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-purple rounded-lg transition-all hidden whitespace-nowrap ml-2" style="display: none;">
+                  <a href="/digest/panel" id="admin-entry" class="top-nav-item px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-purple rounded-lg transition-all hidden whitespace-nowrap ml-2">
                     🔐 管理员入口
                   </a>
                   
@@ -657,7 +666,7 @@ INDEX_HTML = """
             <div class="mobile-top-nav-menu" id="mobile-top-nav-menu">
               <!-- 最新资讯子菜单 -->
               <div class="mobile-nav-submenu">
-                <div class="mobile-nav-submenu-header" onclick="toggleMobileNewsSubmenu()">
+                <div class="mobile-nav-submenu-header" onclick="toggleMobileSubmenu('news')">
                   📰 最新资讯
                   <svg class="w-4 h-4 transition-transform duration-200 inline ml-1" id="mobile-news-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                     <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path>
@@ -670,7 +679,7 @@ INDEX_HTML = """
               </div>
               <!-- 每周资讯子菜单 -->
               <div class="mobile-nav-submenu">
-                <div class="mobile-nav-submenu-header" onclick="toggleMobileWeeklySubmenu()">
+                <div class="mobile-nav-submenu-header" onclick="toggleMobileSubmenu('weekly')">
                   📅 每周资讯
                   <svg class="w-4 h-4 transition-transform duration-200 inline ml-1" id="mobile-weekly-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                     <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path>
@@ -684,7 +693,7 @@ INDEX_HTML = """
               <a href="/rules" class="mobile-nav-link">📋 规则</a>
               <!-- 社区资源子菜单 -->
               <div class="mobile-nav-submenu">
-                <div class="mobile-nav-submenu-header" onclick="toggleMobileResourcesSubmenu()">
+                <div class="mobile-nav-submenu-header" onclick="toggleMobileSubmenu('resources')">
                   🌐 社区资源
                   <svg class="w-4 h-4 transition-transform duration-200 inline ml-1" id="mobile-resources-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                     <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path>
@@ -695,7 +704,7 @@ INDEX_HTML = """
                   <a href="/resources?category=技术社区" class="mobile-nav-link">👥 技术社区</a>
                   <a href="/resources?category=Cursor资源" class="mobile-nav-link">🎯 Cursor资源</a>
                   <div class="mobile-nav-submenu">
-                    <div class="mobile-nav-submenu-header" onclick="toggleMobileClaudeCodeSubmenu()">
+                    <div class="mobile-nav-submenu-header" onclick="toggleMobileSubmenu('claude-code')">
                       🤖 Claude Code 资源
                       <svg class="w-4 h-4 transition-transform duration-200 inline ml-1" id="mobile-claude-code-arrow" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                         <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path>
@@ -711,7 +720,7 @@ INDEX_HTML = """
                 </div>
               </div>
               <a href="/wechat-mp" class="mobile-nav-link">📱 微信公众号</a>
-              <a href="/digest/panel" id="mobile-admin-entry" class="mobile-nav-link hidden" style="display: none;">🔐 管理员入口</a>
+              <a href="/digest/panel" id="mobile-admin-entry" class="mobile-nav-link hidden">🔐 管理员入口</a>
             </div>
             
             <!-- 移动端遮罩层 -->
@@ -785,11 +794,155 @@ INDEX_HTML = """
               </div>
             </main>
                 </div>
+
+            <!-- 静态页面模板：页面加载时只解析一次，显示时克隆 -->
+            <template id="tpl-submit-tool">
+              <div class="mb-6">
+                <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">提交工具</h1>
+                <p class="text-base text-gray-400 tech-font">分享优质的开发工具和资源</p>
+              </div>
+
+              <!-- 审核说明 -->
+              <div class="glass rounded-xl border border-neon-purple/30 p-6 mb-6 max-w-2xl">
+                <div class="flex items-start gap-3">
+                  <span class="text-2xl">ℹ️</span>
+                  <div>
+                    <h3 class="text-lg font-semibold text-neon-purple mb-2">审核说明</h3>
+                    <p class="text-sm text-gray-300 leading-relaxed">
+                      您提交的工具将进入工具候选池，由管理员进行人工审核。我们会在<strong class="text-neon-purple">一天内</strong>完成审核，审核通过后即可在网站上展示。
+                    </p>
+                    <p class="text-sm text-gray-400 mt-2">
+                      审核期间，您可以在管理员面板查看审核状态。
+                    </p>
+                  </div>
+                </div>
+              </div>
+
+              <div class="glass rounded-xl border border-dark-border p-8 max-w-2xl">
+                <form id="submit-tool-form" class="space-y-6">
+                  <div>
+                    <label class="block text-sm font-medium text-gray-300 mb-2">工具名称 <span class="text-red-400">*</span></label>
+                    <input type="text" id="tool-name" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="请输入工具名称" required>
+                  </div>
+                  <div>
+                    <label class="block text-sm font-medium text-gray-300 mb-2">工具链接 <span class="text-red-400">*</span></label>
+                    <input type="url" id="tool-url" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="https://..." required>
+                  </div>
+                  <div>
+                    <label class="block text-sm font-medium text-gray-300 mb-2">工具描述 <span class="text-red-400">*</span></label>
+                    <textarea id="tool-description" rows="3" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="请简要描述工具的功能和特点..." required></textarea>
+                  </div>
+                  <div>
+                    <label class="block text-sm font-medium text-gray-300 mb-2">工具分类 <span class="text-red-400">*</span></label>
+                    <select id="tool-category" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple">
+                      <option value="ide">开发IDE</option>
+                      <option value="plugin">IDE插件</option>
+                      <option value="cli">命令行工具</option>
+                      <option value="codeagent">CodeAgent</option>
+                      <option value="ai-test">AI测试</option>
+                      <option value="review">代码审查</option>
+                      <option value="devops">DevOps工具</option>
+                      <option value="doc">文档相关</option>
+                      <option value="design">设计工具</option>
+                      <option value="ui">UI生成</option>
+                      <option value="mcp">MCP工具</option>
+                      <option value="other">其他工具</option>
+                    </select>
+                  </div>
+                  <div>
+                    <label class="block text-sm font-medium text-gray-300 mb-2">标签（可选，用逗号分隔）</label>
+                    <input type="text" id="tool-tags" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="例如：开源, AI, 前端">
+                  </div>
+                  <div>
+                    <label class="block text-sm font-medium text-gray-300 mb-2">图标（可选）</label>
+                    <input type="text" id="tool-icon" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="例如：</> 或 🚀" value="</>">
+                  </div>
+                  <button type="submit" class="w-full px-6 py-3 bg-gradient-to-r from-neon-purple to-neon-pink text-dark-bg rounded-lg font-semibold hover:from-neon-pink hover:to-neon-purple transition-all hover-glow">
+                    提交工具
+                  </button>
+                </form>
+                <div id="submit-tool-status" class="mt-4 text-sm"></div>
+              </div>
+            </template>
+            
+            <template id="tpl-wechat-mp">
+              <div class="mb-6 text-center">
+                <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2" id="wechat-mp-title"></h1>
+                <p class="text-base text-gray-400 tech-font" id="wechat-mp-description"></p>
+              </div>
+
+              <div class="flex flex-col items-center gap-6">
+                <div class="glass rounded-xl border border-dark-border p-8 w-full max-w-md text-center">
+                  <div class="mb-6">
+                    <img id="wechat-mp-qr" data-src="/static/wechat_mp_qr.jpg" width="256" height="256" loading="lazy" decoding="async" fetchpriority="low" alt="微信公众号二维码" class="w-64 h-64 mx-auto rounded-lg border border-dark-border" onerror="this.style.display='none'">
+                  </div>
+                  <p class="text-gray-300 mb-4">扫描二维码关注我们的微信公众号</p>
+                  <p class="text-sm text-gray-400">获取最新的编程资讯、AI动态和开发工具推荐</p>
+                </div>
+
+                <!-- GitHub 图标只定义一次，下方通过 <use> 引用 -->
+                <svg class="hidden" aria-hidden="true">
+                  <symbol id="icon-github" viewBox="0 0 24 24">
+                    <path fill-rule="evenodd" d="M12 2C6.477 2 2 6.484 2 12.017c0 4.425 2.865 8.18 6.839 9.504.5.092.682-.217.682-.483 0-.237-.008-.868-.013-1.703-2.782.605-3.369-1.343-3.369-1.343-.454-1.158-1.11-1.466-1.11-1.466-.908-.62.069-.608.069-.608 1.003.07 1.531 1.032 1.531 1.032.892 1.53 2.341 1.088 2.91.832.092-.647.35-1.088.636-1.338-2.22-.253-4.555-1.113-4.555-4.951 0-1.093.39-1.988 1.029-2.688-.103-.253-.446-1.272.098-2.65 0 0 .84-.27 2.75 1.026A9.564 9.564 0 0112 6.844c.85.004 1.705.115 2.504.337 1.909-1.296 2.747-1.027 2.747-1.027.546 1.379.202 2.398.1 2.651.64.7 1.028 1.595 1.028 2.688 0 3.848-2.339 4.695-4.566 4.943.359.309.678.92.678 1.855 0 1.338-.012 2.419-.012 2.747 0 .268.18.58.688.482A10.019 10.019 0 0022 12.017C22 6.484 17.522 2 12 2z" clip-rule="evenodd"></path>
+                  </symbol>
+                </svg>
+                <div class="glass rounded-xl border border-dark-border p-8 w-full max-w-2xl">
+                  <div class="flex items-center justify-center mb-4">
+                    <svg class="w-8 h-8 mr-3 text-gray-300" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true"><use href="#icon-github"></use></svg>
+                    <h2 class="text-2xl tech-font-bold text-neon-purple text-glow">开源项目</h2>
+                  </div>
+                  <p class="text-gray-300 mb-4 text-center">这个平台是开源的！欢迎访问我们的 GitHub 仓库</p>
+                  <div class="bg-dark-secondary rounded-lg p-4 mb-4 border border-dark-border">
+                    <div class="text-center">
+                      <a href="https://github.com/yunlongwen/AI-CodeNexus" target="_blank" rel="noopener noreferrer" class="text-neon-cyan hover:text-neon-green transition-colors text-lg font-medium inline-flex items-center justify-center">
+                        <svg class="w-5 h-5 mr-2 flex-shrink-0" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true"><use href="#icon-github"></use></svg>
+                        <span>yunlongwen/AI-CodeNexus</span>
+                        <svg class="w-4 h-4 ml-2 flex-shrink-0" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                          <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M10 6H6a2 2 0 00-2 2v10a2 2 0 002 2h10a2 2 0 002-2v-4M14 4h6m0 0v6m0-6L10 14"></path>
+                        </svg>
+                      </a>
+                      <p class="text-sm text-gray-400 mt-1">编程资讯与工具聚合平台</p>
+                    </div>
+                  </div>
+                  <div class="text-center">
+                    <p class="text-gray-300 mb-3">⭐ 如果这个项目对你有帮助，欢迎给个 Star！</p>
+                    <a href="https://github.com/yunlongwen/AI-CodeNexus" target="_blank" rel="noopener noreferrer" class="inline-flex items-center px-6 py-3 bg-gradient-to-r from-neon-purple to-neon-cyan text-white rounded-lg font-medium hover:from-neon-cyan hover:to-neon-purple transition-all transform hover:scale-105 shadow-lg shadow-neon-purple/50">
+                      <svg class="w-5 h-5 mr-2" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
+                        <path d="M12 .297c-6.63 0-12 5.373-12 12 0 5.303 3.438 9.8 8.205 11.385.6.113.82-.258.82-.577 0-.285-.01-1.04-.015-2.04-3.338.724-4.042-1.61-4.042-1.61C4.422 18.07 3.633 17.7 3.633 17.7c-1.087-.744.084-.729.084-.729 1.205.084 1.838 1.236 1.838 1.236 1.07 1.835 2.809 1.305 3.495.998.108-.776.417-1.305.76-1.605-2.665-.3-5.466-1.332-5.466-5.93 0-1.31.465-2.38 1.235-3.22-.135-.303-.54-1.523.105-3.176 0 0 1.005-.322 3.3 1.23A11.509 11.509 0 0112 5.803c1.02.005 2.047.138 3.006.404 2.29-1.552 3.297-1.23 3.297-1.23.645 1.653.24 2.873.12 3.176.765.84 1.23 1.91 1.23 3.22 0 4.61-2.805 5.625-5.475 5.92.42.36.81 1.096.81 2.22 0 1.606-.015 2.896-.015 3.286 0 .315.21.69.825.57C20.565 22.092 24 17.592 24 12.297c0-6.627-5.373-12-12-12"></path>
+                      </svg>
+                      前往 GitHub 点 Star
+                    </a>
+                  </div>
+                </div>
+              </div>
+            </template>
                 
             <script>
               // API基础URL
               const API_BASE = '/api';
               
+              // 页面骨架中的固定节点按 id 只查询一次；未找到时不缓存，DOM 就绪后会重新查找
+              const _elCache = {};
+              const $ = id => _elCache[id] || (_elCache[id] = document.getElementById(id));
+              
+              // 带超时的 fetch：相同 key 的新请求会取消仍在进行的旧请求，key 为 null 时不做取消
+              const FETCH_TIMEOUT_MS = 8000;
+              const _inflight = new Map();
+              
+              function safeFetch(url, opts = {}, { timeoutMs = FETCH_TIMEOUT_MS, key = url } = {}) {
+                if (key !== null && _inflight.has(key)) {
+                  _inflight.get(key).abort();
+                }
+                const ctl = new AbortController();
+                if (key !== null) _inflight.set(key, ctl);
+                // 超时以 TimeoutError 中止，与被新请求取消的 AbortError 区分开
+                const timer = setTimeout(() => ctl.abort(new DOMException('请求超时', 'TimeoutError')), timeoutMs);
+                return fetch(url, { ...opts, signal: ctl.signal }).finally(() => {
+                  clearTimeout(timer);
+                  if (key !== null && _inflight.get(key) === ctl) _inflight.delete(key);
+                });
+              }
+              
               // 配置文件
               let pageConfig = {};
               
@@ -801,21 +954,54 @@ INDEX_HTML = """
                 category: null,
                 loading: false
               };
-              
+
+              // 当前URL查询参数（每次导航只解析一次，popstate/pushState 时失效）
+              let _urlParams = null;
+              function currentUrlParams() {
+                if (!_urlParams) {
+                  _urlParams = new URLSearchParams(window.location.search);
+                }
+                return _urlParams;
+              }
+
+              window.addEventListener('popstate', function() {
+                _urlParams = null;
+              });
+
+              const _originalPushState = window.history.pushState;
+              window.history.pushState = function(...args) {
+                _urlParams = null;
+                return _originalPushState.apply(this, args);
+              };
+
               // 加载配置文件
               async function loadConfig() {
                 try {
                   const response = await fetch(`${API_BASE}/config`);
                   pageConfig = await response.json();
+                  _pageConfigCache.clear();
                 } catch (error) {
                   console.error('加载配置失败:', error);
                 }
               }
               
+              // 页面配置在会话内是静态的，按 pageType/category 缓存解析结果（配置重新加载时清空）
+              const _pageConfigCache = new Map();
+              
               // 获取页面配置
               function getPageConfig(pageType, category = null) {
                 if (!pageConfig.pages) return { title: '', description: '' };
                 
+                const key = category ? `${pageType}|${category}` : pageType;
+                let config = _pageConfigCache.get(key);
+                if (!config) {
+                  config = resolvePageConfig(pageType, category);
+                  _pageConfigCache.set(key, config);
+                }
+                return config;
+              }
+              
+              function resolvePageConfig(pageType, category) {
                 // 如果是分类页面
                 if (category && pageConfig.categories && pageConfig.categories.tools) {
                   const catConfig = pageConfig.categories.tools[category];
@@ -834,7 +1020,7 @@ INDEX_HTML = """
               
               // 加载工具列表
               async function loadTools(featured = false, category = null, page = 1) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
@@ -865,7 +1051,7 @@ INDEX_HTML = """
               
               // 渲染工具列表
               function renderTools(tools, total, page, totalPages, category = null, isFeatured = true) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 // 获取页面配置
@@ -932,11 +1118,13 @@ INDEX_HTML = """
                 
                 // 分页控件
                 if (totalPages > 1) {
+                  const prevDisabled = page <= 1 ? 'disabled' : '';
+                  const nextDisabled = page >= totalPages ? 'disabled' : '';
                   const categoryParam = category ? `'${category}'` : 'null';
                   html += `
                     <div class="flex items-center justify-center gap-2 mt-8">
                       <button onclick="changePage(${page - 1}, ${categoryParam}, ${isFeatured})" 
-                              ${page <= 1 ? 'disabled' : ''}
+                              ${prevDisabled}
                               class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                         上一页
                       </button>
@@ -944,7 +1132,7 @@ INDEX_HTML = """
                         第 ${page} / ${totalPages} 页
                       </span>
                       <button onclick="changePage(${page + 1}, ${categoryParam}, ${isFeatured})" 
-                              ${page >= totalPages ? 'disabled' : ''}
+                              ${nextDisabled}
                               class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                         下一页
                       </button>
@@ -957,7 +1145,7 @@ INDEX_HTML = """
               
               // 加载文章列表
               async function loadArticles(category = 'programming', page = 1) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
@@ -979,7 +1167,7 @@ INDEX_HTML = """
               
               // 渲染文章列表
               function renderArticles(articles, total, page, totalPages, category) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 // 获取页面配置
@@ -1032,7 +1220,7 @@ INDEX_HTML = """
                     html += `
                       <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                         ${isAdminUser ? `
-                        <button onclick="deleteArticle('${urlEscaped}', '${category}')" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
+                        <button onclick="deleteArticle('${urlEscaped}', '${category}', this)" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
                           删除
                         </button>
                         ` : ''}
@@ -1070,10 +1258,12 @@ INDEX_HTML = """
                 
                 // 分页控件
                 if (totalPages > 1) {
+                  const prevDisabled = page <= 1 ? 'disabled' : '';
+                  const nextDisabled = page >= totalPages ? 'disabled' : '';
                   html += `
                     <div class="flex items-center justify-center gap-2 mt-8">
                       <button onclick="changeArticlePage(${page - 1}, '${category}')" 
-                              ${page <= 1 ? 'disabled' : ''}
+                              ${prevDisabled}
                               class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                         上一页
                       </button>
@@ -1081,7 +1271,7 @@ INDEX_HTML = """
                         第 ${page} / ${totalPages} 页
                       </span>
                       <button onclick="changeArticlePage(${page + 1}, '${category}')" 
-                              ${page >= totalPages ? 'disabled' : ''}
+                              ${nextDisabled}
                               class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                         下一页
                       </button>
@@ -1126,7 +1316,7 @@ INDEX_HTML = """
               
               // 显示工具详情
               async function showToolDetail(toolIdOrIdentifier) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
@@ -1151,7 +1341,7 @@ INDEX_HTML = """
               
               // 渲染工具详情
               function renderToolDetail(tool) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 const iconColor = tool.category === 'codeagent' || tool.category === 'ai-test' 
@@ -1256,7 +1446,7 @@ INDEX_HTML = """
                     html += `
                       <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                         ${isAdminUser ? `
-                        <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}')" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
+                        <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}', this)" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
                           删除
                         </button>
                         ` : ''}
@@ -1338,7 +1528,7 @@ INDEX_HTML = """
                     html += `
                       <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                         ${isAdminUser ? `
-                        <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}')" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
+                        <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}', this)" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
                           删除
                         </button>
                         ` : ''}
@@ -1384,12 +1574,17 @@ INDEX_HTML = """
               }
               
               // 顶部导航激活状态管理函数（必须在 handleRoute 之前定义）
+              let _topNavItems = null;
               function updateActiveNav() {
                 // 每次调用时都读取最新的路径
                 const currentPath = window.location.pathname || '/news';
-                const topNavItems = document.querySelectorAll('.top-nav-item');
+                // 顶部导航是静态结构，查到一次后复用
+                if (!_topNavItems || _topNavItems.length === 0) {
+                  _topNavItems = document.querySelectorAll('.top-nav-item');
+                }
+                const topNavItems = _topNavItems;
                 
-                if (!topNavItems || topNavItems.length === 0) {
+                if (topNavItems.length === 0) {
                   // DOM 还没加载完成，稍后重试
                   setTimeout(updateActiveNav, 100);
                   return;
@@ -1452,7 +1647,7 @@ INDEX_HTML = """
                   loadTools(true, null, 1);
                 } else if (route === 'prompts') {
                   currentPage.category = null;
-                  loadPrompts(1);
+                  loadPrompts(parseInt(currentUrlParams().get('page'), 10) || 1);
                 } else if (route === 'rules') {
                   currentPage.category = null;
                   loadRules(1);
@@ -1502,7 +1697,7 @@ INDEX_HTML = """
               let recentSearchQuery = '';
               
               async function loadRecent(page = 1, search = '') {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
@@ -1557,7 +1752,7 @@ INDEX_HTML = """
                       html += `
                         <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                           ${isAdminUser ? `
-                          <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}')" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
+                          <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}', this)" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
                             删除
                           </button>
                           ` : ''}
@@ -1587,16 +1782,18 @@ INDEX_HTML = """
                   html += '</div>';
                   
                   if (data.total_pages > 1) {
+                    const prevDisabled = data.page <= 1 ? 'disabled' : '';
+                    const nextDisabled = data.page >= data.total_pages ? 'disabled' : '';
                     html += `
                       <div class="flex items-center justify-center gap-2 mt-8">
                         <button onclick="changeRecentPage(${data.page - 1}, '${search.replace(/'/g, "\\'")}')" 
-                                ${data.page <= 1 ? 'disabled' : ''}
+                                ${prevDisabled}
                                 class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                           上一页
                         </button>
                         <span class="px-4 py-2 text-gray-400 tech-font">第 ${data.page} / ${data.total_pages} 页</span>
                         <button onclick="changeRecentPage(${data.page + 1}, '${search.replace(/'/g, "\\'")}')" 
-                                ${data.page >= data.total_pages ? 'disabled' : ''}
+                                ${nextDisabled}
                                 class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                           下一页
                       </button>
@@ -1631,7 +1828,7 @@ INDEX_HTML = """
               
               // 加载热门资讯（按点击次数排序）
               async function loadHotNews(page = 1) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
@@ -1650,7 +1847,7 @@ INDEX_HTML = """
               
               // 渲染热门文章列表
               function renderHotArticles(articles, total, page, totalPages) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 const config = getPageConfig('hot-news');
@@ -1680,7 +1877,7 @@ INDEX_HTML = """
                     html += `
                       <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                         ${isAdminUser ? `
-                        <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}')" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
+                        <button onclick="deleteArticle('${urlEscaped}', '${categoryValue}', this)" class="absolute top-4 right-4 px-2 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors" title="删除文章">
                           删除
                         </button>
                         ` : ''}
@@ -1712,10 +1909,12 @@ INDEX_HTML = """
                 
                 // 分页控件
                 if (totalPages > 1) {
+                  const prevDisabled = page <= 1 ? 'disabled' : '';
+                  const nextDisabled = page >= totalPages ? 'disabled' : '';
                   html += `
                     <div class="flex items-center justify-center gap-2 mt-8">
                       <button onclick="changeHotNewsPage(${page - 1})" 
-                              ${page <= 1 ? 'disabled' : ''}
+                              ${prevDisabled}
                               class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                         上一页
                       </button>
@@ -1723,7 +1922,7 @@ INDEX_HTML = """
                         第 ${page} / ${totalPages} 页
                       </span>
                       <button onclick="changeHotNewsPage(${page + 1})" 
-                              ${page >= totalPages ? 'disabled' : ''}
+                              ${nextDisabled}
                               class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">
                         下一页
                       </button>
@@ -1816,38 +2015,93 @@ INDEX_HTML = """
 
 
 
+              // 提示词分页缓存：已获取的页按页码缓存，翻到第 N 页时只请求缺失的那一页；
+              // 缓存为空时直接打开第 N 页，则合并为一次 page=1&page_size=N*pageSize 的请求再在本地切分
+              const PROMPTS_MAX_PAGE_SIZE = 100; // 与 /api/prompts 的 page_size 上限一致
+              const promptsPageCache = { pages: new Map(), total: 0, totalPages: 0 };
+              
+              async function fetchPromptsPage(page) {
+                const cache = promptsPageCache;
+                const pageSize = currentPage.pageSize;
+                
+                if (!cache.pages.has(page)) {
+                  const combinedSize = page * pageSize;
+                  if (cache.pages.size === 0 && page > 1 && combinedSize <= PROMPTS_MAX_PAGE_SIZE) {
+                    const response = await fetch(`${API_BASE}/prompts?page=1&page_size=${combinedSize}`);
+                    const data = await response.json();
+                    cache.total = data.total;
+                    cache.totalPages = Math.ceil(data.total / pageSize);
+                    for (let p = 1; p <= page; p++) {
+                      cache.pages.set(p, data.items.slice((p - 1) * pageSize, p * pageSize));
+                    }
+                  } else {
+                    const response = await fetch(`${API_BASE}/prompts?page=${page}&page_size=${pageSize}`);
+                    const data = await response.json();
+                    cache.total = data.total;
+                    cache.totalPages = data.total_pages;
+                    cache.pages.set(page, data.items);
+                  }
+                }
+                
+                return {
+                  items: cache.pages.get(page) || [],
+                  total: cache.total,
+                  page: page,
+                  total_pages: cache.totalPages
+                };
+              }
+              
               // 加载提示词
+              // 首次进入时渲染 header / 卡片列表 / 分页三个容器，翻页时只替换卡片并原地更新分页控件
               async function loadPrompts(page = 1) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
-                mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
+                const spinner = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
+                let cardsEl = document.getElementById('prompts-cards');
+                if (cardsEl) {
+                  cardsEl.innerHTML = spinner;
+                } else {
+                  mainContent.innerHTML = spinner;
+                }
+                
+                if (!cardsEl) {
+                  // 重新进入提示词页面时丢弃旧的分页缓存
+                  promptsPageCache.pages.clear();
+                }
                 
                 try {
-                  const response = await fetch(`${API_BASE}/prompts?page=${page}&page_size=${currentPage.pageSize}`);
-                  const data = await response.json();
-                  
-                  const config = getPageConfig('prompts');
-                  const title = config.title || '提示词';
-                  const description = config.description || '精选AI编程提示词，提升开发效率';
-                  
-                  let html = `
-                    <div class="mb-6">
-                      <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">${title}</h1>
-                      <p class="text-base text-gray-400 tech-font">${description} (共 ${data.total} 个)</p>
-                    </div>
-                    <div class="space-y-6 mb-8">
-                  `;
+                  const data = await fetchPromptsPage(page);
+                  
+                  cardsEl = document.getElementById('prompts-cards');
+                  if (!cardsEl) {
+                    const config = getPageConfig('prompts');
+                    const title = config.title || '提示词';
+                    const description = config.description || '精选AI编程提示词，提升开发效率';
+                    const pagerBtnClass = 'px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed';
+                    
+                    mainContent.innerHTML = `
+                      <div class="mb-6" id="prompts-header">
+                        <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">${title}</h1>
+                        <p class="text-base text-gray-400 tech-font">${description} (共 <span id="prompts-total"></span> 个)</p>
+                      </div>
+                      <div class="space-y-6 mb-8" id="prompts-cards"></div>
+                      <div class="flex items-center justify-center gap-2 mt-8 hidden" id="prompts-pager">
+                        <button id="prompts-prev" onclick="changePromptsPage(Number(this.dataset.page))" class="${pagerBtnClass}">上一页</button>
+                        <span class="px-4 py-2 text-gray-400 tech-font" id="prompts-page-label"></span>
+                        <button id="prompts-next" onclick="changePromptsPage(Number(this.dataset.page))" class="${pagerBtnClass}">下一页</button>
+                      </div>
+                    `;
+                    cardsEl = document.getElementById('prompts-cards');
+                  }
                   
+                  const parts = [];
                   if (data.items.length === 0) {
-                    html += '<div class="text-center py-20 text-gray-400">暂无提示词</div>';
+                    parts.push('<div class="text-center py-20 text-gray-400">暂无提示词</div>');
                   } else {
-                    data.items.forEach((prompt, index) => {
-                      const promptId = prompt.id || index;
-                      const identifier = prompt.identifier || '';
-                      const hasContent = identifier; // 如果有identifier，就认为有内容
-
-                      html += `
+                    for (let i = 0, n = data.items.length; i < n; i++) {
+                      const prompt = data.items[i];
+                      parts.push(`
                         <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                           <div class="flex items-start justify-between mb-4">
                             <div class="flex-1">
@@ -1866,29 +2120,29 @@ INDEX_HTML = """
                             ` : ''}
                           </div>
                           <div class="flex items-center justify-between mt-4 pt-4 border-t border-dark-border">
-                            <div class="flex items-center gap-2 flex-wrap">
-                              ${(prompt.tags || []).map(tag => `<span class="px-2 py-1 glass text-neon-cyan text-xs rounded border border-neon-cyan/30">${tag}</span>`).join('')}
+                            <div class="flex items-center gap-2 flex-wrap">`);
+                      pushTagSpans(parts, prompt.tags);
+                      parts.push(`
                             </div>
                             ${prompt.url ? `<a href="${prompt.url}" target="_blank" class="text-xs text-gray-400 hover:text-neon-cyan transition-colors">查看原文 →</a>` : ''}
                           </div>
                         </article>
-                      `;
-                    });
-                  }
-                  
-                  html += '</div>';
-                  
-                  if (data.total_pages > 1) {
-                    html += `
-                      <div class="flex items-center justify-center gap-2 mt-8">
-                        <button onclick="changePromptsPage(${data.page - 1})" ${data.page <= 1 ? 'disabled' : ''} class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">上一页</button>
-                        <span class="px-4 py-2 text-gray-400 tech-font">第 ${data.page} / ${data.total_pages} 页</span>
-                        <button onclick="changePromptsPage(${data.page + 1})" ${data.page >= data.total_pages ? 'disabled' : ''} class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">下一页</button>
-                      </div>
-                    `;
+                      `);
+                    }
                   }
-
-                  mainContent.innerHTML = html;
+                  cardsEl.innerHTML = parts.join('');
+                  
+                  // 原地更新总数和分页控件
+                  document.getElementById('prompts-total').textContent = data.total;
+                  const pager = document.getElementById('prompts-pager');
+                  const prevBtn = document.getElementById('prompts-prev');
+                  const nextBtn = document.getElementById('prompts-next');
+                  pager.classList.toggle('hidden', data.total_pages <= 1);
+                  document.getElementById('prompts-page-label').textContent = `第 ${data.page} / ${data.total_pages} 页`;
+                  prevBtn.dataset.page = data.page - 1;
+                  nextBtn.dataset.page = data.page + 1;
+                  prevBtn.disabled = data.page <= 1;
+                  nextBtn.disabled = data.page >= data.total_pages;
 
                   // 更新导航激活状态
                   setTimeout(updateActiveNav, 100);
@@ -1900,12 +2154,41 @@ INDEX_HTML = """
               
               function changePromptsPage(page) {
                 if (page < 1) return;
+                window.history.pushState({}, '', page > 1 ? `/prompts?page=${page}` : '/prompts');
                 loadPrompts(page);
               }
               
+              // 将标签追加到 parts 数组（避免 map/join 产生临时数组）
+              function pushTagSpans(parts, tags) {
+                if (!tags) return;
+                for (let i = 0, n = tags.length; i < n; i++) {
+                  parts.push(`<span class="px-2 py-1 glass text-neon-cyan text-xs rounded border border-neon-cyan/30">${tags[i]}</span>`);
+                }
+              }
+              
+              // 将单个资源卡片追加到 parts 数组
+              function pushResourceCard(parts, resource) {
+                parts.push(`
+                  <article class="glass rounded-xl border border-dark-border p-6 card-hover">
+                    <div class="flex items-start gap-3 mb-2">
+                      <span class="text-sm px-2 py-1 glass border border-neon-purple/30 text-neon-purple rounded">${resource.type || '资源'}</span>
+                    </div>
+                    <h3 class="text-xl font-semibold text-gray-100 mb-2">
+                      <a href="${resource.url}" target="_blank" class="hover:text-neon-cyan transition-colors">${resource.title}</a>
+                    </h3>
+                    <p class="text-sm text-gray-300 mb-3">${resource.description}</p>
+                    ${resource.author ? `<p class="text-xs text-gray-400 mb-3">作者: ${resource.author}</p>` : ''}
+                    <div class="flex items-center gap-2 flex-wrap">`);
+                pushTagSpans(parts, resource.tags);
+                parts.push(`
+                    </div>
+                  </article>
+                `);
+              }
+              
               // 加载规则
               async function loadRules(page = 1) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
@@ -1919,19 +2202,20 @@ INDEX_HTML = """
                   const title = config.title || '规则';
                   const description = config.description || 'Cursor Rules和其他AI编程规则';
                   
-                  let html = `
+                  const parts = [`
                     <div class="mb-6">
                       <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">${title}</h1>
                       <p class="text-base text-gray-400 tech-font">${description} (共 ${data.total} 个)</p>
                     </div>
                     <div class="space-y-6 mb-8">
-                  `;
+                  `];
                   
                   if (data.items.length === 0) {
-                    html += '<div class="text-center py-20 text-gray-400">暂无规则</div>';
+                    parts.push('<div class="text-center py-20 text-gray-400">暂无规则</div>');
                   } else {
-                    data.items.forEach((rule, index) => {
-                      html += `
+                    for (let i = 0, n = data.items.length; i < n; i++) {
+                      const rule = data.items[i];
+                      parts.push(`
                         <article class="glass rounded-xl border border-dark-border p-6 card-hover relative">
                           <div class="flex items-start justify-between mb-4">
                             <div class="flex-1">
@@ -1950,29 +2234,32 @@ INDEX_HTML = """
                             ` : ''}
                           </div>
                           <div class="flex items-center justify-between mt-4 pt-4 border-t border-dark-border">
-                            <div class="flex items-center gap-2 flex-wrap">
-                              ${(rule.tags || []).map(tag => `<span class="px-2 py-1 glass text-neon-cyan text-xs rounded border border-neon-cyan/30">${tag}</span>`).join('')}
+                            <div class="flex items-center gap-2 flex-wrap">`);
+                      pushTagSpans(parts, rule.tags);
+                      parts.push(`
                             </div>
                             ${rule.url ? `<a href="${rule.url}" target="_blank" class="text-xs text-gray-400 hover:text-neon-cyan transition-colors">查看原文 →</a>` : ''}
                           </div>
                         </article>
-                      `;
-                    });
+                      `);
+                    }
                   }
                   
-                  html += '</div>';
+                  parts.push('</div>');
                   
                   if (data.total_pages > 1) {
-                    html += `
+                    const prevDisabled = data.page <= 1 ? 'disabled' : '';
+                    const nextDisabled = data.page >= data.total_pages ? 'disabled' : '';
+                    parts.push(`
                       <div class="flex items-center justify-center gap-2 mt-8">
-                        <button onclick="changeRulesPage(${data.page - 1})" ${data.page <= 1 ? 'disabled' : ''} class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">上一页</button>
+                        <button onclick="changeRulesPage(${data.page - 1})" ${prevDisabled} class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">上一页</button>
                         <span class="px-4 py-2 text-gray-400 tech-font">第 ${data.page} / ${data.total_pages} 页</span>
-                        <button onclick="changeRulesPage(${data.page + 1})" ${data.page >= data.total_pages ? 'disabled' : ''} class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">下一页</button>
+                        <button onclick="changeRulesPage(${data.page + 1})" ${nextDisabled} class="px-4 py-2 glass text-gray-300 rounded-lg hover:bg-dark-card hover:text-neon-cyan transition-all border border-dark-border disabled:opacity-50 disabled:cursor-not-allowed">下一页</button>
                       </div>
-                    `;
+                    `);
                   }
                   
-                  mainContent.innerHTML = html;
+                  mainContent.innerHTML = parts.join('');
                   // 更新导航激活状态
                   setTimeout(updateActiveNav, 100);
                 } catch (error) {
@@ -1988,14 +2275,14 @@ INDEX_HTML = """
               
               // 加载社区资源（按分类模块化显示）
               async function loadResources(page = 1, category = null) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
                 
                 try {
                   // 从URL参数获取category和subcategory
-                  const urlParams = new URLSearchParams(window.location.search);
+                  const urlParams = currentUrlParams();
                   const urlCategory = urlParams.get('category');
                   const urlSubcategory = urlParams.get('subcategory');
                   if (urlCategory) {
@@ -2031,15 +2318,15 @@ INDEX_HTML = """
                     }
                   }
                   
-                  let html = `
+                  const parts = [`
                     <div class="mb-6">
                       <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">${title}</h1>
                       <p class="text-base text-gray-400 tech-font">${description} (共 ${displayItems.length} 个)</p>
                     </div>
-                  `;
+                  `];
                   
                   if (displayItems.length === 0) {
-                    html += '<div class="text-center py-20 text-gray-400">暂无资源</div>';
+                    parts.push('<div class="text-center py-20 text-gray-400">暂无资源</div>');
                   } else {
                     if (category) {
                       // 如果指定了分类，直接显示该分类的资源
@@ -2052,46 +2339,33 @@ INDEX_HTML = """
                         categoryTitle = `${category} - ${subcategoryIcon} ${urlSubcategory}`;
                       }
                       
-                      html += `
+                      parts.push(`
                         <div class="mb-8">
                           <h2 class="text-2xl font-bold text-neon-cyan mb-4 flex items-center gap-2">
                             ${categoryIcon} ${categoryTitle}
                           </h2>
                           <div class="space-y-4">
-                      `;
+                      `);
                       
-                      displayItems.forEach(resource => {
-                        html += `
-                          <article class="glass rounded-xl border border-dark-border p-6 card-hover">
-                            <div class="flex items-start gap-3 mb-2">
-                              <span class="text-sm px-2 py-1 glass border border-neon-purple/30 text-neon-purple rounded">${resource.type || '资源'}</span>
-                            </div>
-                            <h3 class="text-xl font-semibold text-gray-100 mb-2">
-                              <a href="${resource.url}" target="_blank" class="hover:text-neon-cyan transition-colors">${resource.title}</a>
-                            </h3>
-                            <p class="text-sm text-gray-300 mb-3">${resource.description}</p>
-                            ${resource.author ? `<p class="text-xs text-gray-400 mb-3">作者: ${resource.author}</p>` : ''}
-                            <div class="flex items-center gap-2 flex-wrap">
-                              ${(resource.tags || []).map(tag => `<span class="px-2 py-1 glass text-neon-cyan text-xs rounded border border-neon-cyan/30">${tag}</span>`).join('')}
-                            </div>
-                          </article>
-                        `;
-                      });
+                      for (let i = 0, n = displayItems.length; i < n; i++) {
+                        pushResourceCard(parts, displayItems[i]);
+                      }
                       
-                      html += `
+                      parts.push(`
                           </div>
                         </div>
-                      `;
+                      `);
                     } else {
                       // 按分类分组显示
                       const resourcesByCategory = {};
-                      displayItems.forEach(resource => {
+                      for (let i = 0, n = displayItems.length; i < n; i++) {
+                        const resource = displayItems[i];
                         const cat = resource.category || '其他';
                         if (!resourcesByCategory[cat]) {
                           resourcesByCategory[cat] = [];
                         }
                         resourcesByCategory[cat].push(resource);
-                      });
+                      }
                       
                       const categoryOrder = ['飞书知识库', '技术社区', 'Cursor资源', 'Claude Code 资源', '其他'];
                       const sortedCategories = Object.keys(resourcesByCategory).sort((a, b) => {
@@ -2103,20 +2377,22 @@ INDEX_HTML = """
                         return indexA - indexB;
                       });
                       
-                      sortedCategories.forEach(cat => {
+                      for (let c = 0, nc = sortedCategories.length; c < nc; c++) {
+                        const cat = sortedCategories[c];
                         const resources = resourcesByCategory[cat];
                         const categoryIcon = cat === '飞书知识库' ? '📚' : cat === '技术社区' ? '👥' : cat === 'Cursor资源' ? '🎯' : cat === 'Claude Code 资源' ? '🤖' : '📦';
                         
                         // 如果是Claude Code资源，按subcategory分组
                         if (cat === 'Claude Code 资源') {
                           const subcategories = {};
-                          resources.forEach(resource => {
+                          for (let i = 0, n = resources.length; i < n; i++) {
+                            const resource = resources[i];
                             const subcat = resource.subcategory || '其他';
                             if (!subcategories[subcat]) {
                               subcategories[subcat] = [];
                             }
                             subcategories[subcat].push(resource);
-                          });
+                          }
                           
                           const subcategoryOrder = ['插件市场', '模型服务', 'Skill', '其他'];
                           const sortedSubcategories = Object.keys(subcategories).sort((a, b) => {
@@ -2128,78 +2404,51 @@ INDEX_HTML = """
                             return indexA - indexB;
                           });
                           
-                          sortedSubcategories.forEach(subcat => {
+                          for (let s = 0, ns = sortedSubcategories.length; s < ns; s++) {
+                            const subcat = sortedSubcategories[s];
                             const subcatResources = subcategories[subcat];
                             const subcategoryIcon = subcat === '插件市场' ? '🔌' : subcat === '模型服务' ? '🌐' : subcat === 'Skill' ? '🎯' : '📦';
                             
-                            html += `
+                            parts.push(`
                               <div class="mb-8">
                                 <h3 class="text-xl font-bold text-neon-purple mb-4 flex items-center gap-2">
                                   ${subcategoryIcon} ${subcat}
                                 </h3>
                                 <div class="space-y-4">
-                            `;
+                            `);
                             
-                            subcatResources.forEach(resource => {
-                              html += `
-                                <article class="glass rounded-xl border border-dark-border p-6 card-hover">
-                                  <div class="flex items-start gap-3 mb-2">
-                                    <span class="text-sm px-2 py-1 glass border border-neon-purple/30 text-neon-purple rounded">${resource.type || '资源'}</span>
-                                  </div>
-                                  <h3 class="text-xl font-semibold text-gray-100 mb-2">
-                                    <a href="${resource.url}" target="_blank" class="hover:text-neon-cyan transition-colors">${resource.title}</a>
-                                  </h3>
-                                  <p class="text-sm text-gray-300 mb-3">${resource.description}</p>
-                                  ${resource.author ? `<p class="text-xs text-gray-400 mb-3">作者: ${resource.author}</p>` : ''}
-                                  <div class="flex items-center gap-2 flex-wrap">
-                                    ${(resource.tags || []).map(tag => `<span class="px-2 py-1 glass text-neon-cyan text-xs rounded border border-neon-cyan/30">${tag}</span>`).join('')}
-                                  </div>
-                                </article>
-                              `;
-                            });
+                            for (let i = 0, n = subcatResources.length; i < n; i++) {
+                              pushResourceCard(parts, subcatResources[i]);
+                            }
                             
-                            html += `
+                            parts.push(`
                                 </div>
                               </div>
-                            `;
-                          });
+                            `);
+                          }
                         } else {
-                          html += `
+                          parts.push(`
                             <div class="mb-8">
                               <h2 class="text-2xl font-bold text-neon-cyan mb-4 flex items-center gap-2">
                                 ${categoryIcon} ${cat}
                               </h2>
                               <div class="space-y-4">
-                          `;
+                          `);
                           
-                          resources.forEach(resource => {
-                            html += `
-                              <article class="glass rounded-xl border border-dark-border p-6 card-hover">
-                                <div class="flex items-start gap-3 mb-2">
-                                  <span class="text-sm px-2 py-1 glass border border-neon-purple/30 text-neon-purple rounded">${resource.type || '资源'}</span>
-                                </div>
-                                <h3 class="text-xl font-semibold text-gray-100 mb-2">
-                                  <a href="${resource.url}" target="_blank" class="hover:text-neon-cyan transition-colors">${resource.title}</a>
-                                </h3>
-                                <p class="text-sm text-gray-300 mb-3">${resource.description}</p>
-                                ${resource.author ? `<p class="text-xs text-gray-400 mb-3">作者: ${resource.author}</p>` : ''}
-                                <div class="flex items-center gap-2 flex-wrap">
-                                  ${(resource.tags || []).map(tag => `<span class="px-2 py-1 glass text-neon-cyan text-xs rounded border border-neon-cyan/30">${tag}</span>`).join('')}
-                                </div>
-                              </article>
-                            `;
-                          });
+                          for (let i = 0, n = resources.length; i < n; i++) {
+                            pushResourceCard(parts, resources[i]);
+                          }
                           
-                          html += `
+                          parts.push(`
                               </div>
                             </div>
-                          `;
+                          `);
                         }
-                      });
+                      }
                     }
                   }
                   
-                  mainContent.innerHTML = html;
+                  mainContent.innerHTML = parts.join('');
                   // 更新导航激活状态
                   setTimeout(updateActiveNav, 100);
                 } catch (error) {
@@ -2213,9 +2462,14 @@ INDEX_HTML = """
                 loadResources(page);
               }
               
+              // 克隆 <template> 中预解析的静态页面
+              function cloneTemplate(id) {
+                return document.getElementById(id).content.cloneNode(true);
+              }
+              
               // 显示提交资讯表单
               function showSubmitForm() {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 const config = getPageConfig('submit');
@@ -2325,102 +2579,61 @@ INDEX_HTML = """
               }
               
               // 显示提交工具表单
+              // 提交工具页面只构建一次，再次进入时直接复用已有节点和提交处理函数
+              let _submitToolNodes = null;
+              let _submitToolStatus = null;
+              
               function showSubmitToolForm() {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
-                mainContent.innerHTML = `
-                  <div class="mb-6">
-                    <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">提交工具</h1>
-                    <p class="text-base text-gray-400 tech-font">分享优质的开发工具和资源</p>
-                  </div>
-                  
-                  <!-- 审核说明 -->
-                  <div class="glass rounded-xl border border-neon-purple/30 p-6 mb-6 max-w-2xl">
-                    <div class="flex items-start gap-3">
-                      <span class="text-2xl">ℹ️</span>
-                      <div>
-                        <h3 class="text-lg font-semibold text-neon-purple mb-2">审核说明</h3>
-                        <p class="text-sm text-gray-300 leading-relaxed">
-                          您提交的工具将进入工具候选池，由管理员进行人工审核。我们会在<strong class="text-neon-purple">一天内</strong>完成审核，审核通过后即可在网站上展示。
-                        </p>
-                        <p class="text-sm text-gray-400 mt-2">
-                          审核期间，您可以在管理员面板查看审核状态。
-                        </p>
-                      </div>
-                  </div>
-                </div>
-                  
-                  <div class="glass rounded-xl border border-dark-border p-8 max-w-2xl">
-                    <form id="submit-tool-form" class="space-y-6">
-                      <div>
-                        <label class="block text-sm font-medium text-gray-300 mb-2">工具名称 <span class="text-red-400">*</span></label>
-                        <input type="text" id="tool-name" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="请输入工具名称" required>
-              </div>
-                      <div>
-                        <label class="block text-sm font-medium text-gray-300 mb-2">工具链接 <span class="text-red-400">*</span></label>
-                        <input type="url" id="tool-url" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="https://..." required>
-                      </div>
-                      <div>
-                        <label class="block text-sm font-medium text-gray-300 mb-2">工具描述 <span class="text-red-400">*</span></label>
-                        <textarea id="tool-description" rows="3" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="请简要描述工具的功能和特点..." required></textarea>
-                      </div>
-                      <div>
-                        <label class="block text-sm font-medium text-gray-300 mb-2">工具分类 <span class="text-red-400">*</span></label>
-                        <select id="tool-category" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple">
-                          <option value="ide">开发IDE</option>
-                          <option value="plugin">IDE插件</option>
-                          <option value="cli">命令行工具</option>
-                          <option value="codeagent">CodeAgent</option>
-                          <option value="ai-test">AI测试</option>
-                          <option value="review">代码审查</option>
-                          <option value="devops">DevOps工具</option>
-                          <option value="doc">文档相关</option>
-                          <option value="design">设计工具</option>
-                          <option value="ui">UI生成</option>
-                          <option value="mcp">MCP工具</option>
-                          <option value="other">其他工具</option>
-                        </select>
-                      </div>
-                      <div>
-                        <label class="block text-sm font-medium text-gray-300 mb-2">标签（可选，用逗号分隔）</label>
-                        <input type="text" id="tool-tags" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="例如：开源, AI, 前端">
-                      </div>
-                      <div>
-                        <label class="block text-sm font-medium text-gray-300 mb-2">图标（可选）</label>
-                        <input type="text" id="tool-icon" class="w-full px-4 py-3 glass border border-dark-border rounded-lg text-gray-100 focus:outline-none focus:border-neon-purple" placeholder="例如：</> 或 🚀" value="</>">
-                      </div>
-                      <button type="submit" class="w-full px-6 py-3 bg-gradient-to-r from-neon-purple to-neon-pink text-dark-bg rounded-lg font-semibold hover:from-neon-pink hover:to-neon-purple transition-all hover-glow">
-                        提交工具
-                      </button>
-                    </form>
-                    <div id="submit-tool-status" class="mt-4 text-sm"></div>
-                  </div>
-                `;
+                if (!_submitToolNodes) {
+                  _submitToolNodes = buildSubmitToolPage();
+                } else {
+                  // 再次进入时清掉上次提交留下的提示
+                  _submitToolStatus.textContent = '';
+                  _submitToolStatus.className = 'mt-4 text-sm';
+                }
+                mainContent.replaceChildren(..._submitToolNodes);
+              }
+              
+              function buildSubmitToolPage() {
+                const page = cloneTemplate('tpl-submit-tool');
+                
+                // 表单节点只查找一次，提交处理函数直接复用
+                const form = page.querySelector('#submit-tool-form');
+                const fields = {
+                  name: form.querySelector('#tool-name'),
+                  url: form.querySelector('#tool-url'),
+                  description: form.querySelector('#tool-description'),
+                  category: form.querySelector('#tool-category'),
+                  tags: form.querySelector('#tool-tags'),
+                  icon: form.querySelector('#tool-icon')
+                };
+                const statusEl = page.querySelector('#submit-tool-status');
+                _submitToolStatus = statusEl;
                 
                 // 绑定表单提交
-                document.getElementById('submit-tool-form').addEventListener('submit', async function(e) {
+                form.addEventListener('submit', async function(e) {
                   e.preventDefault();
-                  const name = document.getElementById('tool-name').value.trim();
-                  const url = document.getElementById('tool-url').value.trim();
-                  const description = document.getElementById('tool-description').value.trim();
-                  const category = document.getElementById('tool-category').value;
-                  const tags = document.getElementById('tool-tags').value.trim();
-                  const icon = document.getElementById('tool-icon').value.trim() || '</>';
+                  const name = fields.name.value.trim();
+                  const url = fields.url.value.trim();
+                  const description = fields.description.value.trim();
+                  const category = fields.category.value;
+                  const tags = fields.tags.value.trim();
+                  const icon = fields.icon.value.trim() || '</>';
                   
                   if (!name || !url || !description) {
-                    const statusEl = document.getElementById('submit-tool-status');
                     statusEl.textContent = '请填写必填项';
                     statusEl.className = 'mt-4 text-sm text-red-400';
                     return;
                   }
                   
-                  const statusEl = document.getElementById('submit-tool-status');
                   statusEl.textContent = '提交中...';
                   statusEl.className = 'mt-4 text-sm text-blue-400';
                   
                   try {
-                    const response = await fetch(`${API_BASE}/tools/submit`, {
+                    const response = await safeFetch(`${API_BASE}/tools/submit`, {
                       method: 'POST',
                       headers: {
                         'Content-Type': 'application/json'
@@ -2440,89 +2653,51 @@ INDEX_HTML = """
                     if (data.ok) {
                       statusEl.textContent = '提交成功！您的工具已进入审核队列，我们会在一天内完成审核。';
                       statusEl.className = 'mt-4 text-sm text-green-400';
-                      document.getElementById('submit-tool-form').reset();
-                      document.getElementById('tool-icon').value = '</>';
+                      form.reset();
+                      fields.icon.value = '</>';
                     } else {
                       statusEl.textContent = data.message || '提交失败，请稍后重试。';
                       statusEl.className = 'mt-4 text-sm text-red-400';
                     }
                   } catch (error) {
+                    if (error.name === 'AbortError') return;
                     console.error('提交失败:', error);
                     statusEl.textContent = '提交失败，请稍后重试。';
                     statusEl.className = 'mt-4 text-sm text-red-400';
                   }
                 });
+                
+                return Array.from(page.childNodes);
               }
               
               // 显示微信公众号页面
               function showWeChatMP() {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
                 
                 const config = getPageConfig('wechat-mp');
                 const title = config.title || '微信公众号';
                 const description = config.description || '关注我们的微信公众号，获取最新技术资讯';
                 
-                mainContent.innerHTML = `
-                  <div class="mb-6 text-center">
-                    <h1 class="text-4xl tech-font-bold text-neon-cyan text-glow mb-2">${title}</h1>
-                    <p class="text-base text-gray-400 tech-font">${description}</p>
-                  </div>
-                  
-                  <div class="flex flex-col items-center gap-6">
-                    <div class="glass rounded-xl border border-dark-border p-8 w-full max-w-md text-center">
-                      <div class="mb-6">
-                        <img src="/static/wechat_mp_qr.jpg" alt="微信公众号二维码" class="w-64 h-64 mx-auto rounded-lg border border-dark-border" onerror="this.style.display='none'">
-                      </div>
-                      <p class="text-gray-300 mb-4">扫描二维码关注我们的微信公众号</p>
-                      <p class="text-sm text-gray-400">获取最新的编程资讯、AI动态和开发工具推荐</p>
-                    </div>
-                    
-                    <div class="glass rounded-xl border border-dark-border p-8 w-full max-w-2xl">
-                      <div class="flex items-center justify-center mb-4">
-                        <svg class="w-8 h-8 mr-3 text-gray-300" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
-                          <path fill-rule="evenodd" d="M12 2C6.477 2 2 6.484 2 12.017c0 4.425 2.865 8.18 6.839 9.504.5.092.682-.217.682-.483 0-.237-.008-.868-.013-1.703-2.782.605-3.369-1.343-3.369-1.343-.454-1.158-1.11-1.466-1.11-1.466-.908-.62.069-.608.069-.608 1.003.07 1.531 1.032 1.531 1.032.892 1.53 2.341 1.088 2.91.832.092-.647.35-1.088.636-1.338-2.22-.253-4.555-1.113-4.555-4.951 0-1.093.39-1.988 1.029-2.688-.103-.253-.446-1.272.098-2.65 0 0 .84-.27 2.75 1.026A9.564 9.564 0 0112 6.844c.85.004 1.705.115 2.504.337 1.909-1.296 2.747-1.027 2.747-1.027.546 1.379.202 2.398.1 2.651.64.7 1.028 1.595 1.028 2.688 0 3.848-2.339 4.695-4.566 4.943.359.309.678.92.678 1.855 0 1.338-.012 2.419-.012 2.747 0 .268.18.58.688.482A10.019 10.019 0 0022 12.017C22 6.484 17.522 2 12 2z" clip-rule="evenodd"></path>
-                        </svg>
-                        <h2 class="text-2xl tech-font-bold text-neon-purple text-glow">开源项目</h2>
-                      </div>
-                      <p class="text-gray-300 mb-4 text-center">这个平台是开源的！欢迎访问我们的 GitHub 仓库</p>
-                      <div class="bg-dark-secondary rounded-lg p-4 mb-4 border border-dark-border">
-                        <div class="text-center">
-                          <a href="https://github.com/yunlongwen/AI-CodeNexus" target="_blank" rel="noopener noreferrer" class="text-neon-cyan hover:text-neon-green transition-colors text-lg font-medium inline-flex items-center justify-center">
-                            <svg class="w-5 h-5 mr-2 flex-shrink-0" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
-                              <path fill-rule="evenodd" d="M12 2C6.477 2 2 6.484 2 12.017c0 4.425 2.865 8.18 6.839 9.504.5.092.682-.217.682-.483 0-.237-.008-.868-.013-1.703-2.782.605-3.369-1.343-3.369-1.343-.454-1.158-1.11-1.466-1.11-1.466-.908-.62.069-.608.069-.608 1.003.07 1.531 1.032 1.531 1.032.892 1.53 2.341 1.088 2.91.832.092-.647.35-1.088.636-1.338-2.22-.253-4.555-1.113-4.555-4.951 0-1.093.39-1.988 1.029-2.688-.103-.253-.446-1.272.098-2.65 0 0 .84-.27 2.75 1.026A9.564 9.564 0 0112 6.844c.85.004 1.705.115 2.504.337 1.909-1.296 2.747-1.027 2.747-1.027.546 1.379.202 2.398.1 2.651.64.7 1.028 1.595 1.028 2.688 0 3.848-2.339 4.695-4.566 4.943.359.309.678.92.678 1.855 0 1.338-.012 2.419-.012 2.747 0 .268.18.58.688.482A10.019 10.019 0 0022 12.017C22 6.484 17.522 2 12 2z" clip-rule="evenodd"></path>
-                            </svg>
-                            <span>yunlongwen/AI-CodeNexus</span>
-                            <svg class="w-4 h-4 ml-2 flex-shrink-0" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M10 6H6a2 2 0 00-2 2v10a2 2 0 002 2h10a2 2 0 002-2v-4M14 4h6m0 0v6m0-6L10 14"></path>
-                            </svg>
-                          </a>
-                          <p class="text-sm text-gray-400 mt-1">编程资讯与工具聚合平台</p>
-                        </div>
-                      </div>
-                      <div class="text-center">
-                        <p class="text-gray-300 mb-3">⭐ 如果这个项目对你有帮助，欢迎给个 Star！</p>
-                        <a href="https://github.com/yunlongwen/AI-CodeNexus" target="_blank" rel="noopener noreferrer" class="inline-flex items-center px-6 py-3 bg-gradient-to-r from-neon-purple to-neon-cyan text-white rounded-lg font-medium hover:from-neon-cyan hover:to-neon-purple transition-all transform hover:scale-105 shadow-lg shadow-neon-purple/50">
-                          <svg class="w-5 h-5 mr-2" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
-                            <path d="M12 .297c-6.63 0-12 5.373-12 12 0 5.303 3.438 9.8 8.205 11.385.6.113.82-.258.82-.577 0-.285-.01-1.04-.015-2.04-3.338.724-4.042-1.61-4.042-1.61C4.422 18.07 3.633 17.7 3.633 17.7c-1.087-.744.084-.729.084-.729 1.205.084 1.838 1.236 1.838 1.236 1.07 1.835 2.809 1.305 3.495.998.108-.776.417-1.305.76-1.605-2.665-.3-5.466-1.332-5.466-5.93 0-1.31.465-2.38 1.235-3.22-.135-.303-.54-1.523.105-3.176 0 0 1.005-.322 3.3 1.23A11.509 11.509 0 0112 5.803c1.02.005 2.047.138 3.006.404 2.29-1.552 3.297-1.23 3.297-1.23.645 1.653.24 2.873.12 3.176.765.84 1.23 1.91 1.23 3.22 0 4.61-2.805 5.625-5.475 5.92.42.36.81 1.096.81 2.22 0 1.606-.015 2.896-.015 3.286 0 .315.21.69.825.57C20.565 22.092 24 17.592 24 12.297c0-6.627-5.373-12-12-12"></path>
-                          </svg>
-                          前往 GitHub 点 Star
-                        </a>
-                      </div>
-                    </div>
-                  </div>
-                `;
+                const page = cloneTemplate('tpl-wechat-mp');
+                page.getElementById('wechat-mp-title').textContent = title;
+                page.getElementById('wechat-mp-description').textContent = description;
+                mainContent.replaceChildren(page);
+                
+                // 页面挂载后再设置 src，二维码请求不阻塞页面切换
+                const qr = document.getElementById('wechat-mp-qr');
+                if (qr) qr.src = qr.dataset.src;
               }
 
               // 加载每周资讯
               async function loadWeekly(weeklyId) {
-                const mainContent = document.getElementById('main-content');
+                const mainContent = $('main-content');
                 if (!mainContent) return;
 
                 mainContent.innerHTML = '<div class="text-center py-20"><div class="inline-block animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-neon-cyan"></div></div>';
 
                 try {
-                  const response = await fetch(`${API_BASE}/weekly/${weeklyId}`);
+                  const response = await safeFetch(`${API_BASE}/weekly/${weeklyId}`, {}, { key: 'weekly' });
                   if (!response.ok) {
                     const errorData = await response.json().catch(() => ({ detail: '加载失败' }));
                     throw new Error(errorData.detail || `HTTP ${response.status}`);
@@ -2541,6 +2716,8 @@ INDEX_HTML = """
                   // 更新导航激活状态
                   setTimeout(updateActiveNav, 100);
                 } catch (error) {
+                  // 已被新的周报请求取代，不再渲染旧结果
+                  if (error.name === 'AbortError') return;
                   console.error('加载每周资讯失败:', error);
                   mainContent.innerHTML = `<div class="text-center py-20 text-red-400">加载失败: ${error.message}</div>`;
                 }
@@ -2548,36 +2725,163 @@ INDEX_HTML = """
               
               // 管理员入口授权码验证
               let adminCodeInput = '';
-              let adminCodeTimeout = null;
               const ADMIN_CODE_MAX_LENGTH = 50; // 最大长度限制
               
+              // 管理员标记缓存在模块变量中，写入时同步更新，其他标签页的修改通过 storage 事件同步
+              let _adminVerified = localStorage.getItem('admin_verified') === 'true';
+              let _adminCode = localStorage.getItem('aicoding_admin_code') || '';
+              
+              function setAdminVerified(verified) {
+                _adminVerified = verified;
+                if (verified) {
+                  localStorage.setItem('admin_verified', 'true');
+                } else {
+                  localStorage.removeItem('admin_verified');
+                }
+              }
+              
+              window.addEventListener('storage', function(e) {
+                if (e.key === 'admin_verified') {
+                  _adminVerified = e.newValue === 'true';
+                } else if (e.key === 'aicoding_admin_code') {
+                  _adminCode = e.newValue || '';
+                } else if (e.key === null) {
+                  // localStorage.clear()
+                  _adminVerified = false;
+                  _adminCode = '';
+                }
+              });
+              
               // 检查是否为管理员
               function isAdmin() {
-                return localStorage.getItem('admin_verified') === 'true';
+                return _adminVerified;
               }
               
               // 获取管理员授权码（从digest面板）
               function getAdminCode() {
-                return localStorage.getItem('aicoding_admin_code') || '';
+                return _adminCode;
               }
               
               // 删除文章函数
-              async function deleteArticle(url, category) {
-                if (!confirm('确定要删除这篇文章吗？删除后将从所有相关数据源（文章池、归档分类、周报）中移除。')) {
+              // 卡片上的删除按钮只负责选中/取消选中，底部操作栏确认一次后把所选文章合并为一次请求删除
+              const _deleteSelection = new Map();  // url -> { url, category, card, trigger }
+              // 与服务端批量删除接口的URL数量上限一致
+              const MAX_DELETE_SELECTION = 50;
+              
+              // trigger 为卡片内的删除按钮，删除成功后直接移除对应卡片
+              function deleteArticle(url, category, trigger) {
+                const selected = !_deleteSelection.has(url);
+                if (selected && _deleteSelection.size >= MAX_DELETE_SELECTION) {
+                  alert(`一次最多删除 ${MAX_DELETE_SELECTION} 篇文章`);
                   return;
                 }
+                const item = selected
+                  ? { url, category, card: trigger ? trigger.closest('article') : null, trigger }
+                  : _deleteSelection.get(url);
+                if (selected) {
+                  _deleteSelection.set(url, item);
+                } else {
+                  _deleteSelection.delete(url);
+                }
+                markDeleteSelected(item, selected);
+                updateDeleteBar();
+              }
+              
+              function markDeleteSelected(item, selected) {
+                if (item.card) {
+                  item.card.classList.toggle('ring-2', selected);
+                  item.card.classList.toggle('ring-red-500', selected);
+                }
+                if (item.trigger) {
+                  item.trigger.textContent = selected ? '已选' : '删除';
+                }
+              }
+              
+              function updateDeleteBar() {
+                let bar = document.getElementById('delete-selection-bar');
+                if (!bar) {
+                  bar = document.createElement('div');
+                  bar.id = 'delete-selection-bar';
+                  bar.className = 'fixed bottom-6 left-1/2 -translate-x-1/2 z-50 glass rounded-xl border border-dark-border px-4 py-3 flex items-center gap-3 hidden';
+                  bar.innerHTML = `
+                    <span id="delete-selection-count" class="text-sm text-gray-200"></span>
+                    <button onclick="confirmDeleteSelection()" class="px-3 py-1 bg-red-600/80 hover:bg-red-600 text-white text-xs rounded transition-colors">删除所选</button>
+                    <button onclick="clearDeleteSelection()" class="px-3 py-1 bg-gray-600/80 hover:bg-gray-600 text-white text-xs rounded transition-colors">取消</button>
+                  `;
+                  document.body.appendChild(bar);
+                }
+                bar.classList.toggle('hidden', _deleteSelection.size === 0);
+                document.getElementById('delete-selection-count').textContent = `已选择 ${_deleteSelection.size} 篇文章`;
+              }
+              
+              function clearDeleteSelection() {
+                _deleteSelection.forEach(item => markDeleteSelected(item, false));
+                _deleteSelection.clear();
+                updateDeleteBar();
+              }
+              
+              function confirmDeleteSelection() {
+                const items = Array.from(_deleteSelection.values());
+                if (items.length === 0) return;
+                const target = items.length === 1 ? '这篇文章' : `所选的 ${items.length} 篇文章`;
+                if (!confirm(`确定要删除${target}吗？删除后将从所有相关数据源（文章池、归档分类、周报）中移除。`)) {
+                  return;
+                }
+                clearDeleteSelection();
+                deleteArticles(items);
+              }
+              
+              let _deleteRefreshScheduled = false;
+              
+              function refreshAfterDelete(items) {
+                // 能找到卡片的直接从页面移除，无需重新请求整页
+                const missing = [];
+                for (let i = 0; i < items.length; i++) {
+                  const card = items[i].card;
+                  if (card && card.isConnected) {
+                    card.remove();
+                  } else {
+                    missing.push(items[i]);
+                  }
+                }
+                if (missing.length === 0 || _deleteRefreshScheduled) return;
+                
+                // 同一帧内的多次刷新只执行一次
+                _deleteRefreshScheduled = true;
+                requestAnimationFrame(() => {
+                  _deleteRefreshScheduled = false;
+                  reloadAfterDelete(missing);
+                });
+              }
+              
+              function reloadAfterDelete(items) {
+                // 所有文章属于同一分类时只重新加载该分类，否则根据当前路由重新加载
+                const category = items[0].category;
+                const sameCategory = items.every(item => item.category === category);
+                if (category && sameCategory) {
+                  loadArticles(category, 1);
+                } else {
+                  handleRoute();
+                }
+              }
+              
+              async function deleteArticles(items) {
+                // 单篇删除仍走原有接口
+                const single = items.length === 1;
+                // 删除API路径是 /digest/delete-article(s)（不使用API_BASE前缀）
+                const endpoint = single ? '/digest/delete-article' : '/digest/delete-articles';
+                const payload = single ? { url: items[0].url } : { urls: items.map(item => item.url) };
                 
                 try {
                   const adminCode = getAdminCode();
-                  // 删除API路径是 /digest/delete-article（不使用API_BASE前缀）
-                  const response = await fetch('/digest/delete-article', {
+                  const response = await safeFetch(endpoint, {
                     method: 'POST',
                     headers: {
                       'Content-Type': 'application/json',
                       'X-Admin-Code': adminCode || ''
                     },
-                    body: JSON.stringify({ url: url })
-                  });
+                    body: JSON.stringify(payload)
+                  }, { key: null });
                   
                   if (response.status === 401 || response.status === 403) {
                     alert('删除失败：需要管理员权限');
@@ -2587,13 +2891,7 @@ INDEX_HTML = """
                   const data = await response.json();
                   if (data.ok) {
                     alert(data.message || '文章已成功删除');
-                    // 重新加载当前页面
-                    if (category) {
-                      loadArticles(category, 1);
-                    } else {
-                      // 根据当前路由重新加载
-                      handleRoute();
-                    }
+                    refreshAfterDelete(items);
                   } else {
                     alert(data.message || '删除失败');
                   }
@@ -2603,32 +2901,84 @@ INDEX_HTML = """
                 }
               }
               
+              // 授权码校验：同一输入只校验一次，新请求发出时取消仍在进行的旧请求
+              const ADMIN_CODE_CACHE_SIZE = 64;
+              const _adminCodeCache = new Map();
+              
+              function markAdminVerified() {
+                // 授权码正确，显示管理员入口
+                const adminEntry = document.getElementById('admin-entry');
+                if (adminEntry) {
+                  adminEntry.classList.remove('hidden');
+                  // 保存到localStorage，避免刷新后需要重新输入
+                  setAdminVerified(true);
+                }
+                // 清空输入并取消尚未触发的校验
+                adminCodeInput = '';
+                _adminDue = 0;
+              }
+              
               async function checkAdminCode(input) {
                 if (input.length < 3) return; // 至少3个字符才开始验证
+                // 已校验过的输入直接使用缓存结果
+                if (_adminCodeCache.has(input)) {
+                  if (_adminCodeCache.get(input)) markAdminVerified();
+                  return;
+                }
                 
                 try {
-                  const response = await fetch(`${API_BASE}/admin/verify-code?code=${encodeURIComponent(input)}`);
+                  const response = await safeFetch(`${API_BASE}/admin/verify-code?code=${encodeURIComponent(input)}`, {}, {
+                    key: 'admin-verify-code'
+                  });
                   const data = await response.json();
+                  const valid = Boolean(data.ok && data.valid);
                   
-                  if (data.ok && data.valid) {
-                    // 授权码正确，显示管理员入口
-                    const adminEntry = document.getElementById('admin-entry');
-                    if (adminEntry) {
-                      adminEntry.style.display = 'block';
-                      adminEntry.classList.remove('hidden');
-                      // 保存到localStorage，避免刷新后需要重新输入
-                      localStorage.setItem('admin_verified', 'true');
+                  // 只缓存服务端给出的结果，按插入顺序淘汰最早的条目
+                  if (data.ok) {
+                    if (_adminCodeCache.size >= ADMIN_CODE_CACHE_SIZE) {
+                      _adminCodeCache.delete(_adminCodeCache.keys().next().value);
                     }
-                    // 清空输入
-                    adminCodeInput = '';
+                    _adminCodeCache.set(input, valid);
+                  }
+                  
+                  if (valid) {
+                    markAdminVerified();
                   }
                 } catch (error) {
+                  if (error.name === 'AbortError') return;
                   console.error('验证授权码失败:', error);
                 }
               }
               
+              // 停止输入 500ms 后再校验：每次按键只推迟截止时间，不重建定时器；
+              // 定时器到点时若截止时间已被推迟，按剩余时间重新设置一次
+              const ADMIN_CHECK_DELAY = 500;
+              let _adminDue = 0;
+              let _adminTimer = null;
+              
+              function scheduleAdminCheck() {
+                _adminDue = performance.now() + ADMIN_CHECK_DELAY;
+                if (_adminTimer) return;
+                const tick = () => {
+                  _adminTimer = null;
+                  // 校验已成功，放弃待执行的检查
+                  if (!_adminDue) return;
+                  const remaining = _adminDue - performance.now();
+                  if (remaining > 0) {
+                    _adminTimer = setTimeout(tick, remaining);
+                    return;
+                  }
+                  _adminDue = 0;
+                  checkAdminCode(adminCodeInput);
+                };
+                _adminTimer = setTimeout(tick, ADMIN_CHECK_DELAY);
+              }
+              
               // 监听键盘输入（盲敲）
               document.addEventListener('keydown', function(e) {
+                // 已验证过的管理员无需再收集输入
+                if (_adminVerified) return;
+                
                 // 排除输入框、文本域等元素
                 if (e.target.tagName === 'INPUT' || e.target.tagName === 'TEXTAREA' || e.target.isContentEditable) {
                   return;
@@ -2643,15 +2993,8 @@ INDEX_HTML = """
                     adminCodeInput = adminCodeInput.slice(-ADMIN_CODE_MAX_LENGTH);
                   }
                   
-                  // 清除之前的定时器
-                  if (adminCodeTimeout) {
-                    clearTimeout(adminCodeTimeout);
-                  }
-                  
                   // 延迟验证，避免频繁请求
-                  adminCodeTimeout = setTimeout(() => {
-                    checkAdminCode(adminCodeInput);
-                  }, 500);
+                  scheduleAdminCheck();
                 } else if (e.key === 'Backspace' || e.key === 'Delete') {
                   // 允许退格删除
                   adminCodeInput = adminCodeInput.slice(0, -1);
@@ -2673,13 +3016,7 @@ INDEX_HTML = """
                 // 同步管理员入口的显示状态
                 function syncAdminEntry() {
                   if (adminEntry && mobileAdminEntry) {
-                    if (adminEntry.style.display !== 'none' && !adminEntry.classList.contains('hidden')) {
-                      mobileAdminEntry.style.display = 'block';
-                      mobileAdminEntry.classList.remove('hidden');
-                    } else {
-                      mobileAdminEntry.style.display = 'none';
-                      mobileAdminEntry.classList.add('hidden');
-                    }
+                    mobileAdminEntry.classList.toggle('hidden', adminEntry.classList.contains('hidden'));
                   }
                 }
                 
@@ -2689,17 +3026,9 @@ INDEX_HTML = """
                   topNavMenu.classList.toggle('open');
                 });
                 
-                // 点击菜单项后关闭菜单
-                const navLinks = topNavMenu.querySelectorAll('.mobile-nav-link');
-                navLinks.forEach(link => {
-                  link.addEventListener('click', function() {
-                    topNavMenu.classList.remove('open');
-                  });
-                });
-                
-                // 点击外部区域关闭菜单
-                document.addEventListener('click', function(e) {
-                  if (!topNavMenu.contains(e.target) && !topNavBtn.contains(e.target)) {
+                // 点击菜单项后关闭菜单（事件委托，动态加载的链接同样生效）
+                topNavMenu.addEventListener('click', function(e) {
+                  if (e.target.closest('.mobile-nav-link')) {
                     topNavMenu.classList.remove('open');
                   }
                 });
@@ -2714,155 +3043,73 @@ INDEX_HTML = """
                 // 初始化时同步管理员入口
                 syncAdminEntry();
                 
-                // 监听管理员入口的变化（使用MutationObserver）
+                // 监听管理员入口的变化（使用MutationObserver，同一帧内的多次变化只同步一次）
                 if (adminEntry) {
-                  const observer = new MutationObserver(syncAdminEntry);
+                  let syncScheduled = false;
+                  const observer = new MutationObserver(function() {
+                    if (syncScheduled) return;
+                    syncScheduled = true;
+                    requestAnimationFrame(function() {
+                      syncScheduled = false;
+                      syncAdminEntry();
+                    });
+                  });
                   observer.observe(adminEntry, {
                     attributes: true,
-                    attributeFilter: ['style', 'class']
+                    attributeFilter: ['class']
                   });
                 }
               }
 
-              // 最新资讯下拉菜单控制
-              function toggleNewsDropdown() {
-                const menu = document.getElementById('news-dropdown-menu');
-                const arrow = document.getElementById('news-dropdown-arrow');
-
-                if (menu.classList.contains('hidden')) {
-                  menu.classList.remove('hidden');
-                  arrow.style.transform = 'rotate(180deg)';
-                } else {
-                  menu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
-                }
-              }
-
-              // 移动端最新资讯子菜单控制
-              function toggleMobileNewsSubmenu() {
-                const submenu = document.getElementById('mobile-news-submenu');
-                const arrow = document.getElementById('mobile-news-arrow');
-
-                if (submenu.classList.contains('open')) {
-                  submenu.classList.remove('open');
-                  submenu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
-                } else {
-                  submenu.classList.remove('hidden');
-                  submenu.classList.add('open');
-                  arrow.style.transform = 'rotate(90deg)';
-                }
-              }
-
-              // 社区资源下拉菜单控制
-              function toggleResourcesDropdown() {
-                const menu = document.getElementById('resources-dropdown-menu');
-                const arrow = document.getElementById('resources-dropdown-arrow');
+              // 桌面端下拉菜单控制（name: news / weekly / resources）
+              function toggleDropdown(name) {
+                const menu = document.getElementById(`${name}-dropdown-menu`);
+                const arrow = document.getElementById(`${name}-dropdown-arrow`);
+                if (!menu || !arrow) return;
 
-                if (menu.classList.contains('hidden')) {
-                  menu.classList.remove('hidden');
-                  arrow.style.transform = 'rotate(180deg)';
-                } else {
-                  menu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
+                const open = !menu.classList.toggle('hidden');
+                arrow.style.transform = open ? 'rotate(180deg)' : 'rotate(0deg)';
+                // 每周资讯菜单内容为空时，尝试重新加载
+                if (open && name === 'weekly' && (!menu.innerHTML || menu.innerHTML.trim() === '<!-- 动态加载的weekly列表 -->')) {
+                  loadWeeklyList();
                 }
               }
 
-              // 每周资讯下拉菜单控制
-              function toggleWeeklyDropdown() {
-                const menu = document.getElementById('weekly-dropdown-menu');
-                const arrow = document.getElementById('weekly-dropdown-arrow');
-
-                if (!menu || !arrow) {
-                  console.error('每周资讯下拉菜单元素未找到');
-                  return;
-                }
+              // 移动端子菜单控制（name: news / weekly / resources / claude-code）
+              function toggleMobileSubmenu(name) {
+                const submenu = document.getElementById(`mobile-${name}-submenu`);
+                const arrow = document.getElementById(`mobile-${name}-arrow`);
 
-                if (menu.classList.contains('hidden')) {
-                  menu.classList.remove('hidden');
-                  arrow.style.transform = 'rotate(180deg)';
-                  // 如果菜单内容为空，尝试重新加载
-                  if (!menu.innerHTML || menu.innerHTML.trim() === '<!-- 动态加载的weekly列表 -->') {
-                    loadWeeklyList();
-                  }
-                } else {
-                  menu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
-                }
+                const open = submenu.classList.toggle('open');
+                submenu.classList.toggle('hidden', !open);
+                arrow.style.transform = open ? 'rotate(90deg)' : 'rotate(0deg)';
               }
 
-              // 移动端社区资源子菜单控制
-              function toggleMobileResourcesSubmenu() {
-                const submenu = document.getElementById('mobile-resources-submenu');
-                const arrow = document.getElementById('mobile-resources-arrow');
-
-                if (submenu.classList.contains('open')) {
-                  submenu.classList.remove('open');
-                  submenu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
-                } else {
-                  submenu.classList.remove('hidden');
-                  submenu.classList.add('open');
-                  arrow.style.transform = 'rotate(90deg)';
-                }
+              // 点击外部区域关闭菜单：所有下拉菜单与移动端顶部导航共用一个 document 级监听
+              function closeDropdown(name) {
+                const menu = document.querySelector(`[data-dropdown-menu="${name}"]`);
+                if (menu) menu.classList.add('hidden');
+                const arrow = document.getElementById(`${name}-dropdown-arrow`);
+                if (arrow) arrow.style.transform = 'rotate(0deg)';
               }
               
-              function toggleMobileClaudeCodeSubmenu() {
-                const submenu = document.getElementById('mobile-claude-code-submenu');
-                const arrow = document.getElementById('mobile-claude-code-arrow');
-
-                if (submenu.classList.contains('open')) {
-                  submenu.classList.remove('open');
-                  submenu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
-                } else {
-                  submenu.classList.remove('hidden');
-                  submenu.classList.add('open');
-                  arrow.style.transform = 'rotate(90deg)';
-                }
-              }
-
-              // 移动端每周资讯子菜单控制
-              function toggleMobileWeeklySubmenu() {
-                const submenu = document.getElementById('mobile-weekly-submenu');
-                const arrow = document.getElementById('mobile-weekly-arrow');
-
-                if (submenu.classList.contains('open')) {
-                  submenu.classList.remove('open');
-                  submenu.classList.add('hidden');
-                  arrow.style.transform = 'rotate(0deg)';
-                } else {
-                  submenu.classList.remove('hidden');
-                  submenu.classList.add('open');
-                  arrow.style.transform = 'rotate(90deg)';
-                }
-              }
-
-              // 点击外部区域关闭下拉菜单
               document.addEventListener('click', function(e) {
-                const newsDropdown = document.getElementById('news-dropdown-menu');
-                const newsBtn = document.querySelector('[onclick="toggleNewsDropdown()"]');
-                const resourcesDropdown = document.getElementById('resources-dropdown-menu');
-                const resourcesBtn = document.querySelector('[onclick="toggleResourcesDropdown()"]');
-                const weeklyDropdown = document.getElementById('weekly-dropdown-menu');
-                const weeklyBtn = document.querySelector('[onclick="toggleWeeklyDropdown()"]');
-
-                if (newsDropdown && !newsDropdown.contains(e.target) && !newsBtn.contains(e.target)) {
-                  newsDropdown.classList.add('hidden');
-                  const arrow = document.getElementById('news-dropdown-arrow');
-                  if (arrow) arrow.style.transform = 'rotate(0deg)';
-                }
-
-                if (resourcesDropdown && !resourcesDropdown.contains(e.target) && !resourcesBtn.contains(e.target)) {
-                  resourcesDropdown.classList.add('hidden');
-                  const arrow = document.getElementById('resources-dropdown-arrow');
-                  if (arrow) arrow.style.transform = 'rotate(0deg)';
+                const btn = e.target.closest('[data-dropdown]');
+                const clicked = btn ? btn.dataset.dropdown : null;
+                const menus = document.querySelectorAll('[data-dropdown-menu]');
+                for (let i = 0, n = menus.length; i < n; i++) {
+                  const menu = menus[i];
+                  const name = menu.dataset.dropdownMenu;
+                  if (name !== clicked && !menu.classList.contains('hidden') && !menu.contains(e.target)) {
+                    closeDropdown(name);
+                  }
                 }
-
-                if (weeklyDropdown && !weeklyDropdown.contains(e.target) && !weeklyBtn.contains(e.target)) {
-                  weeklyDropdown.classList.add('hidden');
-                  const arrow = document.getElementById('weekly-dropdown-arrow');
-                  if (arrow) arrow.style.transform = 'rotate(0deg)';
+                
+                const topNavMenu = document.getElementById('mobile-top-nav-menu');
+                const topNavBtn = document.getElementById('mobile-top-nav-btn');
+                if (topNavMenu && topNavMenu.classList.contains('open') &&
+                    !topNavMenu.contains(e.target) && !(topNavBtn && topNavBtn.contains(e.target))) {
+                  topNavMenu.classList.remove('open');
                 }
               });
 
@@ -2910,14 +3157,11 @@ INDEX_HTML = """
                 // 点击遮罩层关闭菜单
                 overlay.addEventListener('click', closeMenu);
                 
-                // 点击侧边栏内的链接后关闭菜单（移动端）
-                const sidebarLinks = sidebar.querySelectorAll('a');
-                sidebarLinks.forEach(link => {
-                  link.addEventListener('click', function() {
-                    if (window.innerWidth <= 768) {
-                      closeMenu();
-                    }
-                  });
+                // 点击侧边栏内的链接后关闭菜单（移动端，事件委托）
+                sidebar.addEventListener('click', function(e) {
+                  if (e.target.closest('a') && window.innerWidth <= 768) {
+                    closeMenu();
+                  }
                 });
                 
                 // 窗口大小改变时，如果是桌面端则关闭菜单
@@ -2935,53 +3179,138 @@ INDEX_HTML = """
                 });
               }
               
+              // 每周资讯下拉菜单：条目超过阈值时只渲染可视区域内的条目（虚拟列表）
+              const WEEKLY_VIRTUAL_THRESHOLD = 30;
+              const WEEKLY_ITEM_HEIGHT = 48;      // px-5 py-3 + text-base 行高
+              const WEEKLY_VIEWPORT_HEIGHT = 384; // max-h-96
+              const WEEKLY_OVERSCAN = 4;
+              const weeklyVirtual = { items: [], start: -1, end: -1, ticking: false, bound: false };
+              
+              function createWeeklyLink(item, fixedHeight) {
+                const link = document.createElement('a');
+                link.href = `/weekly/${item.id}`;
+                link.className = 'block px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan transition-all';
+                if (fixedHeight) {
+                  link.classList.add('truncate');
+                  link.style.height = `${WEEKLY_ITEM_HEIGHT}px`;
+                }
+                link.textContent = `📅 ${item.name}`;
+                return link;
+              }
+              
+              function renderWeeklyMenu(menu, items) {
+                weeklyVirtual.items = items;
+                weeklyVirtual.start = -1;
+                weeklyVirtual.end = -1;
+                
+                if (items.length <= WEEKLY_VIRTUAL_THRESHOLD) {
+                  menu.classList.remove('max-h-96', 'overflow-auto');
+                  const frag = document.createDocumentFragment();
+                  for (let i = 0, n = items.length; i < n; i++) {
+                    frag.appendChild(createWeeklyLink(items[i], false));
+                  }
+                  menu.replaceChildren(frag);
+                  return;
+                }
+                
+                menu.classList.add('max-h-96', 'overflow-auto');
+                const topSpacer = document.createElement('div');
+                topSpacer.id = 'weekly-virtual-top';
+                const windowEl = document.createElement('div');
+                windowEl.id = 'weekly-virtual-window';
+                const bottomSpacer = document.createElement('div');
+                bottomSpacer.id = 'weekly-virtual-bottom';
+                menu.replaceChildren(topSpacer, windowEl, bottomSpacer);
+                menu.scrollTop = 0;
+                
+                if (!weeklyVirtual.bound) {
+                  weeklyVirtual.bound = true;
+                  menu.addEventListener('scroll', function() {
+                    if (weeklyVirtual.ticking) return;
+                    weeklyVirtual.ticking = true;
+                    requestAnimationFrame(function() {
+                      weeklyVirtual.ticking = false;
+                      renderWeeklyWindow(menu);
+                    });
+                  }, { passive: true });
+                }
+                renderWeeklyWindow(menu);
+              }
+              
+              function renderWeeklyWindow(menu) {
+                const items = weeklyVirtual.items;
+                const n = items.length;
+                const windowEl = document.getElementById('weekly-virtual-window');
+                if (!windowEl || n <= WEEKLY_VIRTUAL_THRESHOLD) return;
+                
+                const viewport = menu.clientHeight || WEEKLY_VIEWPORT_HEIGHT;
+                const scrollTop = menu.scrollTop;
+                const start = Math.max(0, Math.floor(scrollTop / WEEKLY_ITEM_HEIGHT) - WEEKLY_OVERSCAN);
+                const end = Math.min(n, Math.ceil((scrollTop + viewport) / WEEKLY_ITEM_HEIGHT) + WEEKLY_OVERSCAN);
+                if (start === weeklyVirtual.start && end === weeklyVirtual.end) return;
+                weeklyVirtual.start = start;
+                weeklyVirtual.end = end;
+                
+                document.getElementById('weekly-virtual-top').style.height = `${start * WEEKLY_ITEM_HEIGHT}px`;
+                document.getElementById('weekly-virtual-bottom').style.height = `${(n - end) * WEEKLY_ITEM_HEIGHT}px`;
+                const frag = document.createDocumentFragment();
+                for (let i = start; i < end; i++) {
+                  frag.appendChild(createWeeklyLink(items[i], true));
+                }
+                windowEl.replaceChildren(frag);
+              }
+              
               // 加载每周资讯列表
+              // 用单个节点替换菜单内容，显示“暂无/加载失败”等提示
+              function setWeeklyMenuMessage(weeklyMenu, mobileWeeklySubmenu, text, colorClass) {
+                if (weeklyMenu) {
+                  weeklyMenu.classList.remove('max-h-96', 'overflow-auto');
+                  const msg = document.createElement('div');
+                  msg.className = `px-5 py-3 text-sm ${colorClass}`;
+                  msg.textContent = text;
+                  weeklyMenu.replaceChildren(msg);
+                }
+                if (mobileWeeklySubmenu) {
+                  const mobileMsg = document.createElement('div');
+                  mobileMsg.className = `mobile-nav-link ${colorClass}`;
+                  mobileMsg.textContent = text;
+                  mobileWeeklySubmenu.replaceChildren(mobileMsg);
+                }
+              }
+              
               async function loadWeeklyList() {
+                const weeklyMenu = $('weekly-dropdown-menu');
+                const mobileWeeklySubmenu = $('mobile-weekly-submenu');
                 try {
-                  const response = await fetch(`${API_BASE}/weekly`);
+                  const response = await safeFetch(`${API_BASE}/weekly`);
                   if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                   }
                   const data = await response.json();
+                  const items = data.items || [];
                   
-                  const weeklyMenu = document.getElementById('weekly-dropdown-menu');
-                  const mobileWeeklySubmenu = document.getElementById('mobile-weekly-submenu');
-                  
-                  if (weeklyMenu) {
-                    if (data.items && data.items.length > 0) {
-                      let html = '';
-                      data.items.forEach((item) => {
-                        html += `<a href="/weekly/${item.id}" class="block px-5 py-3 text-base tech-font-nav text-gray-300 hover:text-neon-cyan transition-all">
-                          📅 ${item.name}
-                        </a>`;
-                      });
-                      weeklyMenu.innerHTML = html;
-                    } else {
-                      weeklyMenu.innerHTML = '<div class="px-5 py-3 text-sm text-gray-400">暂无每周资讯</div>';
-                    }
-                  }
-                  
-                  if (mobileWeeklySubmenu) {
-                    if (data.items && data.items.length > 0) {
-                      let html = '';
-                      data.items.forEach(item => {
-                        html += `<a href="/weekly/${item.id}" class="mobile-nav-link">📅 ${item.name}</a>`;
-                      });
-                      mobileWeeklySubmenu.innerHTML = html;
-                    } else {
-                      mobileWeeklySubmenu.innerHTML = '<div class="mobile-nav-link text-gray-400">暂无每周资讯</div>';
+                  if (items.length > 0) {
+                    if (weeklyMenu) renderWeeklyMenu(weeklyMenu, items);
+                    
+                    // 在 DocumentFragment 中一次性构建菜单项，避免 HTML 字符串拼接与重复解析
+                    if (mobileWeeklySubmenu) {
+                      const mobileFrag = document.createDocumentFragment();
+                      for (let i = 0, n = items.length; i < n; i++) {
+                        const mobileLink = document.createElement('a');
+                        mobileLink.href = `/weekly/${items[i].id}`;
+                        mobileLink.className = 'mobile-nav-link';
+                        mobileLink.textContent = `📅 ${items[i].name}`;
+                        mobileFrag.appendChild(mobileLink);
+                      }
+                      mobileWeeklySubmenu.replaceChildren(mobileFrag);
                     }
+                  } else {
+                    setWeeklyMenuMessage(weeklyMenu, mobileWeeklySubmenu, '暂无每周资讯', 'text-gray-400');
                   }
                 } catch (error) {
+                  if (error.name === 'AbortError') return;
                   console.error('加载每周资讯列表失败:', error);
-                  const weeklyMenu = document.getElementById('weekly-dropdown-menu');
-                  const mobileWeeklySubmenu = document.getElementById('mobile-weekly-submenu');
-                  if (weeklyMenu) {
-                    weeklyMenu.innerHTML = '<div class="px-5 py-3 text-sm text-red-400">加载失败</div>';
-                  }
-                  if (mobileWeeklySubmenu) {
-                    mobileWeeklySubmenu.innerHTML = '<div class="mobile-nav-link text-red-400">加载失败</div>';
-                  }
+                  setWeeklyMenuMessage(weeklyMenu, mobileWeeklySubmenu, '加载失败', 'text-red-400');
                 }
               }
 
@@ -3000,10 +3329,9 @@ INDEX_HTML = """
                 await loadWeeklyList();
                 
                 // 检查是否已经验证过（从localStorage）
-                if (localStorage.getItem('admin_verified') === 'true') {
+                if (isAdmin()) {
                   const adminEntry = document.getElementById('admin-entry');
                   if (adminEntry) {
-                    adminEntry.style.display = 'block';
                     adminEntry.classList.remove('hidden');
                   }
                 }
@@ -3017,37 +3345,24 @@ INDEX_HTML = """
                   setTimeout(updateActiveNav, 100);
                 });
                 
-                // 点击导航项
-                const topNavItems = document.querySelectorAll('.top-nav-item');
-                topNavItems.forEach(item => {
-                  item.addEventListener('click', function(e) {
-                    const href = this.getAttribute('href');
-                    // 如果链接是外部链接（如管理员入口），直接跳转
-                    if (href.startsWith('http') || href.startsWith('/digest')) {
-                      return; // 允许默认行为，直接跳转
-                    }
-                    e.preventDefault();
-                    // 使用 history API 更新 URL
-                    window.history.pushState({}, '', href);
-                    handleRoute();
-                    setTimeout(updateActiveNav, 100);
-                  });
-                });
-                
-                // 左侧分类点击
-                document.querySelectorAll('.nav-item').forEach(item => {
-                  item.addEventListener('click', function(e) {
-                    const href = this.getAttribute('href');
-                    // 如果是外部链接，直接跳转
-                    if (href.startsWith('http') || href.startsWith('/digest')) {
-                      return;
-                    }
-                    e.preventDefault();
-                    // 使用 history API 更新 URL
-                    window.history.pushState({}, '', href);
-                    handleRoute();
+                // 顶部导航与左侧分类点击：document 级事件委托，动态添加的导航项同样生效
+                document.addEventListener('click', function(e) {
+                  const item = e.target.closest('.top-nav-item, .nav-item');
+                  if (!item) return;
+                  const href = item.getAttribute('href');
+                  // 下拉菜单按钮没有 href；外部链接（如管理员入口）直接跳转
+                  if (!href || href.startsWith('http') || href.startsWith('/digest')) {
+                    return;
+                  }
+                  e.preventDefault();
+                  // 使用 history API 更新 URL
+                  window.history.pushState({}, '', href);
+                  handleRoute();
+                  if (item.classList.contains('nav-item')) {
                     updateActiveNav();
-                  });
+                  } else {
+                    setTimeout(updateActiveNav, 100);
+                  }
                 });
                 
                 // 初始加载
@@ -3082,16 +3397,28 @@ INDEX_HTML = """
             // 回到顶部按钮功能
             const scrollTopBtn = document.getElementById('scroll-top-btn');
             if (scrollTopBtn) {
-              // 监听滚动，显示/隐藏按钮
+              // 显示/隐藏两种状态的完整 class，切换时一次赋值；基础 class 取自按钮标记，去掉三个状态 class
+              const SCROLL_TOP_STATE_CLASSES = ['opacity-0', 'opacity-100', 'pointer-events-none'];
+              const SCROLL_TOP_BASE_CLASS = scrollTopBtn.className.split(/\\s+/)
+                .filter(cls => cls && !SCROLL_TOP_STATE_CLASSES.includes(cls))
+                .join(' ');
+              const SCROLL_TOP_SHOW_CLASS = `${SCROLL_TOP_BASE_CLASS} opacity-100`;
+              const SCROLL_TOP_HIDE_CLASS = `${SCROLL_TOP_BASE_CLASS} opacity-0 pointer-events-none`;
+              
+              // 监听滚动，显示/隐藏按钮（每帧最多处理一次，仅在状态变化时写 DOM）
+              let scrollTicking = false;
+              let scrollTopShown = false;
               window.addEventListener('scroll', function() {
-                if (window.pageYOffset > 300) {
-                  scrollTopBtn.classList.remove('opacity-0', 'pointer-events-none');
-                  scrollTopBtn.classList.add('opacity-100');
-                } else {
-                  scrollTopBtn.classList.add('opacity-0', 'pointer-events-none');
-                  scrollTopBtn.classList.remove('opacity-100');
-                }
-              });
+                if (scrollTicking) return;
+                scrollTicking = true;
+                requestAnimationFrame(function() {
+                  scrollTicking = false;
+                  const shouldShow = window.pageYOffset > 300;
+                  if (shouldShow === scrollTopShown) return;
+                  scrollTopShown = shouldShow;
+                  scrollTopBtn.className = shouldShow ? SCROLL_TOP_SHOW_CLASS : SCROLL_TOP_HIDE_CLASS;
+                });
+              }, { passive: true });
               
               // 点击回到顶部
               scrollTopBtn.addEventListener('click', function() {
@@ -3106,6 +3433,20 @@ INDEX_HTML = """
         </html>
         """
 
+# 首页内容不变，模块加载时编码并压缩一次，每个请求直接返回字节
+INDEX_HTML_BYTES = INDEX_HTML.encode('utf-8')
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML_BYTES, compresslevel=9)
+
+
 def get_index_html() -> str:
     """获取首页HTML"""
     return INDEX_HTML
+
+
+def get_index_response(accept_encoding: Optional[str] = None) -> Response:
+    """获取首页响应，客户端支持 gzip 时返回预压缩的内容"""
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=INDEX_HTML_GZIP, media_type="text/html; charset=utf-8", headers=headers)
+    return Response(content=INDEX_HTML_BYTES, media_type="text/html; charset=utf-8", headers=headers)
@@ -2,7 +2,8 @@
 
 import asyncio
 from datetime import datetime
-from typing import List, Dict
+from operator import attrgetter
+from typing import Any, Iterable, List, Dict
 
 from loguru import logger
 
@@ -18,6 +19,15 @@ from ..domain.sources.ai_articles import (
 from ..domain.sources.ai_candidates import promote_candidates_to_articles, clear_candidate_pool
 from .crawler_service import CrawlerService
 
+# 推送条目输出的字段，一次 attrgetter 调用取出全部字段
+_DIGEST_ITEM_KEYS = ("title", "url", "source", "summary")
+_get_digest_item_fields = attrgetter(*_DIGEST_ITEM_KEYS)
+
+
+def digest_items(articles: Iterable[Any]) -> List[Dict[str, str]]:
+    """将文章对象转换为日报条目字典（title、url、source、summary），定时推送与手动推送共用"""
+    return [dict(zip(_DIGEST_ITEM_KEYS, _get_digest_item_fields(a))) for a in articles]
+
 
 class DigestService:
     """推送服务"""
@@ -80,15 +90,7 @@ class DigestService:
                 logger.info(f"[定时推送] 准备推送 {len(articles)} 篇文章")
                 theme = todays_theme(now)
                 date_str = now.strftime("%Y-%m-%d")
-                items = [
-                    {
-                        "title": a.title,
-                        "url": a.url,
-                        "source": a.source,
-                        "summary": a.summary,
-                    }
-                    for a in articles
-                ]
+                items = digest_items(articles)
 
                 content = build_wecom_digest_markdown(date_str=date_str, theme=theme, items=items)
                 logger.info("[定时推送] 正在发送到企业微信群...")
@@ -0,0 +1,28 @@
+"""AI助手 Markdown 转微信公众号 HTML 测试"""
+from app.presentation.routes.ai_assistant import markdown_to_wechat_html
+
+_P_STYLE = '<p style="line-height: 1.8;'
+
+
+class TestMarkdownToWeChatHtml:
+    """markdown_to_wechat_html 测试类"""
+
+    def test_raw_html_blocks_are_styled(self):
+        """测试原始 HTML 块中的段落、链接和外部图片也加上内联样式"""
+        html = markdown_to_wechat_html(
+            '<p>原始段落</p>\n\n'
+            '<div><p>嵌套段落</p><a href="https://example.com">链接</a><img src="https://example.com/a.png"></div>'
+        )
+
+        assert html.count(_P_STYLE) == 2
+        assert '<a href="https://example.com" style="color: #576b95;' in html
+        assert '<img src="https://example.com/a.png" style="max-width: 100%;' in html
+
+    def test_fenced_code_is_not_restyled(self):
+        """测试围栏代码块只加代码块样式，代码中的标签文本不被当作 HTML 加样式"""
+        html = markdown_to_wechat_html('```html\n<p>代码</p>\n```\n\n正文 **加粗**')
+
+        assert '<pre style="background-color: #f5f5f5;' in html
+        assert '<code class="language-html" style="color: #333;' in html
+        assert html.count(_P_STYLE) == 1
+        assert '<strong style="font-weight: bold;' in html
@@ -0,0 +1,47 @@
+"""候选池测试"""
+import dataclasses
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.sources import ai_candidates
+from app.domain.sources.ai_candidates import CandidateArticle
+
+
+class TestCandidatePool:
+    """候选池读写测试类"""
+
+    @pytest.fixture
+    def pool_file(self, tmp_path):
+        """把候选池指向临时文件"""
+        path = tmp_path / "ai_candidates.json"
+        with patch.object(ai_candidates, "_candidate_data_path", return_value=path):
+            yield path
+
+    def test_candidate_pool_has_items(self, pool_file):
+        """测试按文件大小判断候选池是否为空"""
+        assert ai_candidates.candidate_pool_has_items() is False
+
+        ai_candidates.save_candidate_pool([])
+        assert ai_candidates.candidate_pool_has_items() is False
+
+        ai_candidates.save_candidate_pool([
+            CandidateArticle(title="标题", url="https://example.com/a", source="来源", summary="摘要"),
+        ])
+        assert ai_candidates.candidate_pool_has_items() is True
+
+    def test_serialized_keys_match_dataclass_fields(self, pool_file):
+        """测试 __dict__ 浅拷贝序列化出的字段与 CandidateArticle 的字段定义一致"""
+        field_names = {field.name for field in dataclasses.fields(CandidateArticle)}
+        candidate = CandidateArticle(
+            title="标题", url="https://example.com/a", source="来源", summary="摘要", crawled_from="sogou_wechat:AI"
+        )
+
+        assert set(candidate.__dict__.copy()) == field_names
+        assert candidate.__dict__.copy() == dataclasses.asdict(candidate)
+
+        ai_candidates.save_candidate_pool([candidate])
+        saved = json.loads(pool_file.read_text(encoding="utf-8"))
+        assert [set(item) for item in saved] == [field_names]
+        assert ai_candidates.load_candidate_pool() == [candidate]
@@ -0,0 +1,125 @@
+"""文章池写入队列测试"""
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from app.domain.sources import ai_articles
+from app.presentation.routes import digest
+
+
+def _article(i):
+    return {"title": f"文章{i}", "url": f"https://example.com/article{i}", "source": "来源", "summary": "摘要"}
+
+
+class TestArticleWriteQueue:
+    """文章池增删合并写入测试类"""
+
+    @pytest.fixture
+    def pool_file(self, tmp_path, monkeypatch):
+        """把文章池指向临时文件；每个用例在新的事件循环中运行，写锁也换成新的"""
+        monkeypatch.setattr(digest, "_article_write_lock", asyncio.Lock())
+        monkeypatch.setattr(digest, "_article_write_queue", [])
+        path = tmp_path / "ai_articles.json"
+        path.write_text("[]", encoding="utf-8")
+        with patch.object(ai_articles, "_articles_path", return_value=path):
+            yield path
+
+    def _pool_urls(self, path):
+        return {item["url"] for item in json.loads(path.read_text(encoding="utf-8"))}
+
+    def test_single_and_batch_changes_do_not_lose_updates(self, pool_file):
+        """测试单篇增删与批量增删并发提交时，所有修改都写入文章池"""
+        async def run():
+            return await asyncio.gather(
+                digest._queue_article_change("add", _article(1)),
+                digest._queue_article_changes([("add", _article(i)) for i in range(2, 6)]),
+                digest._queue_article_change("add", _article(6)),
+                digest._queue_article_changes([("add", _article(1)), ("delete", "https://example.com/article6")]),
+            )
+
+        single, batch, other, mixed = asyncio.run(run())
+
+        assert single is True
+        assert batch == [True] * 4
+        assert other is True
+        # 同一批中文章1已存在，文章6被删除
+        assert mixed == [False, True]
+        assert self._pool_urls(pool_file) == {f"https://example.com/article{i}" for i in range(1, 6)}
+
+    def test_cancelled_lock_holder_does_not_hang_batch(self, pool_file):
+        """测试持锁请求在写入期间被取消时，同批的其他请求仍能拿到结果"""
+        original = ai_articles.apply_article_changes
+
+        def slow_apply(changes):
+            time.sleep(0.2)
+            return original(changes)
+
+        async def run():
+            holder = asyncio.create_task(digest._queue_article_change("add", _article(1)))
+            await asyncio.sleep(0)
+            other = asyncio.create_task(digest._queue_article_change("add", _article(2)))
+            # 等待合并窗口结束、线程开始写入后取消持锁的请求
+            await asyncio.sleep(digest._ARTICLE_WRITE_WINDOW + 0.05)
+            holder.cancel()
+            result = await asyncio.wait_for(other, timeout=2)
+            # 锁随写入结束释放，后续请求可以继续写入
+            later = await asyncio.wait_for(digest._queue_article_change("add", _article(3)), timeout=2)
+            return holder.cancelled(), result, later
+
+        with patch.object(digest, "apply_article_changes", slow_apply):
+            holder_cancelled, result, later = asyncio.run(run())
+
+        assert holder_cancelled
+        assert result is True
+        assert later is True
+        assert self._pool_urls(pool_file) == {f"https://example.com/article{i}" for i in range(1, 4)}
+
+
+class TestApplyArticleChanges:
+    """文章池批量增删测试类"""
+
+    @pytest.fixture
+    def pool_file(self, tmp_path):
+        """把文章池指向临时文件"""
+        path = tmp_path / "ai_articles.json"
+        path.write_text(json.dumps([_article(1)], ensure_ascii=False), encoding="utf-8")
+        with patch.object(ai_articles, "_articles_path", return_value=path):
+            yield path
+
+    def test_changes_apply_in_order(self, pool_file):
+        """测试按顺序执行增删，每个操作的结果一一对应"""
+        results = ai_articles.apply_article_changes([
+            ("add", _article(2)),
+            ("add", _article(1)),
+            ("delete", "https://example.com/article1"),
+            ("delete", "https://example.com/missing"),
+            ("move", "https://example.com/article2"),
+        ])
+
+        assert results == [True, False, True, False, False]
+        assert [a["url"] for a in ai_articles.get_all_articles()] == ["https://example.com/article2"]
+
+    def test_unchanged_content_is_not_rewritten(self, pool_file):
+        """测试同一URL先加后删、内容不变时不写文件"""
+        # 先按文章池自身的格式写入，保证比较的是内容而不是格式差异
+        pool_file.write_bytes(orjson.dumps([_article(1)], option=orjson.OPT_INDENT_2))
+        before = pool_file.stat().st_mtime_ns
+
+        results = ai_articles.apply_article_changes([
+            ("add", _article(2)),
+            ("delete", "https://example.com/article2"),
+        ])
+
+        assert results == [True, True]
+        assert pool_file.stat().st_mtime_ns == before
+
+    def test_corrupted_file_is_left_untouched(self, pool_file):
+        """测试文件损坏时整批失败，不覆盖原文件"""
+        pool_file.write_text("{not json", encoding="utf-8")
+
+        assert ai_articles.apply_article_changes([("add", _article(2))]) == [False]
+        assert pool_file.read_text(encoding="utf-8") == "{not json"
@@ -0,0 +1,230 @@
+"""管理面板接口测试：批量增删、ETag 协商、预压缩页面、首屏数据与请求体大小限制"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.sources import ai_articles, ai_candidates
+from app.main import app
+from app.presentation.routes import digest
+
+
+def _article(i):
+    return {"title": f"文章{i}", "url": f"https://example.com/article{i}", "source": "来源", "summary": "摘要"}
+
+
+class TestDigestRoutes:
+    """管理面板接口测试类"""
+
+    @pytest.fixture
+    def client(self):
+        """创建测试客户端"""
+        return TestClient(app)
+
+    @pytest.fixture
+    def pools(self, tmp_path, monkeypatch):
+        """文章池与候选池指向临时文件，关闭授权校验，隔离数据库与周报"""
+        monkeypatch.setattr(digest, "_ADMIN_CODE_BYTES", None)
+        # TestClient 每个请求使用新的事件循环，写锁也换成新的
+        monkeypatch.setattr(digest, "_article_write_lock", asyncio.Lock())
+        monkeypatch.setattr(digest, "_candidate_pool_lock", asyncio.Lock())
+        monkeypatch.setattr(digest, "_article_write_queue", [])
+        monkeypatch.setattr(digest.DatabaseDataService, "is_article_archived", AsyncMock(return_value=False))
+        monkeypatch.setattr(digest.DatabaseWriteService, "delete_article_from_all_categories", AsyncMock(return_value={}))
+        monkeypatch.setattr(digest, "delete_article_from_weekly", lambda url: False)
+        monkeypatch.setattr(digest, "update_weekly_digest", AsyncMock())
+
+        articles_path = tmp_path / "ai_articles.json"
+        articles_path.write_text(json.dumps([_article(1), _article(2)], ensure_ascii=False), encoding="utf-8")
+        candidates_path = tmp_path / "ai_candidates.json"
+        candidates_path.write_text(json.dumps([
+            {"title": "候选", "url": "https://example.com/c1", "source": "来源", "summary": "摘要",
+             "crawled_from": "sogou_wechat:AI"},
+        ], ensure_ascii=False), encoding="utf-8")
+        with patch.object(ai_articles, "_articles_path", return_value=articles_path), \
+                patch.object(ai_candidates, "_candidate_data_path", return_value=candidates_path):
+            yield articles_path
+
+    def _pool_urls(self, path):
+        return [item["url"] for item in json.loads(path.read_text(encoding="utf-8"))]
+
+    def test_add_articles(self, client, pools):
+        """测试批量添加：已存在的不爬取，爬取成功的写入文章池，已存在和爬取失败的分别报告"""
+        fetched_urls = []
+
+        async def fake_fetch(url, limiter=None):
+            fetched_urls.append(url)
+            if url.endswith("broken"):
+                raise RuntimeError("timeout")
+            return {"title": "新文章", "url": url, "source": "来源", "summary": "摘要"}
+
+        with patch.object(digest, "_fetch_article_info_throttled", fake_fetch):
+            response = client.post("/digest/add-articles", json={"urls": [
+                "https://example.com/article3",
+                "https://example.com/article1",
+                "https://example.com/broken",
+                "https://example.com/article3",
+            ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ok"] is True
+        assert [(r["url"], r["ok"]) for r in data["results"]] == [
+            ("https://example.com/article3", True),
+            ("https://example.com/article1", False),
+            ("https://example.com/broken", False),
+        ]
+        assert data["results"][1]["message"] == "文章已存在"
+        assert sorted(fetched_urls) == ["https://example.com/article3", "https://example.com/broken"]
+        assert self._pool_urls(pools) == [
+            "https://example.com/article1",
+            "https://example.com/article2",
+            "https://example.com/article3",
+        ]
+
+    def test_delete_articles(self, client, pools):
+        """测试批量删除：一次请求删除多篇文章，并只重新生成一次周报"""
+        response = client.post("/digest/delete-articles", json={"urls": [
+            "https://example.com/article1",
+            "https://example.com/missing",
+        ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ok"] is True
+        assert data["results"]["https://example.com/article1"]["from_pool"] is True
+        assert data["results"]["https://example.com/missing"]["from_pool"] is False
+        assert self._pool_urls(pools) == ["https://example.com/article2"]
+        digest.update_weekly_digest.assert_awaited_once()
+
+    def test_batch_endpoints_reject_empty_list(self, client, pools):
+        """测试批量接口拒绝空URL列表，空白URL由请求模型校验"""
+        assert client.post("/digest/add-articles", json={"urls": []}).status_code == 400
+        assert client.post("/digest/delete-articles", json={"urls": []}).status_code == 400
+        assert client.post("/digest/add-articles", json={"urls": ["  "]}).status_code == 422
+
+    def test_batch_endpoints_validate_request(self, client, pools):
+        """测试批量接口拒绝超过数量上限的URL列表和多余字段"""
+        urls = [f"https://example.com/article{i}" for i in range(digest._MAX_BATCH_URLS + 1)]
+
+        assert client.post("/digest/add-articles", json={"urls": urls}).status_code == 422
+        assert client.post("/digest/delete-articles", json={"urls": urls}).status_code == 422
+        assert client.post("/digest/delete-articles", json={"urls": urls[:1], "force": True}).status_code == 422
+        assert self._pool_urls(pools) == ["https://example.com/article1", "https://example.com/article2"]
+
+    def test_articles_etag_304(self, client, pools):
+        """测试文章列表带 ETag，内容未变化时返回 304，变化后返回新内容"""
+        first = client.get("/digest/articles")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        cached = client.get("/digest/articles", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+        client.post("/digest/delete-articles", json={"urls": ["https://example.com/article2"]})
+        changed = client.get("/digest/articles", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert [a["url"] for a in changed.json()["articles"]] == ["https://example.com/article1"]
+
+    def test_candidates_etag_304(self, client, pools):
+        """测试候选池列表的 304 协商"""
+        first = client.get("/digest/candidates")
+        assert first.status_code == 200
+        assert list(first.json()["grouped_candidates"]) == ["AI"]
+
+        cached = client.get("/digest/candidates", headers={"If-None-Match": first.headers["ETag"]})
+        assert cached.status_code == 304
+
+    def test_panel_etag_per_encoding(self, client):
+        """测试管理面板的压缩与未压缩响应使用不同的 ETag，并分别协商 304；gzip;q=0 返回未压缩内容"""
+        gzipped = client.get("/digest/panel", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/digest/panel", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+        assert gzipped.headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in identity.headers
+        assert gzipped.content == identity.content
+        assert gzipped.headers["ETag"] != identity.headers["ETag"]
+
+        cached = client.get("/digest/panel", headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["ETag"]})
+        assert cached.status_code == 304
+        assert "Content-Encoding" not in cached.headers
+        # 压缩版本的 ETag 不能用来协商未压缩的响应
+        mismatched = client.get(
+            "/digest/panel", headers={"Accept-Encoding": "identity", "If-None-Match": gzipped.headers["ETag"]}
+        )
+        assert mismatched.status_code == 200
+
+    def test_index_respects_gzip_q0(self, client):
+        """测试首页在客户端拒绝 gzip 时返回未压缩内容"""
+        assert client.get("/", headers={"Accept-Encoding": "gzip"}).headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in client.get("/", headers={"Accept-Encoding": "gzip;q=0"}).headers
+
+    def test_bootstrap(self, client, pools):
+        """测试首屏接口同时返回文章池、预览和候选池"""
+        response = client.get("/digest/bootstrap")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ok"] is True
+        assert [a["url"] for a in data["articles"]] == ["https://example.com/article1", "https://example.com/article2"]
+        assert all(a["is_archived"] is False for a in data["articles"])
+        assert {a["url"] for a in data["preview"]["articles"]} <= {a["url"] for a in data["articles"]}
+        assert [c["url"] for c in data["grouped_candidates"]["AI"]] == ["https://example.com/c1"]
+
+    def test_body_size_limit(self, client, pools):
+        """测试单篇增删接口的请求体超过上限时返回 413，不进入路由"""
+        oversized = json.dumps({"url": "https://example.com/" + "a" * 10000})
+
+        response = client.post("/digest/add-article", content=oversized, headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+
+        # 分块传输（无 Content-Length）时按累计字节数拦截
+        def chunks():
+            yield oversized[:5000].encode()
+            yield oversized[5000:].encode()
+
+        response = client.post("/digest/delete-article", content=chunks(), headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+        assert self._pool_urls(pools) == ["https://example.com/article1", "https://example.com/article2"]
+
+    def test_batch_body_size_limit(self, client, pools):
+        """测试批量增删接口按满额URL列表放行，超出上限的请求体返回 413"""
+        full = json.dumps({"urls": [f"https://example.com/{i}/" + "a" * 4000 for i in range(digest._MAX_BATCH_URLS)]})
+        response = client.post("/digest/delete-articles", content=full, headers={"Content-Type": "application/json"})
+        assert response.status_code == 200
+
+        oversized = json.dumps({"urls": ["https://example.com/" + "a" * 300000]})
+        response = client.post("/digest/add-articles", content=oversized, headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+
+
+class TestFetchThrottle:
+    """按域名限速爬取测试类"""
+
+    def test_idle_hosts_are_pruned(self, monkeypatch):
+        """测试空闲超过限速间隔的域名在下次爬取时被清理，正在爬取的域名保留"""
+        monkeypatch.setattr(digest, "_host_locks", {})
+        monkeypatch.setattr(digest, "_host_last_fetch", {})
+        monkeypatch.setattr(digest, "_FETCH_MIN_INTERVAL", 0.05)
+
+        async def fake_fetch(url):
+            return {"url": url}
+
+        async def run():
+            await digest._fetch_article_info_throttled("https://a.example.com/1")
+            await digest._fetch_article_info_throttled("https://b.example.com/1")
+            # 刚爬取过的域名还在限速间隔内，不能清理
+            assert set(digest._host_locks) == {"a.example.com", "b.example.com"}
+            await asyncio.sleep(0.06)
+            await digest._fetch_article_info_throttled("https://c.example.com/1")
+
+        with patch.object(digest, "fetch_article_info", fake_fetch):
+            asyncio.run(run())
+
+        assert set(digest._host_locks) == {"c.example.com"}
+        assert set(digest._host_last_fetch) == {"c.example.com"}
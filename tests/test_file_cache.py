@@ -0,0 +1,62 @@
+"""按文件修改时间缓存的测试"""
+import os
+
+from app.infrastructure.file_cache import mtime_cached
+
+
+class TestMtimeCached:
+    """mtime_cached 装饰器测试类"""
+
+    def _cached_reader(self, path, ttl=30.0):
+        calls = []
+
+        @mtime_cached(lambda: path, ttl=ttl)
+        def read():
+            calls.append(1)
+            return path.read_text(encoding="utf-8") if path.exists() else None
+
+        return read, calls
+
+    def test_reuses_result_until_file_changes(self, tmp_path):
+        """测试文件未变化时复用结果，修改时间或大小变化后重新加载"""
+        path = tmp_path / "config.json"
+        path.write_text("a", encoding="utf-8")
+        read, calls = self._cached_reader(path)
+
+        assert read() == "a"
+        assert read() == "a"
+        assert len(calls) == 1
+
+        path.write_text("bb", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert read() == "bb"
+        assert len(calls) == 2
+
+    def test_cache_clear_and_ttl(self, tmp_path):
+        """测试 cache_clear() 与 ttl 到期都会重新加载"""
+        path = tmp_path / "config.json"
+        path.write_text("a", encoding="utf-8")
+        read, calls = self._cached_reader(path)
+
+        read()
+        read.cache_clear()
+        read()
+        assert len(calls) == 2
+
+        expiring, expiring_calls = self._cached_reader(path, ttl=0)
+        expiring()
+        expiring()
+        assert len(expiring_calls) == 2
+
+    def test_missing_file_is_not_cached(self, tmp_path):
+        """测试文件不存在时每次都调用原函数，文件出现后立即读到内容"""
+        path = tmp_path / "missing.json"
+        read, calls = self._cached_reader(path)
+
+        assert read() is None
+        assert read() is None
+        assert len(calls) == 2
+
+        path.write_text("a", encoding="utf-8")
+        assert read() == "a"
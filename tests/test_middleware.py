@@ -0,0 +1,44 @@
+"""中间件测试"""
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+class TestGZipMiddleware:
+    """应用级 gzip 压缩测试类"""
+
+    def _get_weekly(self, accept_encoding):
+        articles = {
+            "ai": [
+                {"title": f"AI 文章{i}", "url": f"https://example.com/ai/{i}", "summary": "摘要" * 50, "source": "来源"}
+                for i in range(50)
+            ],
+            "programming": [],
+        }
+        client = TestClient(app)
+        with patch("app.presentation.routes.api._parse_weekly", return_value=("第 1 周", "2025-01-01 ~ 2025-01-07", articles)):
+            return client.get("/api/weekly/2025weekly01", headers={"Accept-Encoding": accept_encoding})
+
+    def test_weekly_json_is_compressed(self):
+        """测试每周资讯的 JSON 接口按 gzip 压缩返回"""
+        response = self._get_weekly("gzip")
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["content"].startswith("<h1")
+
+    def test_gzip_q0_is_not_compressed(self):
+        """测试客户端以 gzip;q=0 拒绝压缩时原样返回"""
+        response = self._get_weekly("gzip;q=0, identity")
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert response.json()["content"].startswith("<h1")
+
+    def test_missing_weekly_returns_404(self):
+        """测试不存在的周报直接返回 404"""
+        response = TestClient(app).get("/api/weekly/1999weekly01")
+
+        assert response.status_code == 404